@@ -0,0 +1,165 @@
+# encoding: UTF-8
+
+'''
+各接口的generate_data_type.py共用的紧凑版本数据类型文件生成函数。
+
+generate_data_type.py先根据C++头文件生成xxx_data_type.py，再调用process_compact
+生成vn.trader中接口直接使用的紧凑版本，LazyDataTypeDict的模板只在本文件中维护。
+'''
+
+
+# 紧凑版本数据类型文件的模板，供vn.trader中的接口直接使用
+# 常量以"键\t值"逐行保存在一个字符串中，导入时只需载入该字符串，
+# 访问某个键时才进行查找并缓存结果
+compact_template = """# encoding: UTF-8
+
+'''
+本文件由generate_data_type.py根据%(source)s自动生成，请勿手动修改。
+
+所有常量保存在紧凑的字符串中，导入时不再逐条创建字典条目，
+只有在访问时才查找并缓存，defineDict和typedefDict的用法和原先的字典一致。
+'''
+
+__all__ = ['defineDict', 'typedefDict']
+
+
+########################################################################
+class LazyDataTypeDict(object):
+    \"\"\"按需加载的常量字典\"\"\"
+
+    #----------------------------------------------------------------------
+    def __init__(self, data):
+        \"\"\"Constructor\"\"\"
+        self.data = data        # 紧凑数据，每行格式为：键\\t值
+        self.cache = {}         # 已经解析过的键值
+        self.loaded = False     # 是否已经全部解析
+
+    #----------------------------------------------------------------------
+    def __getitem__(self, key):
+        \"\"\"查询常量\"\"\"
+        try:
+            return self.cache[key]
+        except KeyError:
+            if self.loaded:
+                raise
+
+        token = '\\n%%s\\t' %%key
+        i = self.data.find(token)
+        if i == -1:
+            raise KeyError(key)
+
+        i += len(token)
+        value = self.data[i:self.data.index('\\n', i)]
+        self.cache[key] = value
+        return value
+
+    #----------------------------------------------------------------------
+    def __setitem__(self, key, value):
+        \"\"\"设置常量（缓存中的值优先于紧凑数据）\"\"\"
+        self.cache[key] = value
+
+    #----------------------------------------------------------------------
+    def __delitem__(self, key):
+        \"\"\"删除常量\"\"\"
+        self.load()
+        del self.cache[key]
+
+    #----------------------------------------------------------------------
+    def __contains__(self, key):
+        \"\"\"检查常量是否存在\"\"\"
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    has_key = __contains__
+
+    #----------------------------------------------------------------------
+    def get(self, key, default=None):
+        \"\"\"查询常量，不存在则返回默认值\"\"\"
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    #----------------------------------------------------------------------
+    def load(self):
+        \"\"\"解析全部紧凑数据，用于遍历等需要完整字典的操作\"\"\"
+        if self.loaded:
+            return
+
+        for line in self.data.split('\\n'):
+            if line:
+                key, value = line.split('\\t')
+                self.cache.setdefault(key, value)
+
+        self.data = ''
+        self.loaded = True
+
+    #----------------------------------------------------------------------
+    def __iter__(self):
+        self.load()
+        return iter(self.cache)
+
+    #----------------------------------------------------------------------
+    def __len__(self):
+        self.load()
+        return len(self.cache)
+
+    #----------------------------------------------------------------------
+    def __repr__(self):
+        self.load()
+        return repr(self.cache)
+
+    #----------------------------------------------------------------------
+    def keys(self):
+        self.load()
+        return self.cache.keys()
+
+    #----------------------------------------------------------------------
+    def values(self):
+        self.load()
+        return self.cache.values()
+
+    #----------------------------------------------------------------------
+    def items(self):
+        self.load()
+        return self.cache.items()
+
+    #----------------------------------------------------------------------
+    def iteritems(self):
+        self.load()
+        return self.cache.iteritems()
+
+
+defineDict = LazyDataTypeDict('''
+%(define)s
+''')
+
+typedefDict = LazyDataTypeDict('''
+%(typedef)s
+''')
+"""
+
+
+def process_compact(source, filename):
+    """根据生成的data_type文件，生成紧凑版本的数据类型文件"""
+    d = {}
+    execfile(source, d)
+
+    content = {'source': source}
+    for name in ['defineDict', 'typedefDict']:
+        lines = []
+        for key, value in sorted(d[name].items()):
+            line = '%s\t%s' %(key, value)
+            # 紧凑数据以换行和制表符分隔，且保存在三引号字符串中
+            if '\n' in value or '\\' in line or "'''" in line or line.count('\t') != 1:
+                raise ValueError(u'无法压缩的常量：%s' %key)
+            lines.append(line)
+        content[name.replace('Dict', '')] = '\n'.join(lines)
+
+    f = open(filename, 'w')
+    f.write(compact_template %content)
+    f.close()
+
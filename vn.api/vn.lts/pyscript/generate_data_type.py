@@ -2,6 +2,13 @@
 
 __author__ = 'CHENXY'
 
+import os
+import sys
+
+# 紧凑版本数据类型文件的生成函数由各接口共用，保存在vn.api目录下
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from compact_data_type import process_compact
+
 # C++和python类型的映射字典
 type_dict = {
     'int': 'int',
@@ -88,6 +95,9 @@ def main():
         fcpp.close()
         fpy.close()
 
+        # 生成vn.trader接口使用的紧凑版本
+        process_compact('lts_data_type.py', 'ltsDataType.py')
+
         print u'data_type.py生成过程完成'
     except:
         print u'data_type.py生成过程出错'
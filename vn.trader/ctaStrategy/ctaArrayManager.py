@@ -0,0 +1,384 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了策略中缓存K线数据和计算指标的ArrayManager。
+
+1. K线数据保存在环形缓冲区中，底层数组长度为缓冲区大小的两倍，每个数据同时写入两个位置，
+   这样任意时刻最近size个数据都是底层数组中连续的一段，可以直接作为numpy数组的视图使用，
+   更新时不需要像之前策略中那样整体移动数组
+2. 常用指标（SMA、EMA、ATR、RSI、布林带、肯特纳通道）采用增量计算，每根K线的计算量为O(1)，
+   计算规则和talib一致（EMA以SMA为初始值，ATR和RSI使用Wilder平滑）
+3. 指标在第一次查询时创建，先用缓冲区中已有的数据回放计算，之后随K线更新，
+   因此第一次查询的结果和对缓冲区数据调用talib相同，之后指标基于完整的历史数据连续计算
+'''
+
+from collections import OrderedDict
+from math import sqrt
+
+import numpy as np
+
+
+########################################################################
+class RingBuffer(object):
+    """环形缓冲区"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, size):
+        """Constructor"""
+        self.size = size
+        self.data = np.zeros(size * 2)      # 底层数组，每个数据保存两份
+        self.index = 0                      # 下一个数据写入的位置
+        self.count = 0                      # 已经写入的数据数量
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """写入新的数据"""
+        self.data[self.index] = value
+        self.data[self.index + self.size] = value
+
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+        self.count += 1
+
+    #----------------------------------------------------------------------
+    def getArray(self):
+        """获取最近size个数据的数组视图，按时间从早到晚排列，数据不足时前面补0"""
+        return self.data[self.index:self.index + self.size]
+
+    #----------------------------------------------------------------------
+    def getOldest(self):
+        """获取缓冲区中最早的数据，即下一次写入时会被覆盖的数据"""
+        return self.data[self.index]
+
+    #----------------------------------------------------------------------
+    def getLast(self):
+        """获取最新的数据"""
+        return self.data[self.index + self.size - 1]
+
+
+########################################################################
+class Indicator(object):
+    """增量计算的指标，默认使用收盘价计算"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, n):
+        """Constructor"""
+        self.n = n
+        self.count = 0              # 已经输入的数据数量
+        self.inited = False         # 数据是否足够计算指标
+        self.value = 0              # 最新的指标数值
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """输入新的数据，返回最新的指标数值"""
+        raise NotImplementedError
+
+    #----------------------------------------------------------------------
+    def updateBar(self, high, low, close):
+        """输入新的K线价格，返回最新的指标数值"""
+        return self.update(close)
+
+
+########################################################################
+class SmaIndicator(Indicator):
+    """简单移动平均"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, n):
+        """Constructor"""
+        super(SmaIndicator, self).__init__(n)
+        self.buffer = RingBuffer(n)
+        self.total = 0.0
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """输入新的数据"""
+        buffer = self.buffer
+        if self.count >= self.n:
+            self.total -= buffer.getOldest()
+
+        buffer.update(value)
+        self.total += value
+        self.count += 1
+
+        # 每滚动一圈重新求和一次，消除累加的浮点误差
+        if buffer.index == 0:
+            self.total = buffer.data[:self.n].sum()
+
+        if self.count >= self.n:
+            self.value = self.total / self.n
+            self.inited = True
+        return self.value
+
+
+########################################################################
+class EmaIndicator(Indicator):
+    """指数移动平均，以前n个数据的简单平均为初始值"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, n):
+        """Constructor"""
+        super(EmaIndicator, self).__init__(n)
+        self.alpha = 2.0 / (n + 1)
+        self.total = 0.0
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """输入新的数据"""
+        self.count += 1
+
+        if self.count < self.n:
+            self.total += value
+        elif self.count == self.n:
+            self.total += value
+            self.value = self.total / self.n
+            self.inited = True
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+########################################################################
+class AtrIndicator(Indicator):
+    """平均真实波幅，第一根K线没有前收盘价，不计算真实波幅"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, n):
+        """Constructor"""
+        super(AtrIndicator, self).__init__(n)
+        self.preClose = None
+        self.total = 0.0
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """ATR需要最高价和最低价，只能通过updateBar输入"""
+        raise NotImplementedError
+
+    #----------------------------------------------------------------------
+    def updateBar(self, high, low, close):
+        """输入新的K线价格"""
+        preClose = self.preClose
+        self.preClose = close
+        if preClose is None:
+            return self.value
+
+        tr = max(high - low, abs(high - preClose), abs(low - preClose))
+        self.count += 1
+
+        if self.count < self.n:
+            self.total += tr
+        elif self.count == self.n:
+            self.total += tr
+            self.value = self.total / self.n
+            self.inited = True
+        else:
+            self.value = (self.value * (self.n - 1) + tr) / self.n
+        return self.value
+
+
+########################################################################
+class RsiIndicator(Indicator):
+    """相对强弱指数"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, n):
+        """Constructor"""
+        super(RsiIndicator, self).__init__(n)
+        self.preValue = None
+        self.avgGain = 0.0          # 平均涨幅
+        self.avgLoss = 0.0          # 平均跌幅
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """输入新的数据"""
+        preValue = self.preValue
+        self.preValue = value
+        if preValue is None:
+            return self.value
+
+        diff = value - preValue
+        gain = max(diff, 0)
+        loss = max(-diff, 0)
+        self.count += 1
+
+        if self.count <= self.n:
+            self.avgGain += gain
+            self.avgLoss += loss
+            if self.count < self.n:
+                return self.value
+
+            self.avgGain /= self.n
+            self.avgLoss /= self.n
+            self.inited = True
+        else:
+            self.avgGain = (self.avgGain * (self.n - 1) + gain) / self.n
+            self.avgLoss = (self.avgLoss * (self.n - 1) + loss) / self.n
+
+        total = self.avgGain + self.avgLoss
+        if total:
+            self.value = 100 * self.avgGain / total
+        else:
+            self.value = 0
+        return self.value
+
+
+########################################################################
+class BollIndicator(Indicator):
+    """布林带，中轨为简单移动平均，上下轨为中轨加减dev倍的总体标准差
+    标准差用减去偏移量shift之后的数据计算，shift接近窗口平均值，避免价格较大时相减损失精度"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, n, dev):
+        """Constructor"""
+        super(BollIndicator, self).__init__(n)
+        self.dev = dev
+        self.buffer = RingBuffer(n)
+        self.total = 0.0
+        self.shift = 0.0            # 计算标准差的偏移量
+        self.shiftTotal = 0.0       # 数据减去shift之后的和
+        self.squareTotal = 0.0      # 数据减去shift之后的平方和
+
+        self.mid = 0                # 中轨
+        self.std = 0                # 标准差
+        self.up = 0                 # 上轨
+        self.down = 0               # 下轨
+
+    #----------------------------------------------------------------------
+    def update(self, value):
+        """输入新的数据，返回中轨"""
+        buffer = self.buffer
+        if self.count >= self.n:
+            oldest = buffer.getOldest()
+            self.total -= oldest
+            self.shiftTotal -= oldest - self.shift
+            self.squareTotal -= (oldest - self.shift) ** 2
+        elif not self.count:
+            self.shift = value
+
+        buffer.update(value)
+        self.total += value
+        self.shiftTotal += value - self.shift
+        self.squareTotal += (value - self.shift) ** 2
+        self.count += 1
+
+        # 每滚动一圈重新求和一次，消除累加的浮点误差，同时把shift移到当前的平均值
+        if buffer.index == 0:
+            data = buffer.data[:self.n]
+            self.total = data.sum()
+            self.shift = self.total / self.n
+            self.shiftTotal = (data - self.shift).sum()
+            self.squareTotal = ((data - self.shift) ** 2).sum()
+
+        if self.count >= self.n:
+            mid = self.total / self.n
+            shiftMean = self.shiftTotal / self.n
+            variance = self.squareTotal / self.n - shiftMean * shiftMean
+
+            self.mid = mid
+            self.std = sqrt(max(variance, 0))
+            self.up = mid + self.std * self.dev
+            self.down = mid - self.std * self.dev
+            self.value = mid
+            self.inited = True
+        return self.value
+
+
+########################################################################
+class ArrayManager(object):
+    """K线数据和指标管理"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, size=100):
+        """Constructor"""
+        self.size = size
+        self.count = 0                  # 已经更新的K线数量
+        self.inited = False             # 缓存的K线是否已满
+
+        self.openBuffer = RingBuffer(size)
+        self.highBuffer = RingBuffer(size)
+        self.lowBuffer = RingBuffer(size)
+        self.closeBuffer = RingBuffer(size)
+        self.volumeBuffer = RingBuffer(size)
+
+        # 最近size根K线的数组视图，按时间从早到晚排列，只读
+        self.openArray = self.openBuffer.getArray()
+        self.highArray = self.highBuffer.getArray()
+        self.lowArray = self.lowBuffer.getArray()
+        self.closeArray = self.closeBuffer.getArray()
+        self.volumeArray = self.volumeBuffer.getArray()
+
+        # key为(指标名称, 参数)，value为指标对象
+        self.indicatorDict = OrderedDict()
+
+    #----------------------------------------------------------------------
+    def updateBar(self, bar):
+        """更新K线"""
+        self.count += 1
+        if not self.inited and self.count >= self.size:
+            self.inited = True
+
+        self.openBuffer.update(bar.open)
+        self.highBuffer.update(bar.high)
+        self.lowBuffer.update(bar.low)
+        self.closeBuffer.update(bar.close)
+        self.volumeBuffer.update(bar.volume)
+
+        self.openArray = self.openBuffer.getArray()
+        self.highArray = self.highBuffer.getArray()
+        self.lowArray = self.lowBuffer.getArray()
+        self.closeArray = self.closeBuffer.getArray()
+        self.volumeArray = self.volumeBuffer.getArray()
+
+        for indicator in self.indicatorDict.values():
+            indicator.updateBar(bar.high, bar.low, bar.close)
+
+    #----------------------------------------------------------------------
+    def getIndicator(self, key, indicatorClass, *args):
+        """获取指标对象，不存在则创建，并用缓冲区中已有的K线回放计算"""
+        indicator = self.indicatorDict.get(key, None)
+        if not indicator:
+            indicator = indicatorClass(*args)
+
+            n = min(self.count, self.size)
+            if n:
+                for high, low, close in zip(self.highArray[-n:],
+                                            self.lowArray[-n:],
+                                            self.closeArray[-n:]):
+                    indicator.updateBar(high, low, close)
+
+            self.indicatorDict[key] = indicator
+        return indicator
+
+    #----------------------------------------------------------------------
+    def sma(self, n):
+        """简单移动平均"""
+        return self.getIndicator(('sma', n), SmaIndicator, n).value
+
+    #----------------------------------------------------------------------
+    def ema(self, n):
+        """指数移动平均"""
+        return self.getIndicator(('ema', n), EmaIndicator, n).value
+
+    #----------------------------------------------------------------------
+    def atr(self, n):
+        """平均真实波幅"""
+        return self.getIndicator(('atr', n), AtrIndicator, n).value
+
+    #----------------------------------------------------------------------
+    def rsi(self, n):
+        """相对强弱指数"""
+        return self.getIndicator(('rsi', n), RsiIndicator, n).value
+
+    #----------------------------------------------------------------------
+    def boll(self, n, dev):
+        """布林带，返回(中轨, 上轨, 下轨)"""
+        indicator = self.getIndicator(('boll', n, dev), BollIndicator, n, dev)
+        return indicator.mid, indicator.up, indicator.down
+
+    #----------------------------------------------------------------------
+    def keltner(self, n, dev):
+        """肯特纳通道，中轨为收盘价的简单移动平均，上下轨为中轨加减dev倍的ATR，返回(中轨, 上轨, 下轨)"""
+        mid = self.sma(n)
+        atr = self.atr(n)
+        return mid, mid + atr * dev, mid - atr * dev
@@ -10,12 +10,18 @@ from datetime import datetime, timedelta
 from collections import OrderedDict
 from itertools import product
 import multiprocessing
+import os
 import pymongo
 
 from ctaBase import *
 from vtConstant import *
 from vtGateway import VtOrderData, VtTradeData
-from vtFunction import loadMongoSetting
+from vtFunction import loadMongoSetting, loadDataStoreSetting
+from vtDataStore import VtDataStore
+from vtTickBucket import TickBucketCursor
+from ctaBarGenerator import BarGenerator
+from vtContinuous import (ContinuousBuilder, MongoBarSource, StoreBarSource,
+                          isContinuousSymbol, getProduct, ADJUST_RAW)
 
 
 ########################################################################
@@ -46,6 +52,7 @@ class BacktestingEngine(object):
         
         # 回测相关
         self.strategy = None        # 回测策略
+        self.barGenerator = None    # K线合成器，策略订阅了引擎K线时使用
         self.mode = self.BAR_MODE   # 回测模式，默认为K线
         
         self.startDate = ''
@@ -59,6 +66,9 @@ class BacktestingEngine(object):
         
         self.dbClient = None        # 数据库客户端
         self.dbCursor = None        # 数据库指针
+        self.dataStore = None       # 本地列式存储，使用时dbCursor为数据视图
+        self.continuousBuilder = None       # 连续合约生成器，使用时dbCursor为数据视图
+        self.continuousAdjust = ADJUST_RAW  # 连续合约的复权方式
         
         #self.historyData = []       # 历史数据的列表，回测用
         self.initData = []          # 初始化用的数据
@@ -116,9 +126,29 @@ class BacktestingEngine(object):
         self.dbName = dbName
         self.symbol = symbol
     
+    #----------------------------------------------------------------------
+    def setContinuousAdjust(self, adjust):
+        """设置连续合约（如IF0000）的复权方式"""
+        self.continuousAdjust = adjust
+    
     #----------------------------------------------------------------------
     def loadHistoryData(self):
         """载入历史数据"""
+        # K线模式下的连续合约优先根据具体合约的数据生成，
+        # Tick模式下读取行情记录时按DR_setting.json中active配置保存的主力合约Tick
+        if self.mode == self.BAR_MODE and isContinuousSymbol(self.symbol):
+            if self.loadContinuousData():
+                return
+        
+        # 本地存储中有回测数据时优先使用
+        storeType, storePath = loadDataStoreSetting()
+        if storeType == 'local':
+            dataStore = VtDataStore(storePath)
+            if dataStore.hasCollection(self.dbName, self.symbol):
+                self.dataStore = dataStore
+                self.loadStoreData()
+                return
+        
         host, port, logging = loadMongoSetting()
         
         self.dbClient = pymongo.MongoClient(host, port)
@@ -137,7 +167,7 @@ class BacktestingEngine(object):
         # 载入初始化需要用的数据
         flt = {'datetime':{'$gte':self.dataStartDate,
                            '$lt':self.strategyStartDate}}        
-        initCursor = collection.find(flt)
+        initCursor = self.findData(collection, flt)
         
         # 将数据从查询指针中读取出，并生成列表
         self.initData = []              # 清空initData列表
@@ -152,10 +182,70 @@ class BacktestingEngine(object):
         else:
             flt = {'datetime':{'$gte':self.strategyStartDate,
                                '$lte':self.dataEndDate}}  
-        self.dbCursor = collection.find(flt)
+        self.dbCursor = self.findData(collection, flt)
         
         self.output(u'载入完成，数据量：%s' %(initCursor.count() + self.dbCursor.count()))
         
+    #----------------------------------------------------------------------
+    def loadContinuousData(self):
+        """根据具体合约的数据生成连续合约，没有具体合约的数据时返回False"""
+        storeType, storePath = loadDataStoreSetting()
+        if storeType == 'local':
+            source = StoreBarSource(VtDataStore(storePath), self.dbName)
+        else:
+            host, port, logging = loadMongoSetting()
+            self.dbClient = pymongo.MongoClient(host, port)
+            source = MongoBarSource(self.dbClient, self.dbName)
+        
+        # 生成结果缓存在本地存储目录下，参数优化时各进程可以直接读取
+        builder = ContinuousBuilder(source, os.path.join(storePath, 'continuous'))
+        product = getProduct(self.symbol)
+        if not source.listContracts(product):
+            return False
+        
+        self.output(u'开始生成连续合约数据')
+        
+        self.initData = list(builder.loadData(product, self.dataStartDate, self.strategyStartDate,
+                                              self.continuousAdjust, CtaBarData, includeEnd=False))
+        self.dbCursor = builder.loadData(product, self.strategyStartDate, self.dataEndDate,
+                                         self.continuousAdjust, CtaBarData)
+        self.continuousBuilder = builder
+        
+        for date, symbol in builder.rollSchedule:
+            self.output(u'换月：%s %s' %(date, symbol))
+        self.output(u'载入完成，数据量：%s' %(len(self.initData) + len(self.dbCursor)))
+        return True
+        
+    #----------------------------------------------------------------------
+    def findData(self, collection, flt):
+        """查询数据库，Tick模式下同时兼容按分钟分桶保存的数据"""
+        if self.mode == self.BAR_MODE:
+            return collection.find(flt)
+        else:
+            return TickBucketCursor(collection, flt)
+        
+    #----------------------------------------------------------------------
+    def loadStoreData(self):
+        """从本地列式存储载入历史数据"""
+        self.output(u'开始从本地存储载入数据')
+        
+        if self.mode == self.BAR_MODE:
+            dataClass = CtaBarData
+        else:
+            dataClass = CtaTickData
+        
+        # 初始化数据不包含策略启动时间点
+        self.initData = list(self.dataStore.loadData(self.dbName, self.symbol, 
+                                                     self.dataStartDate, self.strategyStartDate, 
+                                                     dataClass, includeEnd=False))
+        
+        # 回测数据在回放时才逐条生成
+        self.dbCursor = self.dataStore.loadData(self.dbName, self.symbol, 
+                                                self.strategyStartDate, self.dataEndDate,
+                                                dataClass)
+        
+        self.output(u'载入完成，数据量：%s' %(len(self.initData) + len(self.dbCursor)))
+        
     #----------------------------------------------------------------------
     def runBacktesting(self):
         """运行回测"""
@@ -182,10 +272,15 @@ class BacktestingEngine(object):
         
         self.output(u'开始回放数据')
 
-        for d in self.dbCursor:
-            data = dataClass()
-            data.__dict__ = d
-            func(data)     
+        # 本地存储和连续合约的数据视图直接生成数据对象
+        if self.dataStore or self.continuousBuilder:
+            for data in self.dbCursor:
+                func(data)
+        else:
+            for d in self.dbCursor:
+                data = dataClass()
+                data.__dict__ = d
+                func(data)     
             
         self.output(u'数据回放结束')
         
@@ -196,7 +291,12 @@ class BacktestingEngine(object):
         self.dt = bar.datetime
         self.crossLimitOrder()      # 先撮合限价单
         self.crossStopOrder()       # 再撮合停止单
-        self.strategy.onBar(bar)    # 推送K线到策略中
+        
+        # 推送K线到策略中，订阅了引擎K线的策略通过合成器推送
+        if self.barGenerator:
+            self.barGenerator.updateBar(bar)
+        else:
+            self.strategy.onBar(bar)
     
     #----------------------------------------------------------------------
     def newTick(self, tick):
@@ -205,6 +305,10 @@ class BacktestingEngine(object):
         self.dt = tick.datetime
         self.crossLimitOrder()
         self.crossStopOrder()
+        
+        # 和实盘引擎一致，先合成K线再推送Tick
+        if self.barGenerator:
+            self.barGenerator.updateTick(tick)
         self.strategy.onTick(tick)
         
     #----------------------------------------------------------------------
@@ -213,9 +317,31 @@ class BacktestingEngine(object):
         初始化策略
         setting是策略的参数设置，如果使用类中写好的默认设置则可以不传该参数
         """
+        self.barGenerator = None
         self.strategy = strategyClass(self, setting)
         self.strategy.name = self.strategy.className
         
+    #----------------------------------------------------------------------
+    def subscribeBar(self, strategy, interval, funcName):
+        """订阅合成的K线，和实盘引擎一致"""
+        if not self.barGenerator:
+            self.barGenerator = BarGenerator()
+        
+        def handler(xbar, bar):
+            strategy.__getattribute__(funcName)(xbar)
+            strategy.lastBarDatetime = bar.datetime
+        
+        self.barGenerator.addHandler(interval, strategy, handler)
+    
+    #----------------------------------------------------------------------
+    def replayBar(self, strategy, barList):
+        """用历史K线回放初始化策略，和实盘引擎一致"""
+        if self.barGenerator:
+            self.barGenerator.replay(strategy, barList)
+        else:
+            for bar in barList:
+                strategy.onBar(bar)
+        
     #----------------------------------------------------------------------
     def sendOrder(self, vtSymbol, orderType, price, volume, strategy):
         """发单"""
@@ -260,6 +386,12 @@ class BacktestingEngine(object):
             order.cancelTime = str(self.dt)
             del self.workingLimitOrderDict[vtOrderID]
         
+    #----------------------------------------------------------------------
+    def cancelOrders(self, vtOrderIDList):
+        """批量撤单"""
+        for vtOrderID in vtOrderIDList:
+            self.cancelOrder(vtOrderID)
+        
     #----------------------------------------------------------------------
     def sendStopOrder(self, vtSymbol, orderType, price, volume, strategy):
         """发停止单（本地实现）"""
@@ -0,0 +1,163 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了由引擎统一合成K线的BarGenerator，实盘引擎和回测引擎共用。
+
+1. 每个合约一个BarGenerator，Tick合成1分钟K线，1分钟K线再合成N分钟K线，
+   同一合约上的所有策略共享合成结果，K线对象由多个策略共享，策略中不要修改
+2. 1分钟K线的规则：分钟变化时结束上一根K线，K线时间为第一个Tick的时间
+3. N分钟K线的规则：分钟数能被N整除的1分钟K线结束当前N分钟K线，
+   和之前策略中各自实现的K线合成逻辑保持一致
+4. 策略初始化时的历史数据回放（replay）只推送给该策略，回放结束后未完成的N分钟K线
+   保留到共享的合成器中，使之后推送的K线和连续运行时一致
+'''
+
+from collections import OrderedDict
+
+from ctaBase import CtaBarData, EMPTY_STRING
+
+
+########################################################################
+class BarGenerator(object):
+    """K线合成器"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.bar = None                     # 正在合成的1分钟K线
+        self.barMinute = EMPTY_STRING       # 当前K线的分钟
+        self.lastBar = None                 # 最近一根结束的1分钟K线
+
+        self.xminBarDict = {}               # key为N，value为正在合成的N分钟K线
+
+        # key为K线周期（分钟），value为(订阅者, 回调函数)的列表，
+        # 回调函数的参数为(推送的K线, 触发推送的1分钟K线)
+        self.handlerDict = OrderedDict()
+
+    #----------------------------------------------------------------------
+    def addHandler(self, interval, owner, handler):
+        """添加K线回调函数"""
+        self.handlerDict.setdefault(interval, []).append((owner, handler))
+
+    #----------------------------------------------------------------------
+    def removeHandler(self, owner):
+        """移除订阅者的所有回调函数"""
+        for interval in self.handlerDict.keys():
+            l = [item for item in self.handlerDict[interval] if item[0] is not owner]
+            if l:
+                self.handlerDict[interval] = l
+            else:
+                del self.handlerDict[interval]
+                self.xminBarDict.pop(interval, None)
+
+    #----------------------------------------------------------------------
+    def hasOwner(self, owner):
+        """检查是否有该订阅者的回调函数"""
+        for handlerList in self.handlerDict.values():
+            for item in handlerList:
+                if item[0] is owner:
+                    return True
+        return False
+
+    #----------------------------------------------------------------------
+    def updateTick(self, tick):
+        """更新Tick，合成1分钟K线"""
+        tickMinute = tick.datetime.minute
+
+        if tickMinute != self.barMinute:
+            if self.bar:
+                self.updateBar(self.bar)
+
+            bar = CtaBarData()
+            bar.vtSymbol = tick.vtSymbol
+            bar.symbol = tick.symbol
+            bar.exchange = tick.exchange
+
+            bar.open = tick.lastPrice
+            bar.high = tick.lastPrice
+            bar.low = tick.lastPrice
+            bar.close = tick.lastPrice
+
+            bar.date = tick.date
+            bar.time = tick.time
+            bar.datetime = tick.datetime    # K线的时间设为第一个Tick的时间
+
+            self.bar = bar
+            self.barMinute = tickMinute
+        else:
+            bar = self.bar
+
+            bar.high = max(bar.high, tick.lastPrice)
+            bar.low = min(bar.low, tick.lastPrice)
+            bar.close = tick.lastPrice
+
+    #----------------------------------------------------------------------
+    def updateBar(self, bar):
+        """更新一根结束的1分钟K线，推送到各周期的回调函数"""
+        self.lastBar = bar
+
+        for interval, handlerList in self.handlerDict.items():
+            if interval == 1:
+                xbar = bar
+            else:
+                xbar = self.updateXminBar(interval, bar)
+
+            if xbar:
+                for owner, handler in handlerList:
+                    handler(xbar, bar)
+
+    #----------------------------------------------------------------------
+    def updateXminBar(self, interval, bar):
+        """用1分钟K线更新N分钟K线，N分钟K线结束时返回该K线，否则返回None"""
+        xbar = self.xminBarDict.get(interval, None)
+
+        # 分钟数能被N整除时结束当前N分钟K线
+        if bar.datetime.minute % interval == 0:
+            if xbar:
+                xbar.high = max(xbar.high, bar.high)
+                xbar.low = min(xbar.low, bar.low)
+                xbar.close = bar.close
+
+                self.xminBarDict[interval] = None
+            return xbar
+
+        if not xbar:
+            xbar = CtaBarData()
+
+            xbar.vtSymbol = bar.vtSymbol
+            xbar.symbol = bar.symbol
+            xbar.exchange = bar.exchange
+
+            xbar.open = bar.open
+            xbar.high = bar.high
+            xbar.low = bar.low
+            xbar.close = bar.close
+
+            xbar.date = bar.date
+            xbar.time = bar.time
+            xbar.datetime = bar.datetime
+
+            self.xminBarDict[interval] = xbar
+        else:
+            xbar.high = max(xbar.high, bar.high)
+            xbar.low = min(xbar.low, bar.low)
+            xbar.close = bar.close
+
+        return None
+
+    #----------------------------------------------------------------------
+    def replay(self, owner, barList):
+        """用历史1分钟K线回放，只推送给owner的回调函数"""
+        generator = BarGenerator()
+        for interval, handlerList in self.handlerDict.items():
+            for item in handlerList:
+                if item[0] is owner:
+                    generator.addHandler(interval, owner, item[1])
+
+        for bar in barList:
+            generator.updateBar(bar)
+
+        # 保留未完成的N分钟K线
+        for interval, xbar in generator.xminBarDict.items():
+            if xbar and not self.xminBarDict.get(interval, None):
+                self.xminBarDict[interval] = xbar
@@ -35,12 +35,21 @@ TICK_DB_NAME = 'VnTrader_Tick_Db'
 DAILY_DB_NAME = 'VnTrader_Daily_Db'
 MINUTE_DB_NAME = 'VnTrader_1Min_Db'
 
+
+#----------------------------------------------------------------------
+def getMinuteDbName(interval):
+    """获取N分钟K线的数据库名称"""
+    return 'VnTrader_%sMin_Db' %interval
+
+
 # 引擎类型，用于区分当前策略的运行环境
 ENGINETYPE_BACKTESTING = 'backtesting'  # 回测
 ENGINETYPE_TRADING = 'trading'          # 实盘
 
 # CTA引擎中涉及的数据类定义
-from vtConstant import EMPTY_UNICODE, EMPTY_STRING, EMPTY_FLOAT, EMPTY_INT
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from vtConstant import EMPTY_UNICODE, EMPTY_STRING, EMPTY_FLOAT, EMPTY_INT, DIRECTION_LONG
 
 
 ########################################################################
@@ -62,6 +71,75 @@ class StopOrder(object):
         self.status = EMPTY_STRING       # 停止单状态
 
 
+########################################################################
+class StopOrderBook(object):
+    """单个合约的本地停止单簿，多头和空头停止单分别按价格排序，
+    行情更新时只取出触发价被穿过的停止单"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.longList = []              # 多头停止单，元素为(价格, 序号, stopOrderID)，价格升序
+        self.shortList = []             # 空头停止单，元素同上
+        self.keyDict = {}               # key为stopOrderID，value为(所在列表, 元素)
+        self.soDict = {}                # key为stopOrderID，value为停止单对象
+        self.count = 0                  # 序号，价格相同时先下的停止单先触发
+
+    #----------------------------------------------------------------------
+    def __len__(self):
+        """等待中的停止单数量"""
+        return len(self.soDict)
+
+    #----------------------------------------------------------------------
+    def add(self, so):
+        """添加停止单"""
+        self.count += 1
+        key = (so.price, self.count, so.stopOrderID)
+
+        if so.direction == DIRECTION_LONG:
+            l = self.longList
+        else:
+            l = self.shortList
+        insort(l, key)
+
+        self.keyDict[so.stopOrderID] = (l, key)
+        self.soDict[so.stopOrderID] = so
+
+    #----------------------------------------------------------------------
+    def remove(self, stopOrderID):
+        """移除停止单，返回停止单对象，不存在则返回None"""
+        if stopOrderID not in self.keyDict:
+            return None
+
+        l, key = self.keyDict.pop(stopOrderID)
+        i = bisect_left(l, key)
+        del l[i]
+        return self.soDict.pop(stopOrderID)
+
+    #----------------------------------------------------------------------
+    def popTriggered(self, price):
+        """取出价格为price时触发的停止单（多头触发价<=price，空头触发价>=price），返回列表"""
+        triggered = []
+
+        # 多头停止单从低价开始触发
+        i = bisect_right(self.longList, (price, float('inf')))
+        if i:
+            triggered.extend(self.longList[:i])
+            del self.longList[:i]
+
+        # 空头停止单从高价开始触发
+        j = bisect_left(self.shortList, (price, ))
+        if j < len(self.shortList):
+            triggered.extend(reversed(self.shortList[j:]))
+            del self.shortList[j:]
+
+        l = []
+        for price, count, stopOrderID in triggered:
+            del self.keyDict[stopOrderID]
+            l.append(self.soDict.pop(stopOrderID))
+        return l
+
+
 ########################################################################
 class CtaBarData(object):
     """K线数据"""
@@ -133,4 +211,42 @@ class CtaTickData(object):
         self.askVolume2 = EMPTY_INT
         self.askVolume3 = EMPTY_INT
         self.askVolume4 = EMPTY_INT
-        self.askVolume5 = EMPTY_INT    
\ No newline at end of file
+        self.askVolume5 = EMPTY_INT    
+
+    #----------------------------------------------------------------------
+    def copy(self):
+        """复制一个可以修改的Tick对象"""
+        tick = CtaTickData()
+        tick.__dict__.update(self.__dict__)
+        return tick
+
+
+########################################################################
+class CtaTickView(CtaTickData):
+    """只读的Tick数据，CTA引擎每收到一个tick只生成一次，推送给交易该合约的所有策略共享，
+    策略需要修改时调用copy获取副本"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, d):
+        """Constructor，d为字段字典"""
+        self.__dict__.update(d)
+
+    #----------------------------------------------------------------------
+    def __setattr__(self, key, value):
+        """禁止修改"""
+        raise AttributeError(u'CtaTickView是多个策略共享的只读对象，请使用copy()获取副本后修改')
+
+    #----------------------------------------------------------------------
+    def __delattr__(self, key):
+        """禁止删除"""
+        raise AttributeError(u'CtaTickView是多个策略共享的只读对象，请使用copy()获取副本后修改')
+
+
+# Tick数据的字段列表，以及一次性从VtTickData上读取所有字段的函数
+TICK_FIELD_LIST = CtaTickData().__dict__.keys()
+getTickFields = attrgetter(*TICK_FIELD_LIST)
+
+#----------------------------------------------------------------------
+def createTickView(tick):
+    """从VtTickData（datetime需已解析）生成只读的CtaTickView"""
+    return CtaTickView(dict(zip(TICK_FIELD_LIST, getTickFields(tick))))
@@ -0,0 +1,109 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了策略状态的检查点，用于重启后跳过耗时的历史数据回放。
+
+1. 策略在stateList中声明需要保存的状态（如指标计算用的numpy数组、K线列表），
+   支持getState/setState函数的对象（如CtaLineBar）保存getState的返回值，恢复时调用setState
+2. 检查点中同时保存策略参数和最后一根K线的时间（strategy.lastBarDatetime），
+   参数发生变化时不恢复，恢复后策略的loadBar/loadTick只返回该时间之后的数据
+3. 检查点使用pickle二进制格式保存为本地文件，先写入临时文件再替换，避免写入中断导致文件损坏，
+   POSIX系统下rename直接原子地覆盖原文件，Windows下rename不能覆盖已有文件，需要先删除原文件
+'''
+
+import cPickle
+import os
+from collections import OrderedDict
+from datetime import datetime
+
+
+# 检查点文件后缀
+CHECKPOINT_SUFFIX = '.ckpt'
+
+
+#----------------------------------------------------------------------
+def getCheckpointFileName(path, name):
+    """获取策略的检查点文件路径"""
+    return os.path.join(path, name + CHECKPOINT_SUFFIX)
+
+#----------------------------------------------------------------------
+def getStrategyParams(strategy):
+    """获取策略的参数字典"""
+    d = OrderedDict()
+    for key in strategy.paramList:
+        d[key] = strategy.__getattribute__(key)
+    return d
+
+#----------------------------------------------------------------------
+def getStrategyState(strategy):
+    """获取策略在stateList中声明的状态"""
+    d = OrderedDict()
+    for key in strategy.stateList:
+        value = getattr(strategy, key, None)
+        if hasattr(value, 'getState'):
+            value = value.getState()
+        d[key] = value
+    return d
+
+#----------------------------------------------------------------------
+def setStrategyState(strategy, state):
+    """恢复策略的状态"""
+    for key in strategy.stateList:
+        if key not in state:
+            continue
+
+        obj = getattr(strategy, key, None)
+        if hasattr(obj, 'setState'):
+            obj.setState(state[key])
+        else:
+            setattr(strategy, key, state[key])
+
+#----------------------------------------------------------------------
+def saveCheckpoint(path, strategy):
+    """保存策略的检查点，成功返回True，策略没有声明状态或还没有处理过K线时返回False"""
+    if not strategy.stateList or not strategy.lastBarDatetime:
+        return False
+
+    data = {
+        'className': strategy.className,
+        'params': getStrategyParams(strategy),
+        'lastBarDatetime': strategy.lastBarDatetime,
+        'saveTime': datetime.now(),
+        'state': getStrategyState(strategy)
+    }
+
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    fileName = getCheckpointFileName(path, strategy.name)
+    tempFileName = fileName + '.tmp'
+    with open(tempFileName, 'wb') as f:
+        cPickle.dump(data, f, cPickle.HIGHEST_PROTOCOL)
+
+    # Windows下rename不能覆盖已有文件，POSIX系统下rename是原子操作，不需要先删除
+    if os.name == 'nt' and os.path.exists(fileName):
+        os.remove(fileName)
+    os.rename(tempFileName, fileName)
+    return True
+
+#----------------------------------------------------------------------
+def loadCheckpoint(path, strategy, earliestDatetime=None):
+    """读取并恢复策略的检查点，返回检查点中最后一根K线的时间，
+    文件不存在、参数不一致或早于earliestDatetime时不恢复，返回None"""
+    fileName = getCheckpointFileName(path, strategy.name)
+    if not strategy.stateList or not os.path.exists(fileName):
+        return None
+
+    with open(fileName, 'rb') as f:
+        data = cPickle.load(f)
+
+    if data['className'] != strategy.className or data['params'] != getStrategyParams(strategy):
+        return None
+
+    lastBarDatetime = data['lastBarDatetime']
+    if earliestDatetime and lastBarDatetime < earliestDatetime:
+        return None
+
+    setStrategyState(strategy, data['state'])
+    strategy.lastBarDatetime = lastBarDatetime
+    return lastBarDatetime
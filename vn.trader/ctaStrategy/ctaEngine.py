@@ -14,6 +14,31 @@
    感到功能不足的用户（即希望更高频的交易），交易策略不应该出现4中所述的情况
 6. 对于想要实现4中所述情况的用户，需要实现一个策略信号引擎和交易委托引擎分开
    的定制化统结构（没错，得自己写）
+
+关于策略工作线程：
+CTA_setting.json中配置了worker的策略在对应的CtaWorker线程中运行（见ctaWorker.py），
+发单、撤单和委托、成交推送的处理使用orderLock串行执行。
+
+关于策略耗时统计：
+策略回调函数的耗时和发单数量由StrategyProfiler统计（见ctaProfiler.py），
+超过callbackBudget（毫秒）的回调会发出警告日志，统计数据在界面上显示，也可以通过RPC查询。
+
+关于策略热更新：
+reloadStrategies会重新载入策略类所在的模块，用原有的参数重新创建策略实例，
+持仓和varList中的变量从原实例复制，活动委托和停止单转移到新实例，
+接口连接和行情订阅保持不变，无需重启MainEngine。
+
+关于历史数据缓存：
+loadBar和loadTick从MongoDB读取的数据保存在共享的CtaHistoryCache中（见ctaHistoryCache.py），
+多个策略读取同一合约时只查询一次，initStrategies会先并发预读所有策略需要的K线数据再逐个初始化。
+
+关于策略检查点：
+声明了stateList的策略在保存持仓时以及每隔checkpointInterval秒保存状态检查点（见ctaCheckpoint.py），
+初始化时先恢复检查点，onInit中只需回放检查点之后的K线。
+
+关于K线合成：
+策略通过subscribeBar订阅K线后，由引擎中每个合约一个的BarGenerator统一合成（见ctaBarGenerator.py），
+K线结束后推送到策略的回调函数，同一合约上的多个策略不再各自重复合成。
 '''
 
 from __future__ import division
@@ -23,13 +48,26 @@ import os
 import traceback
 from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import partial
+from threading import RLock
+from time import time
 
 from ctaBase import *
-from strategy import STRATEGY_CLASS
+from strategy import STRATEGY_CLASS, STRATEGY_MODULE, reloadStrategyModule
 from eventEngine import *
 from vtConstant import *
 from vtGateway import VtSubscribeReq, VtOrderReq, VtCancelOrderReq, VtLogData
-from vtFunction import todayDate
+from vtFunction import todayDate, loadDataStoreSetting, getTickDatetime
+from vtDataStore import VtDataStore
+from vtContinuous import (ContinuousBuilder, MongoBarSource, StoreBarSource,
+                          isContinuousSymbol, getProduct, ADJUST_RAW)
+from vtTickBucket import toBucketFilter, iterTicks
+from riskManager.rmEngine import QUEUEORDERPREFIX
+from ctaWorker import CtaWorker
+from ctaProfiler import StrategyProfiler, DEFAULT_CALLBACK_BUDGET
+from ctaHistoryCache import CtaHistoryCache, HISTORY_BAR, HISTORY_TICK
+from ctaCheckpoint import saveCheckpoint, loadCheckpoint
+from ctaBarGenerator import BarGenerator
 
 
 ########################################################################
@@ -38,6 +76,8 @@ class CtaEngine(object):
     settingFileName = 'CTA_setting.json'
     path = os.path.abspath(os.path.dirname(__file__))
     settingFileName = os.path.join(path, settingFileName)      
+    
+    checkpointPath = os.path.join(path, 'checkpoint')
 
     #----------------------------------------------------------------------
     def __init__(self, mainEngine, eventEngine):
@@ -57,10 +97,26 @@ class CtaEngine(object):
         # value为包含所有相关strategy对象的list
         self.tickStrategyDict = {}
         
+        # 预先生成的Tick推送列表，key为vtSymbol，value为(策略对象, 策略的onTick函数, 耗时统计对象)的列表
+        # 在工作线程中运行的策略，耗时在工作线程中统计，耗时统计对象为None
+        self.tickHandlerDict = {}
+        
+        # K线合成器，key为vtSymbol，value为BarGenerator对象
+        self.barGeneratorDict = {}
+        
+        # 策略的耗时统计，key为策略名称，value为StrategyProfiler对象
+        self.profilerDict = {}
+        self.profileWindow = 60             # 耗时直方图的滚动窗口（秒）
+        self.profileCount = 0
+        
         # 保存vtOrderID和strategy对象映射的字典（用于推送order和trade数据）
         # key为vtOrderID，value为strategy对象
         self.orderStrategyDict = {}     
         
+        # 保存策略名称和活动委托号映射的字典（用于按策略查询和撤单）
+        # key为策略名称，value为该策略尚未结束的vtOrderID集合
+        self.strategyOrderDict = {}
+        
         # 本地停止单编号计数
         self.stopOrderCount = 0
         # stopOrderID = STOPORDERPREFIX + str(stopOrderCount)
@@ -70,6 +126,9 @@ class CtaEngine(object):
         self.stopOrderDict = {}             # 停止单撤销后不会从本字典中删除
         self.workingStopOrderDict = {}      # 停止单撤销后会从本字典中删除
         
+        # 按合约保存的停止单簿，key为vtSymbol，value为StopOrderBook对象
+        self.stopOrderBookDict = {}
+        
         # 持仓缓存字典
         # key为vtSymbol，value为PositionBuffer对象
         self.posBufferDict = {}
@@ -80,166 +139,266 @@ class CtaEngine(object):
         # 引擎类型为实盘
         self.engineType = ENGINETYPE_TRADING
         
+        # 本地列式存储，用于读取历史数据
+        self.dataStore = None
+        storeType, storePath = loadDataStoreSetting()
+        if storeType == 'local':
+            self.dataStore = VtDataStore(storePath)
+        
+        # 连续合约K线的缓存目录，和回测引擎共用
+        self.continuousPath = os.path.join(storePath, 'continuous')
+        
+        # 历史数据缓存，用于策略初始化
+        self.historyCache = CtaHistoryCache(self.queryHistory)
+        
+        # 策略检查点的保存间隔（秒）
+        self.checkpointInterval = 300
+        self.checkpointCount = 0
+        
+        # 策略工作线程相关
+        self.orderLock = RLock()            # 委托锁，工作线程中的策略发单时和事件引擎线程串行
+        self.workerDict = {}                # key为工作线程名称，value为CtaWorker对象
+        self.strategyWorkerDict = {}        # key为策略名称，value为CtaWorker对象
+        self.workerReportInterval = 60      # 工作线程统计日志的发出间隔（秒）
+        self.workerReportCount = 0
+        
         # 注册事件监听
         self.registerEvent()
  
     #----------------------------------------------------------------------
     def sendOrder(self, vtSymbol, orderType, price, volume, strategy):
         """发单"""
-        contract = self.mainEngine.getContract(vtSymbol)
+        with self.orderLock:
+            contract = self.mainEngine.getContract(vtSymbol)
         
-        req = VtOrderReq()
-        req.symbol = contract.symbol
-        req.exchange = contract.exchange
-        req.price = self.roundToPriceTick(contract.priceTick, price)
-        req.volume = volume
+            req = VtOrderReq()
+            req.symbol = contract.symbol
+            req.exchange = contract.exchange
+            req.price = self.roundToPriceTick(contract.priceTick, price)
+            req.volume = volume
         
-        req.productClass = strategy.productClass
-        req.currency = strategy.currency        
+            req.productClass = strategy.productClass
+            req.currency = strategy.currency        
         
-        # 设计为CTA引擎发出的委托只允许使用限价单
-        req.priceType = PRICETYPE_LIMITPRICE    
+            # 设计为CTA引擎发出的委托只允许使用限价单
+            req.priceType = PRICETYPE_LIMITPRICE    
         
-        # CTA委托类型映射
-        if orderType == CTAORDER_BUY:
-            req.direction = DIRECTION_LONG
-            req.offset = OFFSET_OPEN
+            # CTA委托类型映射
+            if orderType == CTAORDER_BUY:
+                req.direction = DIRECTION_LONG
+                req.offset = OFFSET_OPEN
             
-        elif orderType == CTAORDER_SELL:
-            req.direction = DIRECTION_SHORT
+            elif orderType == CTAORDER_SELL:
+                req.direction = DIRECTION_SHORT
             
-            # 只有上期所才要考虑平今平昨
-            if contract.exchange != EXCHANGE_SHFE:
-                req.offset = OFFSET_CLOSE
-            else:
-                # 获取持仓缓存数据
-                posBuffer = self.posBufferDict.get(vtSymbol, None)
-                # 如果获取持仓缓存失败，则默认平昨
-                if not posBuffer:
+                # 只有上期所才要考虑平今平昨
+                if contract.exchange != EXCHANGE_SHFE:
                     req.offset = OFFSET_CLOSE
-                # 否则如果有多头今仓，则使用平今
-                elif posBuffer.longToday:
-                    req.offset= OFFSET_CLOSETODAY
-                # 其他情况使用平昨
                 else:
-                    req.offset = OFFSET_CLOSE
+                    # 获取持仓缓存数据
+                    posBuffer = self.posBufferDict.get(vtSymbol, None)
+                    # 如果获取持仓缓存失败，则默认平昨
+                    if not posBuffer:
+                        req.offset = OFFSET_CLOSE
+                    # 否则如果有多头今仓，则使用平今
+                    elif posBuffer.longToday:
+                        req.offset= OFFSET_CLOSETODAY
+                    # 其他情况使用平昨
+                    else:
+                        req.offset = OFFSET_CLOSE
                 
-        elif orderType == CTAORDER_SHORT:
-            req.direction = DIRECTION_SHORT
-            req.offset = OFFSET_OPEN
+            elif orderType == CTAORDER_SHORT:
+                req.direction = DIRECTION_SHORT
+                req.offset = OFFSET_OPEN
             
-        elif orderType == CTAORDER_COVER:
-            req.direction = DIRECTION_LONG
+            elif orderType == CTAORDER_COVER:
+                req.direction = DIRECTION_LONG
             
-            # 只有上期所才要考虑平今平昨
-            if contract.exchange != EXCHANGE_SHFE:
-                req.offset = OFFSET_CLOSE
-            else:
-                # 获取持仓缓存数据
-                posBuffer = self.posBufferDict.get(vtSymbol, None)
-                # 如果获取持仓缓存失败，则默认平昨
-                if not posBuffer:
+                # 只有上期所才要考虑平今平昨
+                if contract.exchange != EXCHANGE_SHFE:
                     req.offset = OFFSET_CLOSE
-                # 否则如果有空头今仓，则使用平今
-                elif posBuffer.shortToday:
-                    req.offset= OFFSET_CLOSETODAY
-                # 其他情况使用平昨
                 else:
-                    req.offset = OFFSET_CLOSE
+                    # 获取持仓缓存数据
+                    posBuffer = self.posBufferDict.get(vtSymbol, None)
+                    # 如果获取持仓缓存失败，则默认平昨
+                    if not posBuffer:
+                        req.offset = OFFSET_CLOSE
+                    # 否则如果有空头今仓，则使用平今
+                    elif posBuffer.shortToday:
+                        req.offset= OFFSET_CLOSETODAY
+                    # 其他情况使用平昨
+                    else:
+                        req.offset = OFFSET_CLOSE
         
-        vtOrderID = self.mainEngine.sendOrder(req, contract.gatewayName)    # 发单
-        self.orderStrategyDict[vtOrderID] = strategy        # 保存vtOrderID和策略的映射关系
+            vtOrderID = self.mainEngine.sendOrder(req, contract.gatewayName, self.processQueueOrder)    # 发单
+            self.orderStrategyDict[vtOrderID] = strategy        # 保存vtOrderID和策略的映射关系
+            if vtOrderID:
+                self.strategyOrderDict[strategy.name].add(vtOrderID)
+                self.profilerDict[strategy.name].orderCount += 1
 
-        self.writeCtaLog(u'策略%s发送委托，%s，%s，%s@%s' 
-                         %(strategy.name, vtSymbol, req.direction, volume, price))
+            self.writeCtaLog(u'策略%s发送委托，%s，%s，%s@%s' 
+                             %(strategy.name, vtSymbol, req.direction, volume, price))
         
-        return vtOrderID
+            return vtOrderID
+    
+    #----------------------------------------------------------------------
+    def processQueueOrder(self, queueID, vtOrderID):
+        """风控排队委托发出或被拒绝后，将排队编号替换为实际的vtOrderID"""
+        with self.orderLock:
+            strategy = self.orderStrategyDict.pop(queueID, None)
+            if not strategy:
+                return
+        
+            self.strategyOrderDict[strategy.name].discard(queueID)
+            if vtOrderID:
+                self.orderStrategyDict[vtOrderID] = strategy
+                self.strategyOrderDict[strategy.name].add(vtOrderID)
+        
+            def onQueueOrder():
+                strategy.onQueueOrder(queueID, vtOrderID)
+            self.callStrategyFunc(strategy, onQueueOrder)
+    
+    #----------------------------------------------------------------------
+    def getQueueOrderID(self, vtOrderID):
+        """排队编号转换为实际的vtOrderID，仍在排队中的委托直接撤销并返回空字符串"""
+        if not vtOrderID.startswith(QUEUEORDERPREFIX):
+            return vtOrderID
+        
+        rmEngine = self.mainEngine.rmEngine
+        if rmEngine.cancelQueueOrder(vtOrderID):
+            return ''
+        return rmEngine.getQueueOrderID(vtOrderID)
     
     #----------------------------------------------------------------------
     def cancelOrder(self, vtOrderID):
         """撤单"""
-        # 查询报单对象
-        order = self.mainEngine.getOrder(vtOrderID)
-        
-        # 如果查询成功
-        if order:
-            # 检查是否报单还有效，只有有效时才发出撤单指令
-            orderFinished = (order.status==STATUS_ALLTRADED or order.status==STATUS_CANCELLED)
-            if not orderFinished:
+        with self.orderLock:
+            vtOrderID = self.getQueueOrderID(vtOrderID)
+        
+            # 查询报单对象
+            order = self.mainEngine.getOrder(vtOrderID)
+        
+            # 如果查询成功
+            if order:
+                # 检查是否报单还有效，只有有效时才发出撤单指令
+                orderFinished = order.status in (STATUS_ALLTRADED, STATUS_CANCELLED, STATUS_REJECTED)
+                if not orderFinished:
+                    req = VtCancelOrderReq()
+                    req.symbol = order.symbol
+                    req.exchange = order.exchange
+                    req.frontID = order.frontID
+                    req.sessionID = order.sessionID
+                    req.orderID = order.orderID
+                    self.mainEngine.cancelOrder(req, order.gatewayName)    
+                    self.countCancel(vtOrderID)
+
+    #----------------------------------------------------------------------
+    def countCancel(self, vtOrderID):
+        """统计策略的撤单数量"""
+        strategy = self.orderStrategyDict.get(vtOrderID, None)
+        if strategy:
+            self.profilerDict[strategy.name].cancelCount += 1
+
+    #----------------------------------------------------------------------
+    def cancelOrders(self, vtOrderIDList):
+        """批量撤单，按接口分组后一次性发出"""
+        with self.orderLock:
+            reqDict = {}
+        
+            for vtOrderID in vtOrderIDList:
+                vtOrderID = self.getQueueOrderID(vtOrderID)
+                order = self.mainEngine.getOrder(vtOrderID)
+                if not order:
+                    continue
+            
+                # 只对还有效的报单发出撤单指令
+                if order.status in (STATUS_ALLTRADED, STATUS_CANCELLED, STATUS_REJECTED):
+                    continue
+            
                 req = VtCancelOrderReq()
                 req.symbol = order.symbol
                 req.exchange = order.exchange
                 req.frontID = order.frontID
                 req.sessionID = order.sessionID
                 req.orderID = order.orderID
-                self.mainEngine.cancelOrder(req, order.gatewayName)    
+                reqDict.setdefault(order.gatewayName, []).append(req)
+                self.countCancel(vtOrderID)
+        
+            for gatewayName, reqList in reqDict.items():
+                self.mainEngine.cancelOrders(reqList, gatewayName)
 
     #----------------------------------------------------------------------
     def sendStopOrder(self, vtSymbol, orderType, price, volume, strategy):
         """发停止单（本地实现）"""
-        self.stopOrderCount += 1
-        stopOrderID = STOPORDERPREFIX + str(self.stopOrderCount)
-        
-        so = StopOrder()
-        so.vtSymbol = vtSymbol
-        so.orderType = orderType
-        so.price = price
-        so.volume = volume
-        so.strategy = strategy
-        so.stopOrderID = stopOrderID
-        so.status = STOPORDER_WAITING
-        
-        if orderType == CTAORDER_BUY:
-            so.direction = DIRECTION_LONG
-            so.offset = OFFSET_OPEN
-        elif orderType == CTAORDER_SELL:
-            so.direction = DIRECTION_SHORT
-            so.offset = OFFSET_CLOSE
-        elif orderType == CTAORDER_SHORT:
-            so.direction = DIRECTION_SHORT
-            so.offset = OFFSET_OPEN
-        elif orderType == CTAORDER_COVER:
-            so.direction = DIRECTION_LONG
-            so.offset = OFFSET_CLOSE           
-        
-        # 保存stopOrder对象到字典中
-        self.stopOrderDict[stopOrderID] = so
-        self.workingStopOrderDict[stopOrderID] = so
-        
-        return stopOrderID
+        with self.orderLock:
+            self.stopOrderCount += 1
+            stopOrderID = STOPORDERPREFIX + str(self.stopOrderCount)
+            self.profilerDict[strategy.name].stopOrderCount += 1
+        
+            so = StopOrder()
+            so.vtSymbol = vtSymbol
+            so.orderType = orderType
+            so.price = price
+            so.volume = volume
+            so.strategy = strategy
+            so.stopOrderID = stopOrderID
+            so.status = STOPORDER_WAITING
+        
+            if orderType == CTAORDER_BUY:
+                so.direction = DIRECTION_LONG
+                so.offset = OFFSET_OPEN
+            elif orderType == CTAORDER_SELL:
+                so.direction = DIRECTION_SHORT
+                so.offset = OFFSET_CLOSE
+            elif orderType == CTAORDER_SHORT:
+                so.direction = DIRECTION_SHORT
+                so.offset = OFFSET_OPEN
+            elif orderType == CTAORDER_COVER:
+                so.direction = DIRECTION_LONG
+                so.offset = OFFSET_CLOSE           
+        
+            # 保存stopOrder对象到字典中
+            self.stopOrderDict[stopOrderID] = so
+            self.workingStopOrderDict[stopOrderID] = so
+        
+            book = self.stopOrderBookDict.get(vtSymbol, None)
+            if book is None:
+                book = StopOrderBook()
+                self.stopOrderBookDict[vtSymbol] = book
+            book.add(so)
+        
+            return stopOrderID
     
     #----------------------------------------------------------------------
     def cancelStopOrder(self, stopOrderID):
         """撤销停止单"""
-        # 检查停止单是否存在
-        if stopOrderID in self.workingStopOrderDict:
-            so = self.workingStopOrderDict[stopOrderID]
-            so.status = STOPORDER_CANCELLED
-            del self.workingStopOrderDict[stopOrderID]
+        with self.orderLock:
+            # 检查停止单是否存在
+            if stopOrderID in self.workingStopOrderDict:
+                so = self.workingStopOrderDict[stopOrderID]
+                so.status = STOPORDER_CANCELLED
+                del self.workingStopOrderDict[stopOrderID]
+                self.stopOrderBookDict[so.vtSymbol].remove(stopOrderID)
 
     #----------------------------------------------------------------------
     def processStopOrder(self, tick):
         """收到行情后处理本地停止单（检查是否要立即发出）"""
-        vtSymbol = tick.vtSymbol
+        with self.orderLock:
+            # 只检查该合约停止单簿中触发价被穿过的停止单
+            book = self.stopOrderBookDict.get(tick.vtSymbol, None)
+            if not book:
+                return
         
-        # 首先检查是否有策略交易该合约
-        if vtSymbol in self.tickStrategyDict:
-            # 遍历等待中的停止单，检查是否会被触发
-            for so in self.workingStopOrderDict.values():
-                if so.vtSymbol == vtSymbol:
-                    longTriggered = so.direction==DIRECTION_LONG and tick.lastPrice>=so.price        # 多头停止单被触发
-                    shortTriggered = so.direction==DIRECTION_SHORT and tick.lastPrice<=so.price     # 空头停止单被触发
-                    
-                    if longTriggered or shortTriggered:
-                        # 买入和卖出分别以涨停跌停价发单（模拟市价单）
-                        if so.direction==DIRECTION_LONG:
-                            price = tick.upperLimit
-                        else:
-                            price = tick.lowerLimit
-                        
-                        so.status = STOPORDER_TRIGGERED
-                        self.sendOrder(so.vtSymbol, so.orderType, price, so.volume, so.strategy)
-                        del self.workingStopOrderDict[so.stopOrderID]
+            for so in book.popTriggered(tick.lastPrice):
+                # 买入和卖出分别以涨停跌停价发单（模拟市价单）
+                if so.direction==DIRECTION_LONG:
+                    price = tick.upperLimit
+                else:
+                    price = tick.lowerLimit
+            
+                so.status = STOPORDER_TRIGGERED
+                del self.workingStopOrderDict[so.stopOrderID]
+                self.sendOrder(so.vtSymbol, so.orderType, price, so.volume, so.strategy)
 
     #----------------------------------------------------------------------
     def processTickEvent(self, event):
@@ -249,60 +408,74 @@ class CtaEngine(object):
         self.processStopOrder(tick)
         
         # 推送tick到对应的策略实例进行处理
-        if tick.vtSymbol in self.tickStrategyDict:
-            # 将vtTickData数据转化为ctaTickData
-            ctaTick = CtaTickData()
-            d = ctaTick.__dict__
-            for key in d.keys():
-                if key != 'datetime':
-                    d[key] = tick.__getattribute__(key)
-            # 添加datetime字段
-            ctaTick.datetime = datetime.strptime(' '.join([tick.date, tick.time]), '%Y%m%d %H:%M:%S.%f')
-            
-            # 逐个推送到策略实例中
-            l = self.tickStrategyDict[tick.vtSymbol]
-            for strategy in l:
-                self.callStrategyFunc(strategy, strategy.onTick, ctaTick)
+        handlerList = self.tickHandlerDict.get(tick.vtSymbol, None)
+        generator = self.barGeneratorDict.get(tick.vtSymbol, None)
+        if handlerList or generator:
+            # 生成一次只读的Tick数据，所有策略共享
+            getTickDatetime(tick)
+            ctaTick = createTickView(tick)
+            
+        # 先合成K线，K线结束时推送到订阅的策略
+        if generator:
+            generator.updateTick(ctaTick)
+        
+        if handlerList:
+            # 逐个推送到策略实例中，同时统计耗时
+            for strategy, onTick, profile in handlerList:
+                start = time()
+                try:
+                    onTick(ctaTick)
+                except Exception:
+                    self.processStrategyError(strategy)
+                if profile:
+                    profile.update(time() - start)
     
     #----------------------------------------------------------------------
     def processOrderEvent(self, event):
         """处理委托推送"""
-        order = event.dict_['data']
+        with self.orderLock:
+            order = event.dict_['data']
         
-        if order.vtOrderID in self.orderStrategyDict:
-            strategy = self.orderStrategyDict[order.vtOrderID]            
-            self.callStrategyFunc(strategy, strategy.onOrder, order)
+            if order.vtOrderID in self.orderStrategyDict:
+                strategy = self.orderStrategyDict[order.vtOrderID]            
+            
+                # 委托结束（全部成交、撤销或者拒单）后从策略的活动委托集合中移除
+                if order.status in (STATUS_ALLTRADED, STATUS_CANCELLED, STATUS_REJECTED):
+                    self.strategyOrderDict[strategy.name].discard(order.vtOrderID)
+            
+                self.callStrategyFunc(strategy, strategy.onOrder, order)
     
     #----------------------------------------------------------------------
     def processTradeEvent(self, event):
         """处理成交推送"""
-        trade = event.dict_['data']
+        with self.orderLock:
+            trade = event.dict_['data']
         
-        # 过滤已经收到过的成交回报
-        if trade.vtTradeID in self.tradeSet:
-            return
-        self.tradeSet.add(trade.vtTradeID)
+            # 过滤已经收到过的成交回报
+            if trade.vtTradeID in self.tradeSet:
+                return
+            self.tradeSet.add(trade.vtTradeID)
         
-        # 将成交推送到策略对象中
-        if trade.vtOrderID in self.orderStrategyDict:
-            strategy = self.orderStrategyDict[trade.vtOrderID]
+            # 将成交推送到策略对象中
+            if trade.vtOrderID in self.orderStrategyDict:
+                strategy = self.orderStrategyDict[trade.vtOrderID]
             
-            # 计算策略持仓
-            if trade.direction == DIRECTION_LONG:
-                strategy.pos += trade.volume
-            else:
-                strategy.pos -= trade.volume
+                # 计算策略持仓
+                if trade.direction == DIRECTION_LONG:
+                    strategy.pos += trade.volume
+                else:
+                    strategy.pos -= trade.volume
             
-            self.callStrategyFunc(strategy, strategy.onTrade, trade)
+                self.callStrategyFunc(strategy, strategy.onTrade, trade)
             
-        # 更新持仓缓存数据
-        if trade.vtSymbol in self.tickStrategyDict:
-            posBuffer = self.posBufferDict.get(trade.vtSymbol, None)
-            if not posBuffer:
-                posBuffer = PositionBuffer()
-                posBuffer.vtSymbol = trade.vtSymbol
-                self.posBufferDict[trade.vtSymbol] = posBuffer
-            posBuffer.updateTradeData(trade)            
+            # 更新持仓缓存数据
+            if trade.vtSymbol in self.tickStrategyDict:
+                posBuffer = self.posBufferDict.get(trade.vtSymbol, None)
+                if not posBuffer:
+                    posBuffer = PositionBuffer()
+                    posBuffer.vtSymbol = trade.vtSymbol
+                    self.posBufferDict[trade.vtSymbol] = posBuffer
+                posBuffer.updateTradeData(trade)            
             
     #----------------------------------------------------------------------
     def processPositionEvent(self, event):
@@ -325,42 +498,109 @@ class CtaEngine(object):
         self.eventEngine.register(EVENT_ORDER, self.processOrderEvent)
         self.eventEngine.register(EVENT_TRADE, self.processTradeEvent)
         self.eventEngine.register(EVENT_POSITION, self.processPositionEvent)
+        self.eventEngine.register(EVENT_TIMER, self.processTimerEvent)
  
     #----------------------------------------------------------------------
     def insertData(self, dbName, collectionName, data):
         """插入数据到数据库（这里的data可以是CtaTickData或者CtaBarData）"""
-        self.mainEngine.dbInsert(dbName, collectionName, data.__dict__)
+        # 插入时会添加_id字段，复制一份避免修改策略间共享的数据对象
+        self.mainEngine.dbInsert(dbName, collectionName, dict(data.__dict__))
     
     #----------------------------------------------------------------------
     def loadBar(self, dbName, collectionName, days):
         """从数据库中读取Bar数据，startDate是datetime对象"""
         startDate = self.today - timedelta(days)
         
-        d = {'datetime':{'$gte':startDate}}
-        barData = self.mainEngine.dbQuery(dbName, collectionName, d)
+        # 连续合约根据具体合约的数据生成（不复权），行情记录不再保存连续合约的K线
+        if isContinuousSymbol(collectionName):
+            barData = self.loadContinuousBar(dbName, collectionName, startDate)
+            if barData is not None:
+                return barData
+        
+        # 本地存储中有该合约数据时优先使用
+        if self.dataStore and self.dataStore.hasCollection(dbName, collectionName):
+            return self.dataStore.loadData(dbName, collectionName, startDate, dataClass=CtaBarData)
+        
+        # 缓存中的数据由多个策略共享，需要复制
+        barData = self.historyCache.load(dbName, collectionName, HISTORY_BAR, startDate)
         
         l = []
         for d in barData:
             bar = CtaBarData()
-            bar.__dict__ = d
+            bar.__dict__ = dict(d)
             l.append(bar)
         return l
     
+    #----------------------------------------------------------------------
+    def loadContinuousBar(self, dbName, collectionName, startDate):
+        """根据具体合约的数据生成连续合约K线，没有具体合约的数据时返回None"""
+        if self.dataStore:
+            source = StoreBarSource(self.dataStore, dbName)
+        elif self.mainEngine.dbClient:
+            source = MongoBarSource(self.mainEngine.dbClient, dbName)
+        else:
+            return None
+        
+        product = getProduct(collectionName)
+        if not source.listContracts(product):
+            return None
+        
+        builder = ContinuousBuilder(source, self.continuousPath)
+        return builder.loadData(product, startDate, adjust=ADJUST_RAW, dataClass=CtaBarData)
+    
     #----------------------------------------------------------------------
     def loadTick(self, dbName, collectionName, days):
         """从数据库中读取Tick数据，startDate是datetime对象"""
         startDate = self.today - timedelta(days)
         
-        d = {'datetime':{'$gte':startDate}}
-        tickData = self.mainEngine.dbQuery(dbName, collectionName, d)
+        if self.dataStore and self.dataStore.hasCollection(dbName, collectionName):
+            return self.dataStore.loadData(dbName, collectionName, startDate, dataClass=CtaTickData)
+        
+        tickData = self.historyCache.load(dbName, collectionName, HISTORY_TICK, startDate)
         
         l = []
         for d in tickData:
             tick = CtaTickData()
-            tick.__dict__ = d
+            tick.__dict__ = dict(d)
             l.append(tick)
         return l    
     
+    #----------------------------------------------------------------------
+    def queryHistory(self, dbName, collectionName, dataType, flt):
+        """从数据库中查询历史数据，供历史数据缓存调用"""
+        if dataType == HISTORY_TICK:
+            # 同时兼容按分钟分桶保存的Tick数据
+            tickData = self.mainEngine.dbQuery(dbName, collectionName, toBucketFilter(flt))
+            return list(iterTicks(tickData, flt))
+        else:
+            return self.mainEngine.dbQuery(dbName, collectionName, flt)
+    
+    #----------------------------------------------------------------------
+    def prefetchHistory(self, nameList):
+        """并发预读策略初始化所需的K线数据（按策略的initDays），同一合约的请求合并"""
+        requestList = []
+        for name in nameList:
+            strategy = self.strategyDict.get(name, None)
+            if not strategy or strategy.inited:
+                continue
+            
+            days = getattr(strategy, 'initDays', 0)
+            if not days:
+                continue
+            
+            # 本地存储中的数据和连续合约不经过历史数据缓存
+            dbName = strategy.barDbName
+            if self.dataStore and self.dataStore.hasCollection(dbName, strategy.vtSymbol):
+                continue
+            if isContinuousSymbol(strategy.vtSymbol):
+                continue
+            requestList.append((dbName, strategy.vtSymbol, HISTORY_BAR, self.today - timedelta(days)))
+        
+        try:
+            self.historyCache.prefetch(requestList)
+        except Exception:
+            self.writeCtaLog(u'预读历史数据出错：%s' %traceback.format_exc())
+    
     #----------------------------------------------------------------------
     def writeCtaLog(self, content):
         """快速发出CTA模块日志事件"""
@@ -393,6 +633,13 @@ class CtaEngine(object):
             # 创建策略实例
             strategy = strategyClass(self, setting)  
             self.strategyDict[name] = strategy
+            self.strategyOrderDict[name] = set()
+            
+            # 创建耗时统计，策略内部调用的onBar通过包装函数统计
+            profiler = StrategyProfiler(name, setting.get('callbackBudget', DEFAULT_CALLBACK_BUDGET),
+                                        self.writeCtaLog)
+            self.profilerDict[name] = profiler
+            self.wrapOnBar(strategy)
             
             # 保存Tick映射关系
             if strategy.vtSymbol in self.tickStrategyDict:
@@ -402,6 +649,14 @@ class CtaEngine(object):
                 self.tickStrategyDict[strategy.vtSymbol] = l
             l.append(strategy)
             
+            # 配置了工作线程的策略，Tick推送放入工作线程的队列
+            workerName = setting.get('worker', '')
+            if workerName:
+                worker = self.getWorker(workerName)
+                worker.addStrategy(strategy)
+                self.strategyWorkerDict[name] = worker
+            self.tickHandlerDict.setdefault(strategy.vtSymbol, []).append(self.getTickHandler(strategy))
+            
             # 订阅合约
             contract = self.mainEngine.getContract(strategy.vtSymbol)
             if contract:
@@ -417,6 +672,172 @@ class CtaEngine(object):
             else:
                 self.writeCtaLog(u'%s的交易合约%s无法找到' %(name, strategy.vtSymbol))
 
+    #----------------------------------------------------------------------
+    def wrapOnBar(self, strategy):
+        """包装策略的onBar函数，统计耗时并记录最后一根K线的时间（用于检查点）"""
+        onBar = self.profilerDict[strategy.name].wrap('onBar', strategy.onBar)
+        
+        def wrapper(bar):
+            strategy.lastBarDatetime = bar.datetime
+            return onBar(bar)
+        
+        wrapper.__name__ = 'onBar'
+        wrapper.profile = onBar.profile
+        strategy.onBar = wrapper
+
+    #----------------------------------------------------------------------
+    def subscribeBar(self, strategy, interval, funcName):
+        """订阅引擎合成的K线，interval为周期（分钟），K线结束后推送到策略的funcName函数"""
+        generator = self.barGeneratorDict.get(strategy.vtSymbol, None)
+        if not generator:
+            generator = BarGenerator()
+            self.barGeneratorDict[strategy.vtSymbol] = generator
+        
+        def handler(xbar, bar):
+            func = strategy.__getattribute__(funcName)
+            barDatetime = bar.datetime
+            
+            # 检查点使用触发推送的1分钟K线时间，在策略所在的线程中处理完K线后再更新，
+            # 回放时bar来自回放用的临时合成器
+            def onSubscribedBar(xbar):
+                func(xbar)
+                strategy.lastBarDatetime = barDatetime
+            
+            onSubscribedBar.__name__ = funcName
+            if hasattr(func, 'profile'):
+                onSubscribedBar.profile = func.profile
+            
+            self.callStrategyFunc(strategy, onSubscribedBar, xbar)
+        
+        generator.addHandler(interval, strategy, handler)
+    
+    #----------------------------------------------------------------------
+    def replayBar(self, strategy, barList):
+        """用历史1分钟K线回放初始化策略，订阅了引擎K线时按订阅的周期推送，否则直接推送到onBar"""
+        generator = self.barGeneratorDict.get(strategy.vtSymbol, None)
+        if generator and generator.hasOwner(strategy):
+            generator.replay(strategy, barList)
+        else:
+            for bar in barList:
+                strategy.onBar(bar)
+
+    #----------------------------------------------------------------------
+    def getTickHandler(self, strategy):
+        """生成策略的Tick推送项(策略对象, onTick函数, 耗时统计对象)"""
+        worker = self.strategyWorkerDict.get(strategy.name, None)
+        if worker:
+            return (strategy, partial(worker.put, strategy, strategy.onTick), None)
+        else:
+            return (strategy, strategy.onTick, self.profilerDict[strategy.name].getProfile('onTick'))
+
+    #----------------------------------------------------------------------
+    def reloadStrategies(self, nameList):
+        """重新载入策略类所在的模块，并重新创建策略实例（策略热更新）"""
+        # 每个策略模块只重新载入一次
+        moduleDict = OrderedDict()
+        for name in nameList:
+            if name not in self.strategyDict:
+                self.writeCtaLog(u'策略实例不存在：%s' %name)
+                continue
+            
+            className = self.strategyDict[name].__class__.__name__
+            moduleName = STRATEGY_MODULE.get(className, None)
+            if not moduleName:
+                self.writeCtaLog(u'找不到策略类%s所在的模块' %className)
+                continue
+            moduleDict.setdefault(moduleName, []).append(name)
+        
+        for moduleName, l in moduleDict.items():
+            try:
+                reloadStrategyModule(moduleName)
+            except Exception:
+                self.writeCtaLog(u'重新载入策略模块%s出错：%s' %(moduleName, traceback.format_exc()))
+                continue
+            
+            for name in l:
+                self.replaceStrategy(name)
+    
+    #----------------------------------------------------------------------
+    def replaceStrategy(self, name):
+        """使用最新的策略类重新创建策略实例，复制原实例的参数、持仓和变量"""
+        oldStrategy = self.strategyDict[name]
+        strategyClass = STRATEGY_CLASS.get(oldStrategy.__class__.__name__, None)
+        if not strategyClass:
+            self.writeCtaLog(u'找不到策略类：%s' %oldStrategy.__class__.__name__)
+            return
+        
+        setting = {}
+        for param in oldStrategy.paramList:
+            setting[param] = oldStrategy.__getattribute__(param)
+        
+        try:
+            strategy = strategyClass(self, setting)
+        except Exception:
+            self.writeCtaLog(u'重新创建策略%s出错：%s' %(name, traceback.format_exc()))
+            return
+        
+        inited = oldStrategy.inited
+        trading = oldStrategy.trading
+        varDict = OrderedDict()
+        for key in oldStrategy.varList:
+            if key not in ('inited', 'trading'):
+                varDict[key] = oldStrategy.__getattribute__(key)
+        
+        with self.orderLock:
+            # 原实例停止交易，防止队列中尚未处理的回调继续发单
+            oldStrategy.trading = False
+            strategy.pos = oldStrategy.pos
+            
+            self.strategyDict[name] = strategy
+            
+            l = self.tickStrategyDict[strategy.vtSymbol]
+            l[l.index(oldStrategy)] = strategy
+            
+            self.wrapOnBar(strategy)
+            
+            generator = self.barGeneratorDict.get(strategy.vtSymbol, None)
+            if generator:
+                generator.removeHandler(oldStrategy)
+            
+            handlerList = self.tickHandlerDict[strategy.vtSymbol]
+            for i, handler in enumerate(handlerList):
+                if handler[0] is oldStrategy:
+                    handlerList[i] = self.getTickHandler(strategy)
+            
+            # 活动委托和停止单转移到新实例
+            for vtOrderID, s in self.orderStrategyDict.items():
+                if s is oldStrategy:
+                    self.orderStrategyDict[vtOrderID] = strategy
+            
+            for so in self.workingStopOrderDict.values():
+                if so.strategy is oldStrategy:
+                    so.strategy = strategy
+        
+        # 按原实例的状态重新初始化和启动，onInit中重新计算的变量以原实例为准
+        def onReload():
+            if inited:
+                strategy.inited = True
+                strategy.onInit()
+            
+            for key, value in varDict.items():
+                setattr(strategy, key, value)
+            
+            if trading:
+                strategy.trading = True
+                strategy.onStart()
+        
+        self.callStrategyFunc(strategy, onReload)
+        self.putStrategyEvent(name)
+        self.writeCtaLog(u'策略%s重新载入完成' %name)
+
+    #----------------------------------------------------------------------
+    def initStrategies(self, nameList):
+        """批量初始化策略，先并发预读所有策略的历史数据"""
+        self.prefetchHistory(nameList)
+        
+        for name in nameList:
+            self.initStrategy(name)
+
     #----------------------------------------------------------------------
     def initStrategy(self, name):
         """初始化策略"""
@@ -425,7 +846,14 @@ class CtaEngine(object):
             
             if not strategy.inited:
                 strategy.inited = True
-                self.callStrategyFunc(strategy, strategy.onInit)
+                
+                # 先恢复检查点，onInit中只需回放检查点之后的数据
+                def onInit():
+                    self.restoreCheckpoint(strategy)
+                    strategy.onInit()
+                    strategy.checkpointDatetime = None
+                
+                self.callStrategyFunc(strategy, onInit)
             else:
                 self.writeCtaLog(u'请勿重复初始化策略实例：%s' %name)
         else:
@@ -453,10 +881,8 @@ class CtaEngine(object):
                 strategy.trading = False
                 self.callStrategyFunc(strategy, strategy.onStop)
                 
-                # 对该策略发出的所有限价单进行撤单
-                for vtOrderID, s in self.orderStrategyDict.items():
-                    if s is strategy:
-                        self.cancelOrder(vtOrderID)
+                # 对该策略发出的所有限价单进行批量撤单
+                self.cancelOrders(list(self.strategyOrderDict[name]))
                 
                 # 对该策略发出的所有本地停止单撤单
                 for stopOrderID, so in self.workingStopOrderDict.items():
@@ -475,6 +901,14 @@ class CtaEngine(object):
                 setting = {}
                 for param in strategy.paramList:
                     setting[param] = strategy.__getattribute__(param)
+                
+                worker = self.strategyWorkerDict.get(strategy.name, None)
+                if worker:
+                    setting['worker'] = worker.name
+                
+                profiler = self.profilerDict.get(strategy.name, None)
+                if profiler and profiler.budget * 1000 != DEFAULT_CALLBACK_BUDGET:
+                    setting['callbackBudget'] = profiler.budget * 1000
                 l.append(setting)
             
             jsonL = json.dumps(l, indent=4)
@@ -521,6 +955,15 @@ class CtaEngine(object):
             self.writeCtaLog(u'策略实例不存在：' + name)    
             return None   
         
+    #----------------------------------------------------------------------
+    def getStrategyWorkingOrders(self, name):
+        """获取策略当前的活动委托号列表"""
+        if name in self.strategyOrderDict:
+            return list(self.strategyOrderDict[name])
+        else:
+            self.writeCtaLog(u'策略实例不存在：' + name)    
+            return []
+        
     #----------------------------------------------------------------------
     def putStrategyEvent(self, name):
         """触发策略状态变化事件（通常用于通知GUI更新）"""
@@ -529,21 +972,106 @@ class CtaEngine(object):
         
     #----------------------------------------------------------------------
     def callStrategyFunc(self, strategy, func, params=None):
-        """调用策略的函数，若触发异常则捕捉"""
+        """调用策略的函数，若触发异常则捕捉，配置了工作线程的策略放入工作线程中调用"""
+        worker = self.strategyWorkerDict.get(strategy.name, None)
+        if worker and not worker.isCurrentThread():
+            worker.put(strategy, func, params)
+            return
+        
+        start = time()
         try:
             if params:
                 func(params)
             else:
                 func()
         except Exception:
-            # 停止策略，修改状态为未初始化
-            strategy.trading = False
-            strategy.inited = False
-            
-            # 发出日志
-            content = '\n'.join([u'策略%s触发异常已停止' %strategy.name,
-                                traceback.format_exc()])
-            self.writeCtaLog(content)
+            self.processStrategyError(strategy)
+        
+        # 已经包装过的函数（如onBar）自身会统计耗时
+        profiler = self.profilerDict.get(strategy.name, None)
+        if profiler and not hasattr(func, 'profile'):
+            profiler.getProfile(func.__name__).update(time() - start)
+    
+    #----------------------------------------------------------------------
+    def getWorker(self, workerName):
+        """获取工作线程，不存在则创建并启动"""
+        worker = self.workerDict.get(workerName, None)
+        if not worker:
+            worker = CtaWorker(workerName, self)
+            worker.start()
+            self.workerDict[workerName] = worker
+        return worker
+    
+    #----------------------------------------------------------------------
+    def getWorkerMetrics(self):
+        """查询所有工作线程中策略的统计（队列深度、延迟等），返回字典，key为策略名称"""
+        d = OrderedDict()
+        for worker in self.workerDict.values():
+            d.update(worker.getMetrics())
+        return d
+    
+    #----------------------------------------------------------------------
+    def getStrategyProfile(self, name):
+        """获取策略的耗时统计（界面显示用，字段固定）"""
+        if name in self.profilerDict:
+            return self.profilerDict[name].getMonitorData()
+        else:
+            self.writeCtaLog(u'策略实例不存在：' + name)
+            return None
+    
+    #----------------------------------------------------------------------
+    def getProfileMetrics(self, name=''):
+        """查询策略的完整耗时统计（包括直方图），name为空时返回所有策略，key为策略名称"""
+        d = OrderedDict()
+        for strategyName, profiler in self.profilerDict.items():
+            if not name or strategyName == name:
+                d[strategyName] = profiler.getMetrics()
+        return d
+    
+    #----------------------------------------------------------------------
+    def processTimerEvent(self, event):
+        """定时滚动耗时统计的窗口，保存策略检查点，发出工作线程的统计日志"""
+        self.checkpointCount += 1
+        if self.checkpointCount >= self.checkpointInterval:
+            self.checkpointCount = 0
+            self.saveCheckpoints()
+        
+        self.profileCount += 1
+        if self.profileCount >= self.profileWindow:
+            self.profileCount = 0
+            for profiler in self.profilerDict.values():
+                profiler.rotate()
+        
+        if not self.workerDict:
+            return
+        
+        self.workerReportCount += 1
+        if self.workerReportCount < self.workerReportInterval:
+            return
+        self.workerReportCount = 0
+        
+        for name, metrics in self.getWorkerMetrics().items():
+            self.writeCtaLog(u'策略%s工作线程%s：队列%s，回调%s次，最近延迟%.4f秒，最大延迟%.4f秒，平均耗时%.4f秒'
+                             %(name, metrics['worker'], metrics['queueSize'], metrics['count'],
+                               metrics['lastLag'], metrics['maxLag'], metrics['avgCost']))
+    
+    #----------------------------------------------------------------------
+    def stop(self):
+        """停止所有工作线程"""
+        for worker in self.workerDict.values():
+            worker.stop()
+    
+    #----------------------------------------------------------------------
+    def processStrategyError(self, strategy):
+        """策略函数触发异常后停止策略，在except代码块中调用"""
+        # 停止策略，修改状态为未初始化
+        strategy.trading = False
+        strategy.inited = False
+        
+        # 发出日志
+        content = '\n'.join([u'策略%s触发异常已停止' %strategy.name,
+                            traceback.format_exc()])
+        self.writeCtaLog(content)
             
     #----------------------------------------------------------------------
     def savePosition(self):
@@ -561,6 +1089,39 @@ class CtaEngine(object):
             
             content = '策略%s持仓保存成功' %strategy.name
             self.writeCtaLog(content)
+        
+        self.saveCheckpoints()
+    
+    #----------------------------------------------------------------------
+    def saveCheckpoints(self):
+        """保存所有已初始化策略的检查点，在策略所在的线程中执行"""
+        for strategy in self.strategyDict.values():
+            if not strategy.inited or not strategy.stateList:
+                continue
+            
+            def checkpoint(strategy=strategy):
+                try:
+                    saveCheckpoint(self.checkpointPath, strategy)
+                except Exception:
+                    self.writeCtaLog(u'策略%s保存检查点出错：%s' %(strategy.name, traceback.format_exc()))
+            
+            self.callStrategyFunc(strategy, checkpoint)
+    
+    #----------------------------------------------------------------------
+    def restoreCheckpoint(self, strategy):
+        """恢复策略的检查点，早于初始化数据范围（initDays）的检查点不使用"""
+        days = getattr(strategy, 'initDays', 0)
+        earliestDatetime = self.today - timedelta(days) if days else None
+        
+        try:
+            checkpointDatetime = loadCheckpoint(self.checkpointPath, strategy, earliestDatetime)
+        except Exception:
+            self.writeCtaLog(u'策略%s读取检查点出错：%s' %(strategy.name, traceback.format_exc()))
+            return
+        
+        if checkpointDatetime:
+            strategy.checkpointDatetime = checkpointDatetime
+            self.writeCtaLog(u'策略%s从检查点恢复，K线时间%s' %(strategy.name, checkpointDatetime))
     
     #----------------------------------------------------------------------
     def loadPosition(self):
@@ -0,0 +1,142 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了CTA策略初始化时读取历史数据的共享缓存。
+
+1. 每个(数据库, 集合, 数据类型)一个缓存项，保存从某个开始时间到最新的数据（字典列表，按时间排序），
+   多个策略读取同一个合约时只查询一次数据库，之后直接从缓存中切片返回
+2. 请求的开始时间早于缓存时只查询缺少的部分，缓存超过REFRESH_INTERVAL秒未更新时只查询新增的部分
+3. 每个缓存项有独立的锁，同一个集合的并发请求会等待第一个请求完成后直接使用缓存，
+   不同集合的请求可以在多个线程中并发执行（prefetch）
+4. 缓存项数量超过上限时按最近最少使用（LRU）淘汰
+'''
+
+from bisect import bisect_left
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from threading import Lock
+from time import time
+
+
+# 数据类型
+HISTORY_BAR = 'bar'
+HISTORY_TICK = 'tick'
+
+# 缓存数据的刷新间隔（秒）
+REFRESH_INTERVAL = 10
+
+
+########################################################################
+class HistoryCacheEntry(object):
+    """单个集合的缓存数据"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.lock = Lock()
+        self.startDate = None           # 缓存数据的开始时间
+        self.dataList = []              # 数据字典列表，按时间排序
+        self.datetimeList = []          # 数据时间列表，用于二分查找
+        self.updateTime = 0             # 最近一次查询数据库的时间
+
+
+########################################################################
+class CtaHistoryCache(object):
+    """历史数据缓存"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, queryFunc, maxEntries=100, maxThreads=4):
+        """Constructor，queryFunc(dbName, collectionName, dataType, flt)返回满足条件的数据字典列表"""
+        self.queryFunc = queryFunc
+        self.maxEntries = maxEntries            # 缓存项数量上限
+        self.maxThreads = maxThreads            # 预先读取时的并发线程数
+
+        self.entryDict = OrderedDict()          # key为(dbName, collectionName, dataType)，按使用时间排序
+        self.lock = Lock()
+
+    #----------------------------------------------------------------------
+    def getEntry(self, key):
+        """获取缓存项，不存在则创建，同时淘汰最近最少使用的缓存项"""
+        with self.lock:
+            entry = self.entryDict.pop(key, None)
+            if not entry:
+                entry = HistoryCacheEntry()
+            self.entryDict[key] = entry
+
+            while len(self.entryDict) > self.maxEntries:
+                self.entryDict.popitem(last=False)
+
+            return entry
+
+    #----------------------------------------------------------------------
+    def query(self, dbName, collectionName, dataType, flt):
+        """查询数据库，返回按时间排序的数据字典列表"""
+        l = list(self.queryFunc(dbName, collectionName, dataType, flt))
+        l.sort(key=lambda d: d['datetime'])
+        return l
+
+    #----------------------------------------------------------------------
+    def load(self, dbName, collectionName, dataType, startDate):
+        """读取从startDate开始的数据，返回数据字典列表（只读，使用前需复制）"""
+        entry = self.getEntry((dbName, collectionName, dataType))
+
+        with entry.lock:
+            # 缓存为空或开始时间更早，查询缺少的部分
+            if entry.startDate is None or startDate < entry.startDate:
+                flt = {'datetime': {'$gte': startDate}}
+                if entry.startDate is not None:
+                    flt['datetime']['$lt'] = entry.startDate
+
+                l = self.query(dbName, collectionName, dataType, flt)
+                entry.dataList = l + entry.dataList
+                entry.datetimeList = [d['datetime'] for d in l] + entry.datetimeList
+                entry.startDate = startDate
+
+                if not entry.updateTime:
+                    entry.updateTime = time()
+
+            # 缓存过期，查询新增的部分
+            if time() - entry.updateTime > REFRESH_INTERVAL:
+                if entry.datetimeList:
+                    flt = {'datetime': {'$gt': entry.datetimeList[-1]}}
+                else:
+                    flt = {'datetime': {'$gte': entry.startDate}}
+
+                l = self.query(dbName, collectionName, dataType, flt)
+                entry.dataList.extend(l)
+                entry.datetimeList.extend([d['datetime'] for d in l])
+                entry.updateTime = time()
+
+            i = bisect_left(entry.datetimeList, startDate)
+            return entry.dataList[i:]
+
+    #----------------------------------------------------------------------
+    def prefetch(self, requestList):
+        """预先读取多个请求的数据，requestList为(dbName, collectionName, dataType, startDate)的列表
+        同一集合的请求合并为一个（取最早的开始时间），不同集合在多个线程中并发读取"""
+        requestDict = OrderedDict()
+        for dbName, collectionName, dataType, startDate in requestList:
+            key = (dbName, collectionName, dataType)
+            if key not in requestDict or startDate < requestDict[key]:
+                requestDict[key] = startDate
+
+        argsList = [key + (startDate,) for key, startDate in requestDict.items()]
+        if not argsList:
+            return
+
+        if self.maxThreads <= 1 or len(argsList) == 1:
+            for args in argsList:
+                self.load(*args)
+        else:
+            pool = ThreadPool(min(self.maxThreads, len(argsList)))
+            try:
+                pool.map(lambda args: self.load(*args), argsList)
+            finally:
+                pool.close()
+                pool.join()
+
+    #----------------------------------------------------------------------
+    def clear(self):
+        """清空缓存"""
+        with self.lock:
+            self.entryDict.clear()
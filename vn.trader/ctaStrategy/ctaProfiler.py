@@ -0,0 +1,191 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了CTA策略回调函数的耗时统计。
+
+1. 每个策略一个StrategyProfiler，其中每个回调函数（onTick、onBar、onOrder、onTrade等）
+   一个CallbackProfile，记录调用次数、总耗时、最大耗时以及按耗时分桶的直方图
+2. 直方图分为累计和最近两种，最近直方图由CtaEngine的定时器每隔一个统计窗口滚动一次，
+   包含最近一到两个窗口内的数据
+3. 回调耗时超过预算（策略配置中的callbackBudget，单位毫秒）时发出警告日志，
+   同一个回调的警告之间至少间隔WARNING_INTERVAL秒，期间的超时只计数
+4. 同时统计策略的发单、停止单和撤单数量
+'''
+
+from bisect import bisect_left
+from collections import OrderedDict
+from time import time
+
+
+# 直方图分桶的上限（毫秒），最后一个桶保存超过所有上限的数据
+HISTOGRAM_BOUNDS = [0.1, 0.5, 1, 5, 10, 50, 100, 500]
+HISTOGRAM_LABELS = ['<%sms' %bound for bound in HISTOGRAM_BOUNDS] + ['>=%sms' %HISTOGRAM_BOUNDS[-1]]
+
+# 默认回调耗时预算（毫秒）
+DEFAULT_CALLBACK_BUDGET = 50
+
+# 同一个回调两次超时警告之间的最小间隔（秒）
+WARNING_INTERVAL = 10
+
+# 在界面上显示的回调函数
+MONITOR_CALLBACK_LIST = ['onTick', 'onBar', 'onOrder', 'onTrade']
+
+
+########################################################################
+class CallbackProfile(object):
+    """单个回调函数的耗时统计"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, funcName, budget, warn):
+        """Constructor，budget为耗时预算（秒），warn为发出警告日志的函数"""
+        self.funcName = funcName
+        self.budget = budget
+        self.warn = warn
+
+        self.count = 0                  # 调用次数
+        self.totalCost = 0              # 总耗时（秒）
+        self.maxCost = 0                # 最大耗时（秒）
+        self.lastCost = 0               # 最近一次耗时（秒）
+        self.overCount = 0              # 超过预算的次数
+        self.lastWarningTime = 0        # 上一次发出警告的时间
+
+        self.bounds = [bound / 1000.0 for bound in HISTOGRAM_BOUNDS]
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)      # 累计直方图
+        self.currentHistogram = list(self.histogram)            # 当前窗口的直方图
+        self.lastHistogram = list(self.histogram)               # 上一个窗口的直方图
+
+    #----------------------------------------------------------------------
+    def update(self, cost):
+        """记录一次调用的耗时（秒）"""
+        self.count += 1
+        self.totalCost += cost
+        self.lastCost = cost
+        if cost > self.maxCost:
+            self.maxCost = cost
+
+        i = bisect_left(self.bounds, cost)
+        self.histogram[i] += 1
+        self.currentHistogram[i] += 1
+
+        if cost > self.budget:
+            self.overCount += 1
+
+            now = time()
+            if now - self.lastWarningTime >= WARNING_INTERVAL:
+                self.lastWarningTime = now
+                self.warn(self.funcName, cost, self.overCount)
+
+    #----------------------------------------------------------------------
+    def rotate(self):
+        """滚动统计窗口"""
+        self.lastHistogram = self.currentHistogram
+        self.currentHistogram = [0] * len(self.lastHistogram)
+
+    #----------------------------------------------------------------------
+    def getAvgCost(self):
+        """平均耗时（秒）"""
+        if self.count:
+            return self.totalCost / self.count
+        return 0
+
+    #----------------------------------------------------------------------
+    def getMetrics(self):
+        """查询统计数据，耗时单位为毫秒"""
+        recent = [a + b for a, b in zip(self.lastHistogram, self.currentHistogram)]
+
+        d = OrderedDict()
+        d['count'] = self.count
+        d['avgCost'] = self.getAvgCost() * 1000
+        d['maxCost'] = self.maxCost * 1000
+        d['lastCost'] = self.lastCost * 1000
+        d['overCount'] = self.overCount
+        d['histogram'] = OrderedDict(zip(HISTOGRAM_LABELS, self.histogram))
+        d['recentHistogram'] = OrderedDict(zip(HISTOGRAM_LABELS, recent))
+        return d
+
+
+########################################################################
+class StrategyProfiler(object):
+    """策略的耗时和委托统计"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, strategyName, budget, writeLog):
+        """Constructor，budget为耗时预算（毫秒），writeLog为写日志的函数"""
+        self.strategyName = strategyName
+        self.budget = budget / 1000.0
+        self.writeLog = writeLog
+
+        self.profileDict = OrderedDict()        # key为回调函数名，value为CallbackProfile对象
+        for funcName in MONITOR_CALLBACK_LIST:
+            self.getProfile(funcName)
+
+        self.orderCount = 0             # 发单数量
+        self.stopOrderCount = 0         # 停止单数量
+        self.cancelCount = 0            # 撤单数量
+
+    #----------------------------------------------------------------------
+    def getProfile(self, funcName):
+        """获取回调函数的统计对象，不存在则创建"""
+        profile = self.profileDict.get(funcName, None)
+        if not profile:
+            profile = CallbackProfile(funcName, self.budget, self.warn)
+            self.profileDict[funcName] = profile
+        return profile
+
+    #----------------------------------------------------------------------
+    def wrap(self, funcName, func):
+        """包装策略的函数，调用时自动统计耗时"""
+        profile = self.getProfile(funcName)
+
+        def wrapper(*args):
+            start = time()
+            try:
+                return func(*args)
+            finally:
+                profile.update(time() - start)
+
+        wrapper.__name__ = funcName
+        wrapper.profile = profile       # 标记已经统计耗时，callStrategyFunc中不再重复统计
+        return wrapper
+
+    #----------------------------------------------------------------------
+    def warn(self, funcName, cost, overCount):
+        """回调耗时超过预算的警告"""
+        self.writeLog(u'策略%s的%s耗时%.2f毫秒，超过预算%.2f毫秒，累计超时%s次'
+                      %(self.strategyName, funcName, cost * 1000, self.budget * 1000, overCount))
+
+    #----------------------------------------------------------------------
+    def rotate(self):
+        """滚动所有回调的统计窗口"""
+        for profile in self.profileDict.values():
+            profile.rotate()
+
+    #----------------------------------------------------------------------
+    def getMonitorData(self):
+        """查询在界面上显示的统计数据（字段固定）"""
+        d = OrderedDict()
+        for funcName in MONITOR_CALLBACK_LIST:
+            profile = self.profileDict[funcName]
+            d[funcName + '.count'] = profile.count
+            d[funcName + '.avg(ms)'] = '%.3f' %(profile.getAvgCost() * 1000)
+            d[funcName + '.max(ms)'] = '%.3f' %(profile.maxCost * 1000)
+            d[funcName + '.over'] = profile.overCount
+        d['orders'] = self.orderCount
+        d['stopOrders'] = self.stopOrderCount
+        d['cancels'] = self.cancelCount
+        return d
+
+    #----------------------------------------------------------------------
+    def getMetrics(self):
+        """查询完整的统计数据，包括所有回调函数的直方图"""
+        d = OrderedDict()
+        d['budget'] = self.budget * 1000
+        d['orderCount'] = self.orderCount
+        d['stopOrderCount'] = self.stopOrderCount
+        d['cancelCount'] = self.cancelCount
+
+        callbackDict = OrderedDict()
+        for funcName, profile in self.profileDict.items():
+            callbackDict[funcName] = profile.getMetrics()
+        d['callbacks'] = callbackDict
+        return d
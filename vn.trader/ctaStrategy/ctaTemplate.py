@@ -41,6 +41,17 @@ class CtaTemplate(object):
     varList = ['inited',
                'trading',
                'pos']
+    
+    # 状态列表，保存了检查点中需要保存的状态名称（如指标计算用的数组），
+    # 为空时不保存检查点，见ctaCheckpoint.py
+    stateList = []
+    
+    # 最后一根K线的时间，用于检查点，由引擎在调用onBar时更新，
+    # 不通过onBar处理K线的策略（如使用CtaLineBar的回调）需要自行更新
+    lastBarDatetime = None
+    
+    # 从检查点恢复状态时检查点的K线时间，loadBar和loadTick只返回该时间之后的数据
+    checkpointDatetime = None
 
     #----------------------------------------------------------------------
     def __init__(self, ctaEngine, setting):
@@ -84,6 +95,12 @@ class CtaTemplate(object):
         """收到成交推送（必须由用户继承实现）"""
         raise NotImplementedError
     
+    #----------------------------------------------------------------------
+    def onQueueOrder(self, queueID, vtOrderID):
+        """风控排队的委托发出（vtOrderID为实际委托号）或被拒绝（vtOrderID为空字符串），
+        需要自行维护委托号列表的策略可以继承实现"""
+        pass
+    
     #----------------------------------------------------------------------
     def onBar(self, bar):
         """收到Bar推送（必须由用户继承实现）"""
@@ -135,6 +152,23 @@ class CtaTemplate(object):
         else:
             self.ctaEngine.cancelOrder(vtOrderID)
     
+    #----------------------------------------------------------------------
+    def cancelOrders(self, vtOrderIDList):
+        """批量撤单，停止单逐个撤销，限价单一次性发出"""
+        limitOrderList = []
+        
+        for vtOrderID in vtOrderIDList:
+            if not vtOrderID:
+                continue
+            
+            if STOPORDERPREFIX in vtOrderID:
+                self.ctaEngine.cancelStopOrder(vtOrderID)
+            else:
+                limitOrderList.append(vtOrderID)
+        
+        if limitOrderList:
+            self.ctaEngine.cancelOrders(limitOrderList)
+    
     #----------------------------------------------------------------------
     def insertTick(self, tick):
         """向数据库中插入tick数据"""
@@ -147,13 +181,30 @@ class CtaTemplate(object):
         
     #----------------------------------------------------------------------
     def loadTick(self, days):
-        """读取tick数据"""
-        return self.ctaEngine.loadTick(self.tickDbName, self.vtSymbol, days)
+        """读取tick数据，从检查点恢复时只返回检查点之后的数据"""
+        l = self.ctaEngine.loadTick(self.tickDbName, self.vtSymbol, days)
+        if self.checkpointDatetime:
+            l = [tick for tick in l if tick.datetime > self.checkpointDatetime]
+        return l
     
     #----------------------------------------------------------------------
     def loadBar(self, days):
-        """读取bar数据"""
-        return self.ctaEngine.loadBar(self.barDbName, self.vtSymbol, days)
+        """读取bar数据，从检查点恢复时只返回检查点之后的数据"""
+        l = self.ctaEngine.loadBar(self.barDbName, self.vtSymbol, days)
+        if self.checkpointDatetime:
+            l = [bar for bar in l if bar.datetime > self.checkpointDatetime]
+        return l
+    
+    #----------------------------------------------------------------------
+    def subscribeBar(self, interval=1, funcName='onBar'):
+        """订阅引擎统一合成的K线（在__init__中调用），interval为周期（分钟），
+        K线结束后推送到funcName对应的函数"""
+        self.ctaEngine.subscribeBar(self, interval, funcName)
+    
+    #----------------------------------------------------------------------
+    def replayBar(self, barList):
+        """用历史1分钟K线回放初始化，按订阅的周期推送"""
+        self.ctaEngine.replayBar(self, barList)
     
     #----------------------------------------------------------------------
     def writeCtaLog(self, content):
@@ -231,8 +282,17 @@ class TargetPosTemplate(CtaTemplate):
     #----------------------------------------------------------------------
     def onOrder(self, order):
         """收到委托推送"""
-        if order.status == STATUS_ALLTRADED or order.status == STATUS_CANCELLED:
-            self.orderList.remove(order.vtOrderID)
+        if order.status in (STATUS_ALLTRADED, STATUS_CANCELLED, STATUS_REJECTED):
+            if order.vtOrderID in self.orderList:
+                self.orderList.remove(order.vtOrderID)
+    
+    #----------------------------------------------------------------------
+    def onQueueOrder(self, queueID, vtOrderID):
+        """风控排队的委托发出或被拒绝"""
+        if queueID in self.orderList:
+            self.orderList.remove(queueID)
+            if vtOrderID:
+                self.orderList.append(vtOrderID)
     
     #----------------------------------------------------------------------
     def setTargetPos(self, targetPos):
@@ -245,8 +305,7 @@ class TargetPosTemplate(CtaTemplate):
     def trade(self):
         """执行交易"""
         # 先撤销之前的委托
-        for vtOrderID in self.orderList:
-            self.cancelOrder(vtOrderID)
+        self.cancelOrders(self.orderList)
         self.orderList = []
         
         # 如果目标仓位和实际仓位一致，则不进行任何操作
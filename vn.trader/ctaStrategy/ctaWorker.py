@@ -0,0 +1,137 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了CTA策略的工作线程。
+
+在CTA_setting.json中为策略配置worker（工作线程名称）后，该策略的所有回调函数
+（onInit、onStart、onStop、onTick、onOrder、onTrade等）都会放入对应工作线程的队列中执行，
+配置相同worker的多个策略共享一个线程，没有配置的策略仍然在事件引擎线程中直接执行。
+这样耗时较长的策略不会阻塞其他策略以及委托、成交的处理。
+
+策略在工作线程中调用的发单、撤单函数通过CtaEngine的委托锁串行执行，风控模块的排队委托和流控令牌
+由RmEngine的队列锁保护，返回值和直接调用时一致。
+'''
+
+from collections import OrderedDict
+from Queue import Queue, Empty
+from threading import Thread, Lock, currentThread
+from time import time
+
+
+########################################################################
+class CtaWorker(object):
+    """策略工作线程"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, name, ctaEngine):
+        """Constructor"""
+        self.name = name
+        self.ctaEngine = ctaEngine
+
+        self.active = False                     # 工作状态
+        self.queue = Queue()                    # 回调函数队列
+        self.thread = Thread(target=self.run, name='CtaWorker.' + name)
+        self.thread.daemon = True
+
+        # 各策略的运行统计，key为策略名称
+        self.metricsDict = OrderedDict()
+        self.metricsLock = Lock()               # 队列中回调数量的锁，放入和执行在不同线程中
+
+    #----------------------------------------------------------------------
+    def start(self):
+        """启动"""
+        self.active = True
+        self.thread.start()
+
+    #----------------------------------------------------------------------
+    def stop(self):
+        """停止，等待队列中已有的回调执行完毕"""
+        if self.active:
+            self.active = False
+            self.thread.join()
+
+    #----------------------------------------------------------------------
+    def isCurrentThread(self):
+        """检查当前是否在该工作线程中"""
+        return currentThread() is self.thread
+
+    #----------------------------------------------------------------------
+    def addStrategy(self, strategy):
+        """添加策略"""
+        d = OrderedDict()
+        d['count'] = 0              # 执行的回调数量
+        d['pending'] = 0            # 队列中等待执行的回调数量
+        d['lastLag'] = 0            # 最近一次回调从放入队列到开始执行的延迟（秒）
+        d['maxLag'] = 0             # 最大延迟（秒）
+        d['totalCost'] = 0          # 回调执行的总耗时（秒）
+        self.metricsDict[strategy.name] = d
+
+    #----------------------------------------------------------------------
+    def put(self, strategy, func, params=None):
+        """放入策略的回调函数"""
+        d = self.metricsDict.get(strategy.name, None)
+        if d is not None:
+            with self.metricsLock:
+                d['pending'] += 1
+
+        self.queue.put((strategy, func, params, time()))
+
+    #----------------------------------------------------------------------
+    def run(self):
+        """运行"""
+        while self.active:
+            try:
+                item = self.queue.get(block=True, timeout=1)
+            except Empty:
+                continue
+            self.process(item)
+
+        # 退出前执行队列中剩余的回调
+        while True:
+            try:
+                item = self.queue.get(block=False)
+            except Empty:
+                break
+            self.process(item)
+
+    #----------------------------------------------------------------------
+    def process(self, item):
+        """执行一个回调，并更新统计"""
+        strategy, func, params, putTime = item
+
+        d = self.metricsDict.get(strategy.name, None)
+        if d is not None:
+            with self.metricsLock:
+                d['pending'] -= 1
+
+        start = time()
+        self.ctaEngine.callStrategyFunc(strategy, func, params)
+        end = time()
+
+        if d is not None:
+            lag = start - putTime
+            d['count'] += 1
+            d['lastLag'] = lag
+            d['maxLag'] = max(d['maxLag'], lag)
+            d['totalCost'] += end - start
+
+    #----------------------------------------------------------------------
+    def getMetrics(self):
+        """查询各策略的统计，返回字典，key为策略名称，queueSize为该策略在队列中等待执行的回调数量"""
+        workerQueueSize = self.queue.qsize()
+
+        result = OrderedDict()
+        for name, d in self.metricsDict.items():
+            metrics = OrderedDict()
+            metrics['worker'] = self.name
+            metrics['queueSize'] = d['pending']
+            metrics['workerQueueSize'] = workerQueueSize
+            metrics['count'] = d['count']
+            metrics['lastLag'] = d['lastLag']
+            metrics['maxLag'] = d['maxLag']
+            if d['count']:
+                metrics['avgCost'] = d['totalCost'] / d['count']
+            else:
+                metrics['avgCost'] = 0
+            result[name] = metrics
+        return result
@@ -3,6 +3,7 @@
 INIT = u'初始化'
 START = u'启动'
 STOP = u'停止'
+RELOAD = u'重新载入'
 
 CTA_ENGINE_STARTED = u'CTA引擎启动成功'
 
@@ -3,6 +3,7 @@
 INIT = u'Init'
 START = u'Start'
 STOP = u'Stop'
+RELOAD = u'Reload'
 
 CTA_ENGINE_STARTED = u'CTA engine started.'
 
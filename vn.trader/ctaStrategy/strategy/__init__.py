@@ -1,16 +1,37 @@
 # encoding: UTF-8
 
 '''
-动态载入所有的策略类
+动态载入所有的策略类，并支持重新载入单个策略模块（策略热更新）
 '''
 
 import os
+import sys
 import importlib
 
 
 # 用来保存策略类的字典
 STRATEGY_CLASS = {}
 
+# 策略类所在模块的字典，key为策略类名称，value为模块名称
+STRATEGY_MODULE = {}
+
+
+#----------------------------------------------------------------------
+def registerStrategyClass(module):
+    """遍历模块下的对象，只有名称中包含'Strategy'的才是策略类"""
+    for k in dir(module):
+        if 'Strategy' in k:
+            v = module.__getattribute__(k)
+            STRATEGY_CLASS[k] = v
+            STRATEGY_MODULE[k] = getattr(v, '__module__', module.__name__)
+
+#----------------------------------------------------------------------
+def reloadStrategyModule(moduleName):
+    """重新载入策略模块，更新其中的策略类"""
+    module = reload(sys.modules[moduleName])
+    registerStrategyClass(module)
+
+
 # 获取目录路径
 path = os.path.abspath(os.path.dirname(__file__))
 
@@ -24,9 +45,4 @@ for root, subdirs, files in os.walk(path):
             
             # 使用importlib动态载入模块
             module = importlib.import_module(moduleName)
-            
-            # 遍历模块下的对象，只有名称中包含'Strategy'的才是策略类
-            for k in dir(module):
-                if 'Strategy' in k:
-                    v = module.__getattribute__(k)
-                    STRATEGY_CLASS[k] = v
+            registerStrategyClass(module)
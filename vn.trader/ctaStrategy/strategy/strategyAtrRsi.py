@@ -5,16 +5,14 @@
 
 注意事项：
 1. 作者不对交易盈利做任何保证，策略代码仅供参考
-2. 本策略需要用到talib，没有安装的用户请先参考www.vnpy.org上的教程安装
+2. 指标使用ctaArrayManager中的增量计算，不再依赖talib
 3. 将IF0000_1min.csv用ctaHistoryData.py导入MongoDB后，直接运行本文件即可回测策略
 
 """
 
-import talib
-import numpy as np
-
 from ctaBase import *
 from ctaTemplate import CtaTemplate
+from ctaArrayManager import ArrayManager, SmaIndicator
 
 
 ########################################################################
@@ -33,17 +31,11 @@ class AtrRsiStrategy(CtaTemplate):
     fixedSize = 1           # 每次交易的数量
 
     # 策略变量
-    bar = None                  # K线对象
-    barMinute = EMPTY_STRING    # K线当前的分钟
-
     bufferSize = 100                    # 需要缓存的数据的大小
-    bufferCount = 0                     # 目前已经缓存了的数据的计数
-    highArray = np.zeros(bufferSize)    # K线最高价的数组
-    lowArray = np.zeros(bufferSize)     # K线最低价的数组
-    closeArray = np.zeros(bufferSize)   # K线收盘价的数组
+    am = None                           # K线数据和指标管理
     
-    atrCount = 0                        # 目前已经缓存了的ATR的计数
-    atrArray = np.zeros(bufferSize)     # ATR指标的数组
+    atrCount = 0                        # 目前已经计算了的ATR的计数
+    atrMaIndicator = None               # ATR移动平均的指标对象
     atrValue = 0                        # 最新的ATR指标数值
     atrMa = 0                           # ATR移动平均的数值
 
@@ -75,16 +67,31 @@ class AtrRsiStrategy(CtaTemplate):
                'rsiValue',
                'rsiBuy',
                'rsiSell']  
+    
+    # 状态列表，保存了检查点中需要保存的状态名称
+    stateList = ['am',
+                 'atrCount',
+                 'atrMaIndicator',
+                 'atrValue',
+                 'atrMa',
+                 'rsiValue',
+                 'intraTradeHigh',
+                 'intraTradeLow']
 
     #----------------------------------------------------------------------
     def __init__(self, ctaEngine, setting):
         """Constructor"""
         super(AtrRsiStrategy, self).__init__(ctaEngine, setting)
         
+        # 订阅引擎合成的K线
+        self.subscribeBar()
+        
         # 注意策略类中的可变对象属性（通常是list和dict等），在策略初始化时需要重新创建，
         # 否则会出现多个策略实例之间数据共享的情况，有可能导致潜在的策略逻辑错误风险，
         # 策略类中的这些可变对象属性可以选择不写，全都放在__init__下面，写主要是为了阅读
         # 策略时方便（更多是个编程习惯的选择）        
+        self.am = ArrayManager(self.bufferSize)
+        self.atrMaIndicator = SmaIndicator(self.atrMaLength)
 
     #----------------------------------------------------------------------
     def onInit(self):
@@ -97,8 +104,7 @@ class AtrRsiStrategy(CtaTemplate):
 
         # 载入历史数据，并采用回放计算的方式初始化策略数值
         initData = self.loadBar(self.initDays)
-        for bar in initData:
-            self.onBar(bar)
+        self.replayBar(initData)
 
         self.putEvent()
 
@@ -117,35 +123,8 @@ class AtrRsiStrategy(CtaTemplate):
     #----------------------------------------------------------------------
     def onTick(self, tick):
         """收到行情TICK推送（必须由用户继承实现）"""
-        # 计算K线
-        tickMinute = tick.datetime.minute
-
-        if tickMinute != self.barMinute:    
-            if self.bar:
-                self.onBar(self.bar)
-
-            bar = CtaBarData()              
-            bar.vtSymbol = tick.vtSymbol
-            bar.symbol = tick.symbol
-            bar.exchange = tick.exchange
-
-            bar.open = tick.lastPrice
-            bar.high = tick.lastPrice
-            bar.low = tick.lastPrice
-            bar.close = tick.lastPrice
-
-            bar.date = tick.date
-            bar.time = tick.time
-            bar.datetime = tick.datetime    # K线的时间设为第一个Tick的时间
-
-            self.bar = bar                  # 这种写法为了减少一层访问，加快速度
-            self.barMinute = tickMinute     # 更新当前的分钟
-        else:                               # 否则继续累加新的K线
-            bar = self.bar                  # 写法同样为了加快速度
-
-            bar.high = max(bar.high, tick.lastPrice)
-            bar.low = min(bar.low, tick.lastPrice)
-            bar.close = tick.lastPrice
+        # K线由引擎统一合成后推送到onBar，这里不需要处理
+        pass
 
     #----------------------------------------------------------------------
     def onBar(self, bar):
@@ -156,34 +135,20 @@ class AtrRsiStrategy(CtaTemplate):
         self.orderList = []
 
         # 保存K线数据
-        self.closeArray[0:self.bufferSize-1] = self.closeArray[1:self.bufferSize]
-        self.highArray[0:self.bufferSize-1] = self.highArray[1:self.bufferSize]
-        self.lowArray[0:self.bufferSize-1] = self.lowArray[1:self.bufferSize]
-        
-        self.closeArray[-1] = bar.close
-        self.highArray[-1] = bar.high
-        self.lowArray[-1] = bar.low
-        
-        self.bufferCount += 1
-        if self.bufferCount < self.bufferSize:
+        am = self.am
+        am.updateBar(bar)
+        if not am.inited:
             return
 
         # 计算指标数值
-        self.atrValue = talib.ATR(self.highArray, 
-                                  self.lowArray, 
-                                  self.closeArray,
-                                  self.atrLength)[-1]
-        self.atrArray[0:self.bufferSize-1] = self.atrArray[1:self.bufferSize]
-        self.atrArray[-1] = self.atrValue
+        self.atrValue = am.atr(self.atrLength)
+        self.atrMa = self.atrMaIndicator.update(self.atrValue)
 
         self.atrCount += 1
         if self.atrCount < self.bufferSize:
             return
 
-        self.atrMa = talib.MA(self.atrArray, 
-                              self.atrMaLength)[-1]
-        self.rsiValue = talib.RSI(self.closeArray, 
-                                  self.rsiLength)[-1]
+        self.rsiValue = am.rsi(self.rsiLength)
 
         # 判断是否要进行交易
         
@@ -24,8 +24,6 @@ class DualThrustStrategy(CtaTemplate):
     initDays = 10
 
     # 策略变量
-    bar = None                  # K线对象
-    barMinute = EMPTY_STRING    # K线当前的分钟
     barList = []                # K线对象的列表
 
     dayOpen = 0
@@ -58,12 +56,26 @@ class DualThrustStrategy(CtaTemplate):
                'longEntry',
                'shortEntry',
                'exitTime']  
+    
+    # 状态列表，保存了检查点中需要保存的状态名称
+    stateList = ['barList',
+                 'dayOpen',
+                 'dayHigh',
+                 'dayLow',
+                 'range',
+                 'longEntry',
+                 'shortEntry',
+                 'longEntered',
+                 'shortEntered']
 
     #----------------------------------------------------------------------
     def __init__(self, ctaEngine, setting):
         """Constructor"""
         super(DualThrustStrategy, self).__init__(ctaEngine, setting) 
         
+        # 订阅引擎合成的K线
+        self.subscribeBar()
+        
         self.barList = []
 
     #----------------------------------------------------------------------
@@ -73,8 +85,7 @@ class DualThrustStrategy(CtaTemplate):
     
         # 载入历史数据，并采用回放计算的方式初始化策略数值
         initData = self.loadBar(self.initDays)
-        for bar in initData:
-            self.onBar(bar)
+        self.replayBar(initData)
 
         self.putEvent()
 
@@ -93,35 +104,8 @@ class DualThrustStrategy(CtaTemplate):
     #----------------------------------------------------------------------
     def onTick(self, tick):
         """收到行情TICK推送（必须由用户继承实现）"""
-        # 计算K线
-        tickMinute = tick.datetime.minute
-
-        if tickMinute != self.barMinute:    
-            if self.bar:
-                self.onBar(self.bar)
-
-            bar = CtaBarData()              
-            bar.vtSymbol = tick.vtSymbol
-            bar.symbol = tick.symbol
-            bar.exchange = tick.exchange
-
-            bar.open = tick.lastPrice
-            bar.high = tick.lastPrice
-            bar.low = tick.lastPrice
-            bar.close = tick.lastPrice
-
-            bar.date = tick.date
-            bar.time = tick.time
-            bar.datetime = tick.datetime    # K线的时间设为第一个Tick的时间
-
-            self.bar = bar                  # 这种写法为了减少一层访问，加快速度
-            self.barMinute = tickMinute     # 更新当前的分钟
-        else:                               # 否则继续累加新的K线
-            bar = self.bar                  # 写法同样为了加快速度
-
-            bar.high = max(bar.high, tick.lastPrice)
-            bar.low = min(bar.low, tick.lastPrice)
-            bar.close = tick.lastPrice
+        # K线由引擎统一合成后推送到onBar，这里不需要处理
+        pass
 
     #----------------------------------------------------------------------
     def onBar(self, bar):
@@ -6,7 +6,7 @@
 
 注意事项：
 1. 作者不对交易盈利做任何保证，策略代码仅供参考
-2. 本策略需要用到talib，没有安装的用户请先参考www.vnpy.org上的教程安装
+2. 指标使用ctaArrayManager中的增量计算，不再依赖talib
 3. 将IF0000_1min.csv用ctaHistoryData.py导入MongoDB后，直接运行本文件即可回测策略
 """
 
@@ -14,9 +14,7 @@ from __future__ import division
 
 from ctaBase import *
 from ctaTemplate import CtaTemplate
-
-import talib
-import numpy as np
+from ctaArrayManager import ArrayManager
 
 
 ########################################################################
@@ -33,15 +31,8 @@ class KkStrategy(CtaTemplate):
     fixedSize = 1           # 每次交易的数量
 
     # 策略变量
-    bar = None                  # 1分钟K线对象
-    barMinute = EMPTY_STRING    # K线当前的分钟
-    fiveBar = None              # 1分钟K线对象
-
     bufferSize = 100                    # 需要缓存的数据的大小
-    bufferCount = 0                     # 目前已经缓存了的数据的计数
-    highArray = np.zeros(bufferSize)    # K线最高价的数组
-    lowArray = np.zeros(bufferSize)     # K线最低价的数组
-    closeArray = np.zeros(bufferSize)   # K线收盘价的数组
+    am = None                           # K线数据和指标管理
     
     atrValue = 0                        # 最新的ATR指标数值
     kkMid = 0                           # KK通道中轨
@@ -70,12 +61,26 @@ class KkStrategy(CtaTemplate):
                'kkMid',
                'kkUp',
                'kkDown']  
+    
+    # 状态列表，保存了检查点中需要保存的状态名称
+    stateList = ['am',
+                 'atrValue',
+                 'kkMid',
+                 'kkUp',
+                 'kkDown',
+                 'intraTradeHigh',
+                 'intraTradeLow']
 
     #----------------------------------------------------------------------
     def __init__(self, ctaEngine, setting):
         """Constructor"""
         super(KkStrategy, self).__init__(ctaEngine, setting)
         
+        # 订阅引擎合成的K线
+        self.subscribeBar(5, 'onFiveBar')
+        
+        self.am = ArrayManager(self.bufferSize)
+        
     #----------------------------------------------------------------------
     def onInit(self):
         """初始化策略（必须由用户继承实现）"""
@@ -83,8 +88,7 @@ class KkStrategy(CtaTemplate):
         
         # 载入历史数据，并采用回放计算的方式初始化策略数值
         initData = self.loadBar(self.initDays)
-        for bar in initData:
-            self.onBar(bar)
+        self.replayBar(initData)
 
         self.putEvent()
 
@@ -103,79 +107,15 @@ class KkStrategy(CtaTemplate):
     #----------------------------------------------------------------------
     def onTick(self, tick):
         """收到行情TICK推送（必须由用户继承实现）"""
-        # 聚合为1分钟K线
-        tickMinute = tick.datetime.minute
-
-        if tickMinute != self.barMinute:  
-            if self.bar:
-                self.onBar(self.bar)
-
-            bar = CtaBarData()              
-            bar.vtSymbol = tick.vtSymbol
-            bar.symbol = tick.symbol
-            bar.exchange = tick.exchange
-
-            bar.open = tick.lastPrice
-            bar.high = tick.lastPrice
-            bar.low = tick.lastPrice
-            bar.close = tick.lastPrice
-
-            bar.date = tick.date
-            bar.time = tick.time
-            bar.datetime = tick.datetime    # K线的时间设为第一个Tick的时间
-
-            self.bar = bar                  # 这种写法为了减少一层访问，加快速度
-            self.barMinute = tickMinute     # 更新当前的分钟
-        else:                               # 否则继续累加新的K线
-            bar = self.bar                  # 写法同样为了加快速度
-
-            bar.high = max(bar.high, tick.lastPrice)
-            bar.low = min(bar.low, tick.lastPrice)
-            bar.close = tick.lastPrice
+        # 5分钟K线由引擎统一合成后推送到onFiveBar，这里不需要处理
+        pass
 
     #----------------------------------------------------------------------
     def onBar(self, bar):
         """收到Bar推送（必须由用户继承实现）"""
-        # 如果当前是一个5分钟走完
-        if bar.datetime.minute % 5 == 0:
-            # 如果已经有聚合5分钟K线
-            if self.fiveBar:
-                # 将最新分钟的数据更新到目前5分钟线中
-                fiveBar = self.fiveBar
-                fiveBar.high = max(fiveBar.high, bar.high)
-                fiveBar.low = min(fiveBar.low, bar.low)
-                fiveBar.close = bar.close
-                
-                # 推送5分钟线数据
-                self.onFiveBar(fiveBar)
-                
-                # 清空5分钟线数据缓存
-                self.fiveBar = None
-        else:
-            # 如果没有缓存则新建
-            if not self.fiveBar:
-                fiveBar = CtaBarData()
-                
-                fiveBar.vtSymbol = bar.vtSymbol
-                fiveBar.symbol = bar.symbol
-                fiveBar.exchange = bar.exchange
-            
-                fiveBar.open = bar.open
-                fiveBar.high = bar.high
-                fiveBar.low = bar.low
-                fiveBar.close = bar.close
-            
-                fiveBar.date = bar.date
-                fiveBar.time = bar.time
-                fiveBar.datetime = bar.datetime 
-                
-                self.fiveBar = fiveBar
-            else:
-                fiveBar = self.fiveBar
-                fiveBar.high = max(fiveBar.high, bar.high)
-                fiveBar.low = min(fiveBar.low, bar.low)
-                fiveBar.close = bar.close
-    
+        # 只订阅了5分钟K线，这里不需要处理
+        pass
+
     #----------------------------------------------------------------------
     def onFiveBar(self, bar):
         """收到5分钟K线"""
@@ -185,26 +125,14 @@ class KkStrategy(CtaTemplate):
         self.orderList = []
     
         # 保存K线数据
-        self.closeArray[0:self.bufferSize-1] = self.closeArray[1:self.bufferSize]
-        self.highArray[0:self.bufferSize-1] = self.highArray[1:self.bufferSize]
-        self.lowArray[0:self.bufferSize-1] = self.lowArray[1:self.bufferSize]
-    
-        self.closeArray[-1] = bar.close
-        self.highArray[-1] = bar.high
-        self.lowArray[-1] = bar.low
-    
-        self.bufferCount += 1
-        if self.bufferCount < self.bufferSize:
+        am = self.am
+        am.updateBar(bar)
+        if not am.inited:
             return
     
         # 计算指标数值
-        self.atrValue = talib.ATR(self.highArray, 
-                                  self.lowArray, 
-                                  self.closeArray,
-                                  self.kkLength)[-1]
-        self.kkMid = talib.MA(self.closeArray, self.kkLength)[-1]
-        self.kkUp = self.kkMid + self.atrValue * self.kkDev
-        self.kkDown = self.kkMid - self.atrValue * self.kkDev
+        self.kkMid, self.kkUp, self.kkDown = am.keltner(self.kkLength, self.kkDev)
+        self.atrValue = am.atr(self.kkLength)
     
         # 判断是否要进行交易
     
@@ -0,0 +1,134 @@
+# encoding: UTF-8
+
+'''
+ArrayManager增量指标和talib的对比测试，在vn.trader/ctaStrategy目录下运行：
+python testCtaArrayManager.py
+'''
+
+import os
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+import talib
+
+# vn.trader目录需要在ctaStrategy目录之前，避免同名的language包冲突
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ctaBase import CtaBarData
+from ctaArrayManager import ArrayManager
+
+
+SIZE = 50
+
+
+#----------------------------------------------------------------------
+def makeBarList(count, seed):
+    """生成随机游走的1分钟K线，中间有一段价格不变的K线（3030.6不能用二进制浮点数精确表示）"""
+    random.seed(seed)
+    start = datetime(2017, 6, 1, 9, 0)
+    price = 3000.0
+    barList = []
+    for i in range(count):
+        bar = CtaBarData()
+        bar.vtSymbol = 'IF1706'
+        bar.datetime = start + timedelta(minutes=i)
+        bar.open = price
+
+        if 105 <= i < 130:
+            price = 3030.6
+            bar.open = bar.close = bar.high = bar.low = price
+        else:
+            price = round((price + random.gauss(0, 3)) / 0.2) * 0.2
+            bar.close = price
+            bar.high = max(bar.open, bar.close) + random.choice([0, 0.2, 1])
+            bar.low = min(bar.open, bar.close) - random.choice([0, 0.2, 1])
+        bar.volume = random.randint(0, 100)
+        barList.append(bar)
+    return barList
+
+
+########################################################################
+class ArrayManagerTest(unittest.TestCase):
+    """指标对比测试"""
+
+    #----------------------------------------------------------------------
+    def setUp(self):
+        """准备K线"""
+        self.barList = makeBarList(300, 3)
+        self.high = np.array([bar.high for bar in self.barList])
+        self.low = np.array([bar.low for bar in self.barList])
+        self.close = np.array([bar.close for bar in self.barList])
+
+    #----------------------------------------------------------------------
+    def getTalib(self, start, end):
+        """用talib计算第start到end根K线（不含end）的各指标最新值"""
+        high = self.high[start:end]
+        low = self.low[start:end]
+        close = self.close[start:end]
+
+        d = {}
+        d['sma'] = talib.SMA(close, 10)[-1]
+        d['ema'] = talib.EMA(close, 12)[-1]
+        d['atr'] = talib.ATR(high, low, close, 14)[-1]
+        d['rsi'] = talib.RSI(close, 7)[-1]
+
+        up, mid, down = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0)
+        d['boll'] = (mid[-1], up[-1], down[-1])
+
+        kkMid = talib.SMA(close, 11)[-1]
+        kkAtr = talib.ATR(high, low, close, 11)[-1]
+        d['keltner'] = (kkMid, kkMid + kkAtr * 1.6, kkMid - kkAtr * 1.6)
+        return d
+
+    #----------------------------------------------------------------------
+    def getArrayManager(self, am):
+        """ArrayManager的各指标最新值"""
+        d = {}
+        d['sma'] = am.sma(10)
+        d['ema'] = am.ema(12)
+        d['atr'] = am.atr(14)
+        d['rsi'] = am.rsi(7)
+        d['boll'] = am.boll(20, 2)
+        d['keltner'] = am.keltner(11, 1.6)
+        return d
+
+    #----------------------------------------------------------------------
+    def assertIndicatorEqual(self, am, start, end):
+        """比较ArrayManager和talib的各指标"""
+        expected = self.getTalib(start, end)
+        result = self.getArrayManager(am)
+
+        for key in expected:
+            msg = '%s at bar %d' % (key, end)
+            self.assertTrue(np.allclose(result[key], expected[key], rtol=0, atol=1e-6), msg)
+
+    #----------------------------------------------------------------------
+    def testFirstValue(self):
+        """指标创建时用缓冲区中的K线回放，结果和对缓冲区数据调用talib相同"""
+        # 缓冲区未满和已经循环多次的情况，包括价格不变的窗口
+        for count in [30, SIZE, 120, 137, 300]:
+            am = ArrayManager(SIZE)
+            for bar in self.barList[:count]:
+                am.updateBar(bar)
+
+            self.assertIndicatorEqual(am, max(count - SIZE, 0), count)
+            self.assertTrue((am.closeArray[-min(count, SIZE):] == self.close[max(count - SIZE, 0):count]).all())
+
+    #----------------------------------------------------------------------
+    def testUpdate(self):
+        """指标创建之后逐根K线更新，结果和talib从回放起点开始计算的结果相同"""
+        am = ArrayManager(SIZE)
+        for bar in self.barList[:80]:
+            am.updateBar(bar)
+        self.assertIndicatorEqual(am, 80 - SIZE, 80)
+
+        for end in range(81, len(self.barList) + 1):
+            am.updateBar(self.barList[end - 1])
+            self.assertIndicatorEqual(am, 80 - SIZE, end)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+# encoding: UTF-8
+
+'''
+BarGenerator以及CtaEngine订阅K线的测试，在vn.trader/ctaStrategy目录下运行：
+python testCtaBarGenerator.py
+'''
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# vn.trader目录需要在ctaStrategy目录之前，避免同名的language包冲突
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eventEngine import Event, EVENT_TICK
+from vtGateway import VtTickData
+from vtFunction import getTickDatetime
+from ctaBase import CtaBarData
+from ctaBarGenerator import BarGenerator
+from ctaEngine import CtaEngine
+from ctaTemplate import CtaTemplate
+from strategy import STRATEGY_CLASS
+
+
+#----------------------------------------------------------------------
+def makeBarList(start, count):
+    """生成连续的1分钟K线"""
+    barList = []
+    for i in range(count):
+        bar = CtaBarData()
+        bar.vtSymbol = 'IF1706'
+        bar.datetime = start + timedelta(minutes=i)
+        bar.open = bar.high = bar.low = bar.close = i
+        barList.append(bar)
+    return barList
+
+#----------------------------------------------------------------------
+def makeTick(date, time):
+    """生成Tick"""
+    tick = VtTickData()
+    tick.symbol = 'IF1706'
+    tick.vtSymbol = 'IF1706'
+    tick.date = date
+    tick.time = time
+    tick.lastPrice = 3500
+    return tick
+
+
+########################################################################
+class SubscribeStrategy(CtaTemplate):
+    """订阅1分钟和5分钟K线的测试策略"""
+    className = 'SubscribeStrategy'
+
+    barList = []                # 初始化时回放的K线
+
+    #----------------------------------------------------------------------
+    def __init__(self, ctaEngine, setting):
+        """Constructor"""
+        super(SubscribeStrategy, self).__init__(ctaEngine, setting)
+        self.subscribeBar()
+        self.subscribeBar(5, 'onFiveBar')
+
+        self.oneList = []
+        self.fiveList = []
+
+    #----------------------------------------------------------------------
+    def onInit(self):
+        """初始化策略"""
+        self.replayBar(self.barList)
+
+    #----------------------------------------------------------------------
+    def onBar(self, bar):
+        """收到1分钟K线"""
+        self.oneList.append(bar.datetime)
+
+    #----------------------------------------------------------------------
+    def onFiveBar(self, bar):
+        """收到5分钟K线"""
+        self.fiveList.append(bar.datetime)
+
+
+########################################################################
+class FakeMainEngine(object):
+    """测试用的主引擎"""
+
+    #----------------------------------------------------------------------
+    def getContract(self, vtSymbol):
+        """查询合约"""
+        return None
+
+
+########################################################################
+class FakeEventEngine(object):
+    """测试用的事件引擎"""
+
+    #----------------------------------------------------------------------
+    def register(self, type_, handler):
+        """注册事件处理函数"""
+        pass
+
+    #----------------------------------------------------------------------
+    def put(self, event):
+        """推送事件"""
+        pass
+
+
+########################################################################
+class BarGeneratorTest(unittest.TestCase):
+    """K线合成器测试"""
+
+    #----------------------------------------------------------------------
+    def testReplayBeforeFirstTick(self):
+        """还没有收到Tick时回放，推送的1分钟K线为回放的K线"""
+        generator = BarGenerator()
+        owner = object()
+        received = []
+        generator.addHandler(5, owner, lambda xbar, bar: received.append((xbar.datetime, bar.datetime)))
+
+        barList = makeBarList(datetime(2017, 6, 1, 9, 31), 12)
+        generator.replay(owner, barList)
+
+        self.assertEqual(generator.lastBar, None)
+        self.assertEqual(received, [(datetime(2017, 6, 1, 9, 31), datetime(2017, 6, 1, 9, 35)),
+                                    (datetime(2017, 6, 1, 9, 36), datetime(2017, 6, 1, 9, 40))])
+
+        # 未完成的5分钟K线保留到共享的合成器中
+        self.assertEqual(generator.xminBarDict[5].datetime, datetime(2017, 6, 1, 9, 41))
+
+
+########################################################################
+class EngineSubscribeTest(unittest.TestCase):
+    """CtaEngine订阅K线测试"""
+
+    #----------------------------------------------------------------------
+    def setUp(self):
+        """创建引擎"""
+        STRATEGY_CLASS[SubscribeStrategy.className] = SubscribeStrategy
+        SubscribeStrategy.barList = makeBarList(datetime(2017, 6, 1, 9, 31), 12)
+
+        self.engine = CtaEngine(FakeMainEngine(), FakeEventEngine())
+        self.engine.checkpointPath = tempfile.mkdtemp()
+
+    #----------------------------------------------------------------------
+    def tearDown(self):
+        """停止引擎"""
+        self.engine.stop()
+        shutil.rmtree(self.engine.checkpointPath)
+        del STRATEGY_CLASS[SubscribeStrategy.className]
+
+    #----------------------------------------------------------------------
+    def checkInited(self, name):
+        """检查初始化回放的结果"""
+        strategy = self.engine.strategyDict[name]
+        self.assertTrue(strategy.inited)
+        self.assertEqual(len(strategy.oneList), 12)
+        self.assertEqual(strategy.fiveList, [datetime(2017, 6, 1, 9, 31), datetime(2017, 6, 1, 9, 36)])
+        self.assertEqual(strategy.lastBarDatetime, datetime(2017, 6, 1, 9, 42))
+
+    #----------------------------------------------------------------------
+    def testInitBeforeFirstTick(self):
+        """开盘前（还没有收到Tick）初始化策略"""
+        self.engine.loadStrategy({'name': 'a', 'className': 'SubscribeStrategy', 'vtSymbol': 'IF1706'})
+        self.engine.initStrategy('a')
+        self.checkInited('a')
+
+    #----------------------------------------------------------------------
+    def testInitBeforeFirstTickInWorker(self):
+        """在工作线程中运行的策略开盘前初始化"""
+        self.engine.loadStrategy({'name': 'b', 'className': 'SubscribeStrategy', 'vtSymbol': 'IF1706',
+                                  'worker': 'test'})
+        self.engine.initStrategy('b')
+        self.engine.stop()          # 等待工作线程执行完队列中的回调
+        self.checkInited('b')
+
+    #----------------------------------------------------------------------
+    def testRepushSameTickObject(self):
+        """接口修改时间后重复推送同一个tick对象，K线按新的时间切换"""
+        SubscribeStrategy.barList = []
+        self.engine.loadStrategy({'name': 'c', 'className': 'SubscribeStrategy', 'vtSymbol': 'IF1706'})
+        self.engine.initStrategy('c')
+        strategy = self.engine.strategyDict['c']
+
+        tick = makeTick('20170601', '09:50:10.0')
+        for time in ['09:50:10.0', '09:50:40.5', '09:51:05.0', '09:52:00.0']:
+            tick.time = time
+            event = Event(type_=EVENT_TICK)
+            event.dict_['data'] = tick
+            self.engine.processTickEvent(event)
+
+        self.assertEqual(tick.datetime, datetime(2017, 6, 1, 9, 52))
+        self.assertEqual(strategy.oneList, [datetime(2017, 6, 1, 9, 50, 10), datetime(2017, 6, 1, 9, 51, 5)])
+
+
+########################################################################
+class TickDatetimeTest(unittest.TestCase):
+    """Tick时间解析缓存测试"""
+
+    #----------------------------------------------------------------------
+    def testReparseAfterChange(self):
+        """同一个tick对象修改日期和时间后重新解析"""
+        tick = makeTick('20170601', '09:50:10.5')
+        self.assertEqual(getTickDatetime(tick), datetime(2017, 6, 1, 9, 50, 10, 500000))
+        self.assertEqual(getTickDatetime(tick), datetime(2017, 6, 1, 9, 50, 10, 500000))
+
+        tick.time = '09:50:11'
+        self.assertEqual(getTickDatetime(tick), datetime(2017, 6, 1, 9, 50, 11))
+
+        tick.date = '20170602'
+        self.assertEqual(getTickDatetime(tick), datetime(2017, 6, 2, 9, 50, 11))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,15 +6,118 @@
 from vtConstant import *
 from ctaBase import *
 
+from collections import deque
 from datetime import datetime
 
-import talib as ta
-import numpy
 import copy,csv
 
 
 DEBUGCTALOG = True
 
+# lineBar缓存的K线数量上限（8个交易小时的1分钟K线）
+MAX_LINE_BAR = 60 * 8 + 1
+
+
+class RollingWindow(object):
+    """定长滑动窗口，每次更新的计算量为O(1)
+    维护窗口内数据的和与平方和，extreme为True时用单调队列同时维护最大值和最小值
+    方差用减去偏移量shift之后的数据的和与平方和计算，shift接近窗口平均值，避免价格较大时相减损失精度"""
+
+    def __init__(self, size, extreme=False):
+        self.size = size
+        self.values = deque(maxlen=size)    # 窗口内的数据
+        self.total = 0.0                    # 数据的和
+        self.shift = 0.0                    # 计算方差的偏移量
+        self.shiftTotal = 0.0               # 数据减去shift之后的和
+        self.squareTotal = 0.0              # 数据减去shift之后的平方和
+        self.nonzeroCount = 0               # 非0数据的数量，全为0时直接把和置0，避免残留浮点误差
+        self.updateCount = 0                # 距离上次重新求和的更新次数
+
+        self.extreme = extreme
+        self.seq = 0                        # 数据的序号
+        self.maxQueue = deque()             # (序号, 数值)，数值单调递减，队首为最大值
+        self.minQueue = deque()             # (序号, 数值)，数值单调递增，队首为最小值
+
+    def update(self, value):
+        """加入新的数据，窗口已满时移除最早的数据"""
+        values = self.values
+        if len(values) == self.size:
+            old = values[0]
+            self.total -= old
+            self.shiftTotal -= old - self.shift
+            self.squareTotal -= (old - self.shift) ** 2
+            if old:
+                self.nonzeroCount -= 1
+        elif not values:
+            self.shift = value
+
+        values.append(value)
+        self.total += value
+        self.shiftTotal += value - self.shift
+        self.squareTotal += (value - self.shift) ** 2
+        if value:
+            self.nonzeroCount += 1
+
+        # 每更新size次重新求和一次，消除累加的浮点误差
+        self.updateCount += 1
+        if self.updateCount >= self.size:
+            self.updateCount = 0
+            self.total = float(sum(values))
+            self.shift = self.total / len(values)
+            self.shiftTotal = float(sum([x - self.shift for x in values]))
+            self.squareTotal = float(sum([(x - self.shift) ** 2 for x in values]))
+        elif not self.nonzeroCount:
+            self.total = 0.0
+            self.shift = 0.0
+            self.shiftTotal = 0.0
+            self.squareTotal = 0.0
+
+        if self.extreme:
+            self.seq += 1
+            expired = self.seq - self.size
+
+            maxQueue = self.maxQueue
+            while maxQueue and maxQueue[-1][1] <= value:
+                maxQueue.pop()
+            maxQueue.append((self.seq, value))
+            while maxQueue[0][0] <= expired:
+                maxQueue.popleft()
+
+            minQueue = self.minQueue
+            while minQueue and minQueue[-1][1] >= value:
+                minQueue.pop()
+            minQueue.append((self.seq, value))
+            while minQueue[0][0] <= expired:
+                minQueue.popleft()
+
+    def getCount(self):
+        """窗口内的数据数量"""
+        return len(self.values)
+
+    def getSum(self):
+        """窗口内数据的和"""
+        return self.total
+
+    def getMean(self):
+        """窗口内数据的平均值"""
+        return self.total / len(self.values)
+
+    def getStd(self):
+        """窗口内数据的总体标准差"""
+        n = len(self.values)
+        mean = self.shiftTotal / n
+        variance = self.squareTotal / n - mean * mean
+        return max(variance, 0) ** 0.5
+
+    def getMax(self):
+        """窗口内的最大值（extreme为True时可用）"""
+        return self.maxQueue[0][1]
+
+    def getMin(self):
+        """窗口内的最小值（extreme为True时可用）"""
+        return self.minQueue[0][1]
+
+
 class CtaLineBar(object):
     """CTA K线"""
     """ 使用方法:
@@ -34,6 +137,7 @@ class CtaLineBar(object):
     self.lineM.onTick(tick)
     self.lineM5.onTick(tick) # 如果你使用2个周期
     3、在onBar事件中，按照k线结束使用；其他任何情况下bar内使用，通过对象使用即可，self.lineM.lineBar[-1].close
+    4、lineBar和各指标的历史记录均为定长的deque，支持len和下标访问，不支持切片
     """
 
     # 参数列表，保存了参数的名称
@@ -100,7 +204,7 @@ class CtaLineBar(object):
 
         # K线保存数据
         self.bar = None                # K线数据对象
-        self.lineBar = []              # K线缓存数据队列
+        self.lineBar = deque(maxlen=MAX_LINE_BAR)   # K线缓存数据队列
         self.barFirstTick =False       # K线的第一条Tick数据
 
         # K 线的相关计算结果数据
@@ -171,6 +275,63 @@ class CtaLineBar(object):
         if setting:
             self.setParam(setting)
 
+        self.__initIndicators()
+
+    def __initIndicators(self):
+        """根据参数创建指标的滑动窗口和定长的历史记录
+        每次onBar时lineBar[-2]为一根新完成的K线，各指标的滑动窗口只用完成的K线增量更新"""
+        def createWindow(size, extreme=False):
+            if size > 0:
+                return RollingWindow(size, extreme)
+            return None
+
+        self.barTr = EMPTY_FLOAT                    # 最近完成K线的真实波幅
+
+        self.preHighWindow = createWindow(self.inputPreLen, True)
+        self.preLowWindow = createWindow(self.inputPreLen, True)
+        self.preHigh = deque(maxlen=self.inputPreLen * 8 + 1)
+        self.preLow = deque(maxlen=self.inputPreLen * 8 + 1)
+
+        # talib.EMA对恰好N个数据计算N周期EMA时结果为简单平均，这里直接用滑动窗口的平均值
+        self.ema1Window = createWindow(self.inputEma1Len)
+        self.ema2Window = createWindow(self.inputEma2Len)
+        self.lineEma1 = deque(maxlen=self.inputEma1Len * 8 + 1)
+        self.lineEma2 = deque(maxlen=self.inputEma1Len * 8 + 1)
+
+        self.dmiTrWindow = createWindow(self.inputDmiLen)
+        self.dmiPdmWindow = createWindow(self.inputDmiLen)
+        self.dmiMdmWindow = createWindow(self.inputDmiLen)
+        self.dxWindow = createWindow(self.inputDmiLen)
+        self.lineDxMean = deque(maxlen=3)           # 最近3次计算时lineDx最后N个数值的平均
+        self.linePdi = deque(maxlen=self.inputDmiLen + 2)
+        self.lineMdi = deque(maxlen=self.inputDmiLen + 2)
+        self.lineDx = deque(maxlen=self.inputDmiLen + 2)
+        self.lineAdx = deque(maxlen=self.inputDmiLen + 2)
+        self.lineAdxr = deque(maxlen=self.inputDmiLen + 2)
+
+        self.lineTr = deque(maxlen=max(self.inputAtr1Len, self.inputAtr2Len, self.inputAtr3Len, 1))
+        self.lineAtr1 = deque(maxlen=self.inputAtr1Len + 2)
+        self.lineAtr2 = deque(maxlen=self.inputAtr2Len + 2)
+        self.lineAtr3 = deque(maxlen=self.inputAtr3Len + 2)
+
+        self.volWindow = createWindow(self.inputVolLen)
+        self.lineAvgVol = deque(maxlen=self.inputVolLen * 8 + 1)
+
+        self.rsiGainWindow = createWindow(self.inputRsiLen)
+        self.rsiLossWindow = createWindow(self.inputRsiLen)
+        self.lineRsi = deque(maxlen=self.inputRsiLen * 8 + 1)
+        self.lineRsiTop = deque(maxlen=self.inputRsiLen + 1)
+        self.lineRsiButtom = deque(maxlen=self.inputRsiLen + 1)
+
+        # CMI的最高最低价包含当前K线，窗口中只保存之前的inputCmiLen-1根完成K线
+        self.cmiWindow = createWindow(self.inputCmiLen - 1, True)
+        self.lineCmi = deque(maxlen=self.inputCmiLen + 1)
+
+        self.bollWindow = createWindow(self.inputBollLen)
+        self.lineUpperBand = deque(maxlen=self.inputBollLen * 8 + 1)
+        self.lineMiddleBand = deque(maxlen=self.inputBollLen * 8 + 1)
+        self.lineLowerBand = deque(maxlen=self.inputBollLen * 8 + 1)
+
     def setParam(self, setting):
         """设置参数"""
         d = self.__dict__
@@ -179,6 +340,15 @@ class CtaLineBar(object):
 
                 d[key] = setting[key]
 
+    def getState(self):
+        """获取K线和指标的计算状态，用于策略检查点（不包括参数和回调函数）"""
+        excludeSet = set(self.paramList) | set(['strategy', 'onBarFunc', 'curTick'])
+        return dict((k, v) for k, v in self.__dict__.items() if k not in excludeSet)
+
+    def setState(self, state):
+        """恢复getState保存的状态"""
+        self.__dict__.update(state)
+
     def onTick(self, tick):
         """行情更新
         :type tick: object
@@ -223,6 +393,10 @@ class CtaLineBar(object):
 
     def onBar(self, bar):
         """OnBar事件"""
+        # 每次onBar前lineBar都新增了一根K线，用新完成的K线更新滑动窗口
+        if len(self.lineBar) > 1:
+            self.__updateFinishedBar()
+
         # 计算相关数据
         self.__recountPreHighLow()
         self.__recountEma()
@@ -238,6 +412,67 @@ class CtaLineBar(object):
         self.onBarFunc(bar)
 
 
+    def __updateFinishedBar(self):
+        """用新完成的K线（lineBar[-2]）增量更新各指标的滑动窗口"""
+        bar = self.lineBar[-2]
+
+        if len(self.lineBar) > 2:
+            preBar = self.lineBar[-3]
+
+            # 真实波幅
+            self.barTr = max(bar.high - bar.low, abs(bar.high - preBar.close), abs(bar.low - preBar.close))
+
+            # 今高与昨高的价差，昨低与今低的价差
+            high_prehigh_spread = bar.high - preBar.high
+            low_prelow_spread = preBar.low - bar.low
+
+            if high_prehigh_spread > 0 and high_prehigh_spread > low_prelow_spread:
+                barPdm = high_prehigh_spread
+            else:
+                barPdm = EMPTY_FLOAT
+
+            if low_prelow_spread > 0 and low_prelow_spread > high_prehigh_spread:
+                barMdm = low_prelow_spread
+            else:
+                barMdm = EMPTY_FLOAT
+
+            closeDiff = bar.close - preBar.close
+        else:
+            # 第一根K线没有前收盘价
+            self.barTr = bar.high - bar.low
+            barPdm = EMPTY_FLOAT
+            barMdm = EMPTY_FLOAT
+            closeDiff = None
+
+        if self.preHighWindow:
+            self.preHighWindow.update(bar.high)
+            self.preLowWindow.update(bar.low)
+
+        if self.ema1Window:
+            self.ema1Window.update(bar.close)
+        if self.ema2Window:
+            self.ema2Window.update(bar.close)
+
+        if self.dmiTrWindow:
+            self.dmiTrWindow.update(self.barTr)
+            self.dmiPdmWindow.update(barPdm)
+            self.dmiMdmWindow.update(barMdm)
+
+        self.lineTr.append(self.barTr)
+
+        if self.volWindow:
+            self.volWindow.update(bar.volume)
+
+        if self.rsiGainWindow and closeDiff is not None:
+            self.rsiGainWindow.update(max(closeDiff, 0))
+            self.rsiLossWindow.update(max(-closeDiff, 0))
+
+        if self.cmiWindow:
+            self.cmiWindow.update(bar.close)
+
+        if self.bollWindow:
+            self.bollWindow.update(bar.close)
+
     def __firstTick(self,tick):
         """ K线的第一个Tick数据"""
         self.bar = CtaBarData()                  # 创建新的K线
@@ -275,10 +510,6 @@ class CtaLineBar(object):
             self.onBar(self.bar)
             return
 
-        # 清除8交易小时前的数据，
-        if l1 > 60 * 8:
-            del self.lineBar[0]
-
         # 与最后一个BAR的时间比对，判断是否超过5分钟
         lastBar = self.lineBar[-1]
 
@@ -304,7 +535,7 @@ class CtaLineBar(object):
 
                 # 生成砖块递增K线,减小ATR变动
                 for i in range(0, jumpBars, 1):
-                    upbar = copy.deepcopy(lastBar)
+                    upbar = copy.copy(lastBar)
                     upbar.open = priceInYesterday + float(i * priceInBar)
                     upbar.low = upbar.open
                     upbar.close = priceInYesterday + float((i+1) * priceInBar)
@@ -318,7 +549,7 @@ class CtaLineBar(object):
                 # 生成递减K线,减小ATR变动
                 for i in range(0, jumpBars, 1):
 
-                    downbar = copy.deepcopy(lastBar)
+                    downbar = copy.copy(lastBar)
                     downbar.open = priceInYesterday - float(i * priceInBar)
                     downbar.high = downbar.open
                     downbar.close = priceInYesterday - float((i+1) * priceInBar)
@@ -330,7 +561,7 @@ class CtaLineBar(object):
 
             # 生成平移K线，减小Pdi，Mdi、ADX变动
             for i in range(0, jumpBars*2, 1):
-                equalbar=copy.deepcopy(self.lineBar[-1])
+                equalbar=copy.copy(self.lineBar[-1])
                 equalbar.volume = 0
                 self.lineBar.append(equalbar)
                 self.onBar(equalbar)
@@ -395,26 +626,16 @@ class CtaLineBar(object):
                              format(len(self.lineBar), self.inputPreLen))
             return
 
-        # 2.计算前inputPreLen周期内(不包含当前周期）的Bar高点和低点
-        preHigh = EMPTY_FLOAT
-        preLow = EMPTY_FLOAT
-
-        for i in range(len(self.lineBar)-2, len(self.lineBar)-2-self.inputPreLen, -1):
-
-            if self.lineBar[i].high > preHigh or preHigh == EMPTY_FLOAT:
-                preHigh = self.lineBar[i].high    # 前InputPreLen周期高点
-
-            if self.lineBar[i].low < preLow or preLow == EMPTY_FLOAT:
-                preLow = self.lineBar[i].low     # 前InputPreLen周期低点
+        # 2.前inputPreLen周期内(不包含当前周期）的Bar高点和低点，由滑动窗口维护
+        if self.preHighWindow.getCount():
+            preHigh = self.preHighWindow.getMax()    # 前InputPreLen周期高点
+            preLow = self.preLowWindow.getMin()      # 前InputPreLen周期低点
+        else:
+            preHigh = EMPTY_FLOAT
+            preLow = EMPTY_FLOAT
 
         # 保存
-        if len(self.preHigh) > self.inputPreLen * 8:
-            del self.preHigh[0]
         self.preHigh.append(preHigh)
-
-        # 保存
-        if len(self.preLow)> self.inputPreLen * 8:
-            del self.preLow[0]
         self.preLow.append(preLow)
 
     #----------------------------------------------------------------------
@@ -422,8 +643,6 @@ class CtaLineBar(object):
 
     def __recountEma(self):
         """计算K线的EMA1 和EMA2"""
-        l = len(self.lineBar)
-
         # 1、lineBar满足长度才执行计算
         if len(self.lineBar) < max(7, self.inputEma1Len, self.inputEma2Len)+2:
             self.debugCtaLog(u'数据未充分,当前Bar数据数量：{0}，计算EMA需要：{1}'.
@@ -433,38 +652,17 @@ class CtaLineBar(object):
         # 计算第一条EMA均线
         if self.inputEma1Len > 0:
 
-            if self.inputEma1Len > l:
-                ema1Len = l
-            else:
-                ema1Len = self.inputEma1Len
-
             # 3、获取前InputN周期(不包含当前周期）的自适应均线
-            listClose=[x.close for x in self.lineBar[-ema1Len - 1:-1]]
+            barEma1 = round(self.ema1Window.getMean(), 3)
 
-            barEma1 = ta.EMA(numpy.array(listClose, dtype=float), ema1Len)[-1]
-
-            barEma1 = round(float(barEma1), 3)
-
-            if len(self.lineEma1) > self.inputEma1Len*8:
-                del self.lineEma1[0]
             self.lineEma1.append(barEma1)
 
         # 计算第二条EMA均线
         if self.inputEma2Len > 0:
 
-            if self.inputEma2Len > l:
-                ema2Len = l
-            else:
-                ema2Len = self.inputEma2Len
-
             # 3、获取前InputN周期(不包含当前周期）的自适应均线
-            listClose=[x.close for x in self.lineBar[-ema2Len - 1:-1]]
-            barEma2 = ta.EMA(numpy.array(listClose, dtype=float), ema2Len)[-1]
+            barEma2 = round(self.ema2Window.getMean(), 3)
 
-            barEma2 = round(float(barEma2), 3)
-
-            if len(self.lineEma2) > self.inputEma1Len*8:
-                del self.lineEma2[0]
             self.lineEma2.append(barEma2)
 
 
@@ -480,37 +678,10 @@ class CtaLineBar(object):
             return
 
 
-        # 2、根据当前High，Low，(不包含当前周期）重新计算TR1，PDM，MDM和ATR
-        barTr1 = EMPTY_FLOAT      # 获取InputP周期内的价差最大值之和
-        barPdm = EMPTY_FLOAT      # InputP周期内的做多价差之和
-        barMdm = EMPTY_FLOAT      # InputP周期内的做空价差之和
-
-        for i in range(len(self.lineBar)-2, len(self.lineBar)-2-self.inputDmiLen, -1):  # 周期 inputDmiLen
-            # 3.1、计算TR1
-
-            # 当前周期最高与最低的价差
-            high_low_spread = self.lineBar[i].high - self.lineBar[i].low
-            # 当前周期最高与昨收价的价差
-            high_preclose_spread = abs(self.lineBar[i].high - self.lineBar[i - 1].close)
-            # 当前周期最低与昨收价的价差
-            low_preclose_spread = abs(self.lineBar[i].low - self.lineBar[i - 1].close)
-
-            # 最大价差
-            max_spread = max(high_low_spread, high_preclose_spread, low_preclose_spread)
-            barTr1 = barTr1 + float(max_spread)
-
-            # 今高与昨高的价差
-            high_prehigh_spread = self.lineBar[i].high - self.lineBar[i - 1].high
-            # 昨低与今低的价差
-            low_prelow_spread = self.lineBar[i - 1].low - self.lineBar[i].low
-
-            # 3.2、计算周期内的做多价差之和
-            if high_prehigh_spread > 0 and high_prehigh_spread > low_prelow_spread:
-                barPdm = barPdm + high_prehigh_spread
-
-            # 3.3、计算周期内的做空价差之和
-            if low_prelow_spread > 0 and low_prelow_spread > high_prehigh_spread:
-                barMdm = barMdm + low_prelow_spread
+        # 2、前inputDmiLen周期(不包含当前周期）的TR1，PDM，MDM之和，由滑动窗口维护
+        barTr1 = self.dmiTrWindow.getSum()      # 获取InputP周期内的价差最大值之和
+        barPdm = self.dmiPdmWindow.getSum()     # InputP周期内的做多价差之和
+        barMdm = self.dmiMdmWindow.getSum()     # InputP周期内的做空价差之和
 
         # 6、计算上升动向指标，即做多的比率
         if barTr1 == 0:
@@ -518,9 +689,6 @@ class CtaLineBar(object):
         else:
             self.barPdi = barPdm * 100 / barTr1
 
-        if len(self.linePdi) > self.inputDmiLen+1:
-            del self.linePdi[0]
-
         self.linePdi.append(self.barPdi)
 
         # 7、计算下降动向指标，即做空的比率
@@ -535,26 +703,30 @@ class CtaLineBar(object):
         else:
             dx = 100 * abs(self.barMdi - self.barPdi) / (self.barMdi + self.barPdi)
 
-        if len(self.lineMdi) > self.inputDmiLen+1:
-            del self.lineMdi[0]
-
         self.lineMdi.append(self.barMdi)
 
-        if len(self.lineDx) > self.inputDmiLen+1:
-            del self.lineDx[0]
-
         self.lineDx.append(dx)
 
-        # 平均趋向指标，MA计算
-        if len(self.lineDx) < self.inputDmiLen+1:
+        self.dxWindow.update(dx)
+        if self.dxWindow.getCount() == self.inputDmiLen:
+            self.lineDxMean.append(self.dxWindow.getMean())
+        else:
+            self.lineDxMean.append(None)
+
+        # 平均趋向指标，对lineDx（最多inputDmiLen+2个）计算EMA：
+        # 以前inputDmiLen个数值的平均为初始值，再用之后的数值逐个平滑
+        l = len(self.lineDx)
+        if l < self.inputDmiLen+1:
             self.barAdx = dx
         else:
-            self.barAdx = ta.EMA(numpy.array(self.lineDx, dtype=float), self.inputDmiLen)[-1]
+            k = l - self.inputDmiLen
+            alpha = 2.0 / (self.inputDmiLen + 1)
+            barAdx = self.lineDxMean[-1-k]
+            for i in range(l-k, l):
+                barAdx += alpha * (self.lineDx[i] - barAdx)
+            self.barAdx = barAdx
 
         # 保存Adx值
-        if len(self.lineAdx) > self.inputDmiLen+1:
-            del self.lineAdx[0]
-
         self.lineAdx.append(self.barAdx)
 
         # 趋向平均值，为当日ADX值与1周期前的ADX值的均值
@@ -564,8 +736,6 @@ class CtaLineBar(object):
             self.barAdxr = (self.lineAdx[-1] + self.lineAdx[-2]) / 2
 
         # 保存Adxr值
-        if len(self.lineAdxr) > self.inputDmiLen+1:
-            del self.lineAdxr[0]
         self.lineAdxr.append(self.barAdxr)
 
         # 7、计算A，ADX值持续高于前一周期时，市场行情将维持原趋势
@@ -621,44 +791,16 @@ class CtaLineBar(object):
                 or (self.inputAtr2Len > 0 and len(self.lineAtr2) < 1) \
                 or (self.inputAtr3Len > 0 and len(self.lineAtr3) < 1):
 
-            # 根据当前High，Low，(不包含当前周期）重新计算TR1和ATR
-            barTr1 = EMPTY_FLOAT      # 获取inputAtr1Len周期内的价差最大值之和
-            barTr2 = EMPTY_FLOAT      # 获取inputAtr2Len周期内的价差最大值之和
-            barTr3 = EMPTY_FLOAT      # 获取inputAtr3Len周期内的价差最大值之和
-
-            j = 0
-            for i in range(len(self.lineBar)-2, len(self.lineBar)-2-maxAtrLen, -1):  # 周期 inputP
-                # 3.1、计算TR
-
-                # 当前周期最高与最低的价差
-                high_low_spread = self.lineBar[i].high - self.lineBar[i].low
-                # 当前周期最高与昨收价的价差
-                high_preclose_spread = abs(self.lineBar[i].high - self.lineBar[i - 1].close)
-                # 当前周期最低与昨收价的价差
-                low_preclose_spread = abs(self.lineBar[i].low - self.lineBar[i - 1].close)
-
-                # 最大价差
-                max_spread = max(high_low_spread, high_preclose_spread, low_preclose_spread)
-                if j < self.inputAtr1Len:
-                    barTr1 = barTr1 + float(max_spread)
-                if j < self.inputAtr2Len:
-                    barTr2 = barTr2 + float(max_spread)
-                if j < self.inputAtr3Len:
-                    barTr3 = barTr3 + float(max_spread)
-
-                j = j + 1
+            # 用前maxAtrLen周期(不包含当前周期）的TR计算初始的ATR，lineTr中最新的在最后
+            trList = list(self.lineTr)
+            barTr1 = float(sum(trList[-self.inputAtr1Len:])) if self.inputAtr1Len > 0 else EMPTY_FLOAT
+            barTr2 = float(sum(trList[-self.inputAtr2Len:])) if self.inputAtr2Len > 0 else EMPTY_FLOAT
+            barTr3 = float(sum(trList[-self.inputAtr3Len:])) if self.inputAtr3Len > 0 else EMPTY_FLOAT
 
         else: # 只计算一个
 
-            # 当前周期最高与最低的价差
-            high_low_spread = self.lineBar[-2].high - self.lineBar[-2].low
-            # 当前周期最高与昨收价的价差
-            high_preclose_spread = abs(self.lineBar[-2].high - self.lineBar[-3].close)
-            # 当前周期最低与昨收价的价差
-            low_preclose_spread = abs(self.lineBar[-2].low - self.lineBar[-3].close)
-
-            # 最大价差
-            barTr1 = max(high_low_spread, high_preclose_spread, low_preclose_spread)
+            # 最近完成K线的真实波幅
+            barTr1 = self.barTr
             barTr2 = barTr1
             barTr3 = barTr1
 
@@ -669,8 +811,6 @@ class CtaLineBar(object):
             else:
                 self.barAtr1 = round((self.lineAtr1[-1]*(self.inputAtr1Len -1) + barTr1) / self.inputAtr1Len, 3)
 
-            if len(self.lineAtr1) > self. inputAtr1Len+1 :
-                del self.lineAtr1[0]
             self.lineAtr1.append(self.barAtr1)
 
         if self.inputAtr2Len > 0:
@@ -679,8 +819,6 @@ class CtaLineBar(object):
             else:
                 self.barAtr2 = round((self.lineAtr2[-1]*(self.inputAtr2Len -1) + barTr2) / self.inputAtr2Len, 3)
 
-            if len(self.lineAtr2) > self. inputAtr2Len+1:
-                del self.lineAtr2[0]
             self.lineAtr2.append(self.barAtr2)
 
         if self.inputAtr3Len > 0:
@@ -689,9 +827,6 @@ class CtaLineBar(object):
             else:
                 self.barAtr3 = round((self.lineAtr3[-1]*(self.inputAtr3Len -1) + barTr3) / self.inputAtr3Len, 3)
 
-            if len(self.lineAtr3) > self. inputAtr3Len+1:
-                del self.lineAtr3[0]
-
             self.lineAtr3.append(self.barAtr3)
 
     #----------------------------------------------------------------------
@@ -707,9 +842,7 @@ class CtaLineBar(object):
                              format(len(self.lineBar), self.inputVolLen+1))
             return
 
-        listVol = [x.volume for x in self.lineBar[-self.inputVolLen-1: -1]]
-
-        sumVol = ta.SUM(numpy.array(listVol, dtype=float), timeperiod=self.inputVolLen)[-1]
+        sumVol = self.volWindow.getSum()
 
         avgVol = round(sumVol/self.inputVolLen, 0)
 
@@ -728,13 +861,18 @@ class CtaLineBar(object):
             return
 
         # 3、inputRsiLen(包含当前周期）的相对强弱
-        listClose=[x.close for x in self.lineBar[-self.inputRsiLen - 2:]]
-        barRsi = ta.RSI(numpy.array(listClose, dtype=float), self.inputRsiLen)[-1]
-        barRsi = round(float(barRsi), 3)
+        # 以之前inputRsiLen个涨跌的平均为初始值，再用当前周期的涨跌做一次Wilder平滑，和talib.RSI一致
+        n = self.inputRsiLen
+        closeDiff = self.lineBar[-1].close - self.lineBar[-2].close
+        avgGain = (self.rsiGainWindow.getSum() / n * (n - 1) + max(closeDiff, 0)) / n
+        avgLoss = (self.rsiLossWindow.getSum() / n * (n - 1) + max(-closeDiff, 0)) / n
+
+        if avgGain + avgLoss == 0:
+            barRsi = 0
+        else:
+            barRsi = round(100 * avgGain / (avgGain + avgLoss), 3)
 
         l = len(self.lineRsi)
-        if l > self.inputRsiLen*8:
-            del self.lineRsi[0]
 
         self.lineRsi.append(barRsi)
 
@@ -748,9 +886,6 @@ class CtaLineBar(object):
                 t["Close"] = self.lineBar[-2].close
 
 
-                if len(self.lineRsiTop) > self.inputRsiLen:
-                    del self.lineRsiTop[0]
-
                 self.lineRsiTop.append( t )
                 self.lastRsiTopButtom = self.lineRsiTop[-1]
 
@@ -762,8 +897,6 @@ class CtaLineBar(object):
                 b["RSI"] = self.lineRsi[-2]
                 b["Close"] = self.lineBar[-2].close
 
-                if len(self.lineRsiButtom) > self.inputRsiLen:
-                    del self.lineRsiButtom[0]
                 self.lineRsiButtom.append(b)
                 self.lastRsiTopButtom = self.lineRsiButtom[-1]
 
@@ -787,9 +920,14 @@ class CtaLineBar(object):
                              format(len(self.lineBar), self.inputCmiLen))
             return
 
-        listClose =[x.close for x in self.lineBar[-self.inputCmiLen:]]
-        hhv = max(listClose)
-        llv = min(listClose)
+        # 最近inputCmiLen根K线（包含当前周期）收盘价的最高和最低
+        close = self.lineBar[-1].close
+        if self.cmiWindow and self.cmiWindow.getCount():
+            hhv = max(self.cmiWindow.getMax(), close)
+            llv = min(self.cmiWindow.getMin(), close)
+        else:
+            hhv = close
+            llv = close
 
         if hhv==llv:
             cmi = 100
@@ -798,14 +936,11 @@ class CtaLineBar(object):
 
         cmi = round(cmi, 2)
 
-        if len(self.lineCmi) > self.inputCmiLen:
-            del self.lineCmi[0]
-
         self.lineCmi.append(cmi)
 
     def __recountBoll(self):
         """布林特线"""
-        if self.inputBollLen < EMPTY_INT: return
+        if self.inputBollLen <= EMPTY_INT: return
 
         l = len(self.lineBar)
 
@@ -814,21 +949,13 @@ class CtaLineBar(object):
                              format(len(self.lineBar), min(7, self.inputBollLen)+1))
             return
 
-        if l < self.inputBollLen+2:
-            bollLen = l-1
-        else:
-            bollLen = self.inputBollLen
-
-        # 不包含当前最新的Bar
-        listClose=[x.close for x in self.lineBar[-bollLen - 1:-1]]
-        #
-        upper, middle, lower = ta.BBANDS(numpy.array(listClose, dtype=float),
-                                         timeperiod=bollLen, nbdevup=self.inputBollStdRate,
-                                         nbdevdn=self.inputBollStdRate, matype=0)
-
-        self.lineUpperBand.append(upper[-1])
-        self.lineMiddleBand.append(middle[-1])
-        self.lineLowerBand.append(lower[-1])
+        # 不包含当前最新的Bar，数据不足inputBollLen时使用全部完成的K线
+        middle = self.bollWindow.getMean()
+        std = self.bollWindow.getStd()
+
+        self.lineUpperBand.append(middle + std * self.inputBollStdRate)
+        self.lineMiddleBand.append(middle)
+        self.lineLowerBand.append(middle - std * self.inputBollStdRate)
 
 
     # ----------------------------------------------------------------------
@@ -0,0 +1,303 @@
+# encoding: UTF-8
+
+'''
+CtaLineBar增量指标的回归测试，在vn.trader/ctaStrategy/tools目录下运行：
+python testCtaLineBar.py
+
+TalibLineBar保留了改为增量计算之前基于talib的指标算法，每根K线都用lineBar切片重新计算，
+测试把同一组K线分别输入两者，逐根比较各line*指标的输出。
+
+唯一的差别是第一根K线的真实波幅和动向：之前的算法在首次计算DMI和ATR时用lineBar[i - 1]
+取到了lineBar[-1]（即最新的K线）作为第一根K线的前一根，增量算法中第一根K线没有前收盘价，
+真实波幅为最高减最低，动向为0，TalibLineBar中的getTr和getDm也按此处理。
+'''
+
+import os
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+import numpy
+import talib as ta
+
+# vn.trader目录需要在ctaStrategy目录之前，避免同名的language包冲突
+path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, path)
+sys.path.insert(1, os.path.join(path, 'ctaStrategy'))
+
+from ctaBase import CtaBarData, CtaTickData
+from ctaLineBar import CtaLineBar
+
+
+SETTING = {
+    'name': u'M5',
+    'barTimeInterval': 300,
+    'inputPreLen': 5,
+    'inputEma1Len': 7,
+    'inputEma2Len': 21,
+    'inputDmiLen': 14,
+    'inputDmiMax': 30,
+    'inputAtr1Len': 10,
+    'inputAtr2Len': 26,
+    'inputAtr3Len': 50,
+    'inputVolLen': 14,
+    'inputRsiLen': 7,
+    'inputCmiLen': 12,
+    'inputBollLen': 20,
+    'inputBollStdRate': 2,
+    'minDiff': 0.2
+}
+
+LINE_LIST = ['preHigh', 'preLow', 'lineEma1', 'lineEma2', 'linePdi', 'lineMdi', 'lineDx',
+             'lineAdx', 'lineAdxr', 'lineAtr1', 'lineAtr2', 'lineAtr3', 'lineAvgVol',
+             'lineRsi', 'lineCmi', 'lineUpperBand', 'lineMiddleBand', 'lineLowerBand']
+
+
+########################################################################
+class TalibLineBar(object):
+    """改为增量计算之前的指标算法，每次onBar用lineBar切片和talib重新计算"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, setting):
+        """Constructor"""
+        self.__dict__.update(setting)
+        self.lineBar = []
+
+        for name in LINE_LIST:
+            setattr(self, name, [])
+
+    #----------------------------------------------------------------------
+    def addBar(self, bar):
+        """加入一根完成的K线"""
+        self.lineBar.append(bar)
+        self.recountPreHighLow()
+        self.recountEma()
+        self.recountDmi()
+        self.recountAtr()
+        self.recountAvgVol()
+        self.recountRsi()
+        self.recountCmi()
+        self.recountBoll()
+
+    #----------------------------------------------------------------------
+    def getTr(self, i):
+        """第i根K线的真实波幅"""
+        bar = self.lineBar[i]
+        if i == 0:
+            return bar.high - bar.low
+
+        preClose = self.lineBar[i - 1].close
+        return max(bar.high - bar.low, abs(bar.high - preClose), abs(bar.low - preClose))
+
+    #----------------------------------------------------------------------
+    def getDm(self, i):
+        """第i根K线的上升动向和下降动向"""
+        if i == 0:
+            return 0, 0
+
+        upMove = self.lineBar[i].high - self.lineBar[i - 1].high
+        downMove = self.lineBar[i - 1].low - self.lineBar[i].low
+        pdm = upMove if upMove > 0 and upMove > downMove else 0
+        mdm = downMove if downMove > 0 and downMove > upMove else 0
+        return pdm, mdm
+
+    #----------------------------------------------------------------------
+    def recountPreHighLow(self):
+        """前inputPreLen根K线（不包含当前K线）的最高和最低"""
+        if len(self.lineBar) < self.inputPreLen:
+            return
+
+        barList = self.lineBar[-self.inputPreLen - 1:-1]
+        self.preHigh.append(max([bar.high for bar in barList]))
+        self.preLow.append(min([bar.low for bar in barList]))
+
+    #----------------------------------------------------------------------
+    def recountEma(self):
+        """前N根K线（不包含当前K线）收盘价的talib.EMA"""
+        if len(self.lineBar) < max(7, self.inputEma1Len, self.inputEma2Len) + 2:
+            return
+
+        for n, line in [(self.inputEma1Len, self.lineEma1), (self.inputEma2Len, self.lineEma2)]:
+            listClose = [x.close for x in self.lineBar[-n - 1:-1]]
+            ema = ta.EMA(numpy.array(listClose, dtype=float), n)[-1]
+            line.append(round(float(ema), 3))
+
+    #----------------------------------------------------------------------
+    def recountDmi(self):
+        """DMI，ADX为最近的lineDx（最多inputDmiLen+2个）的talib.EMA"""
+        n = self.inputDmiLen
+        if len(self.lineBar) < n + 1:
+            return
+
+        tr = pdm = mdm = 0.0
+        l = len(self.lineBar)
+        for i in range(l - 2, l - 2 - n, -1):
+            tr += self.getTr(i)
+            barPdm, barMdm = self.getDm(i)
+            pdm += barPdm
+            mdm += barMdm
+
+        pdi = pdm * 100 / tr if tr else 0
+        mdi = mdm * 100 / tr if tr else 0
+        dx = 100 * abs(mdi - pdi) / (mdi + pdi) if mdi + pdi else 0
+
+        # 改动之前的列表长度超过inputDmiLen+1时才删除，最多保存inputDmiLen+2个
+        self.linePdi = self.linePdi[-n - 1:] + [pdi]
+        self.lineMdi = self.lineMdi[-n - 1:] + [mdi]
+        self.lineDx = self.lineDx[-n - 1:] + [dx]
+
+        if len(self.lineDx) < n + 1:
+            adx = dx
+        else:
+            adx = ta.EMA(numpy.array(self.lineDx, dtype=float), n)[-1]
+        self.lineAdx = self.lineAdx[-n - 1:] + [adx]
+
+        if len(self.lineAdx) == 1:
+            adxr = adx
+        else:
+            adxr = (self.lineAdx[-1] + self.lineAdx[-2]) / 2
+        self.lineAdxr = self.lineAdxr[-n - 1:] + [adxr]
+
+    #----------------------------------------------------------------------
+    def recountAtr(self):
+        """ATR，首次为前N根K线真实波幅的平均，之后为Wilder平滑"""
+        maxLen = max(self.inputAtr1Len, self.inputAtr2Len, self.inputAtr3Len)
+        if len(self.lineBar) < maxLen + 1:
+            return
+
+        l = len(self.lineBar)
+        for n, line in [(self.inputAtr1Len, self.lineAtr1), (self.inputAtr2Len, self.lineAtr2),
+                        (self.inputAtr3Len, self.lineAtr3)]:
+            if not line:
+                tr = sum([self.getTr(i) for i in range(l - 2, l - 2 - n, -1)])
+                line.append(round(tr / n, 3))
+            else:
+                line.append(round((line[-1] * (n - 1) + self.getTr(l - 2)) / n, 3))
+
+    #----------------------------------------------------------------------
+    def recountAvgVol(self):
+        """前N根K线（不包含当前K线）成交量的talib.SUM平均"""
+        n = self.inputVolLen
+        if len(self.lineBar) < n + 1:
+            return
+
+        listVol = [x.volume for x in self.lineBar[-n - 1:-1]]
+        sumVol = ta.SUM(numpy.array(listVol, dtype=float), timeperiod=n)[-1]
+        self.lineAvgVol.append(round(sumVol / n, 0))
+
+    #----------------------------------------------------------------------
+    def recountRsi(self):
+        """最近N+2根K线（包含当前K线）收盘价的talib.RSI"""
+        n = self.inputRsiLen
+        if len(self.lineBar) < n + 2:
+            return
+
+        listClose = [x.close for x in self.lineBar[-n - 2:]]
+        rsi = ta.RSI(numpy.array(listClose, dtype=float), n)[-1]
+        self.lineRsi.append(round(float(rsi), 3))
+
+    #----------------------------------------------------------------------
+    def recountCmi(self):
+        """CMI，最高最低收盘价包含当前K线"""
+        n = self.inputCmiLen
+        if len(self.lineBar) < n:
+            return
+
+        listClose = [x.close for x in self.lineBar[-n:]]
+        hhv = max(listClose)
+        llv = min(listClose)
+        if hhv == llv:
+            cmi = 100
+        else:
+            cmi = abs(self.lineBar[-1].close - self.lineBar[-2].close) * 100 / (hhv - llv)
+        self.lineCmi.append(round(cmi, 2))
+
+    #----------------------------------------------------------------------
+    def recountBoll(self):
+        """前N根K线（不包含当前K线）收盘价的talib.BBANDS，数据不足时用较短的周期"""
+        l = len(self.lineBar)
+        if l < min(7, self.inputBollLen) + 1:
+            return
+
+        if l < self.inputBollLen + 2:
+            n = l - 1
+        else:
+            n = self.inputBollLen
+
+        listClose = [x.close for x in self.lineBar[-n - 1:-1]]
+        upper, middle, lower = ta.BBANDS(numpy.array(listClose, dtype=float), timeperiod=n,
+                                         nbdevup=self.inputBollStdRate,
+                                         nbdevdn=self.inputBollStdRate, matype=0)
+        self.lineUpperBand.append(upper[-1])
+        self.lineMiddleBand.append(middle[-1])
+        self.lineLowerBand.append(lower[-1])
+
+
+########################################################################
+class FakeStrategy(object):
+    """测试用的策略"""
+
+    #----------------------------------------------------------------------
+    def writeCtaLog(self, content):
+        """记录日志"""
+        pass
+
+
+#----------------------------------------------------------------------
+def makeBarList(count, seed):
+    """生成随机游走的5分钟K线，中间有一段价格和成交量都不变的K线"""
+    random.seed(seed)
+    start = datetime(2017, 6, 1, 9, 0)
+    price = 3000.0
+    barList = []
+    for i in range(count):
+        bar = CtaBarData()
+        bar.vtSymbol = 'IF1706'
+        bar.datetime = start + timedelta(minutes=5 * i)
+        bar.open = price
+
+        if 200 <= i < 240:
+            bar.close = bar.high = bar.low = price
+            bar.volume = 0
+        else:
+            price = round((price + random.gauss(0, 3)) / 0.2) * 0.2
+            bar.close = price
+            bar.high = max(bar.open, bar.close) + random.choice([0, 0.2, 1])
+            bar.low = min(bar.open, bar.close) - random.choice([0, 0.2, 1])
+            bar.volume = random.randint(0, 100)
+        barList.append(bar)
+    return barList
+
+
+########################################################################
+class LineBarIndicatorTest(unittest.TestCase):
+    """增量指标和talib算法的对比"""
+
+    #----------------------------------------------------------------------
+    def testAddBar(self):
+        """逐根K线比较各line*指标的输出"""
+        lineBar = CtaLineBar(FakeStrategy(), lambda bar: None, SETTING)
+        lineBar.curTick = CtaTickData()
+        lineBar.curTick.datetime = datetime(2017, 6, 1, 9, 0)
+        talibBar = TalibLineBar(SETTING)
+
+        for count, bar in enumerate(makeBarList(600, 5)):
+            lineBar.addBar(bar)
+            talibBar.addBar(bar)
+
+            for name in LINE_LIST:
+                new = list(getattr(lineBar, name))
+                old = getattr(talibBar, name)
+                msg = '%s at bar %d' % (name, count)
+                self.assertEqual(bool(new), bool(old), msg)
+                if new:
+                    self.assertAlmostEqual(new[-1], old[-1], places=6, msg=msg)
+
+        # 全部指标都已经开始计算
+        for name in LINE_LIST:
+            self.assertTrue(getattr(lineBar, name), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
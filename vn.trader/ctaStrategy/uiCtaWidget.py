@@ -36,8 +36,9 @@ class CtaValueMonitor(QtGui.QTableWidget):
         
     #----------------------------------------------------------------------
     def updateData(self, data):
-        """更新数据"""
-        if not self.inited:
+        """更新数据，字段发生变化时（如策略重新载入后）重新生成表格"""
+        if not self.inited or len(data) != len(self.keyCellDict) or any(k not in self.keyCellDict for k in data):
+            self.keyCellDict = {}
             self.setColumnCount(len(data))
             self.setHorizontalHeaderLabels(data.keys())
             
@@ -59,6 +60,7 @@ class CtaValueMonitor(QtGui.QTableWidget):
 class CtaStrategyManager(QtGui.QGroupBox):
     """策略管理组件"""
     signal = QtCore.pyqtSignal(type(Event()))
+    signalTimer = QtCore.pyqtSignal(type(Event()))
 
     #----------------------------------------------------------------------
     def __init__(self, ctaEngine, eventEngine, name, parent=None):
@@ -71,6 +73,7 @@ class CtaStrategyManager(QtGui.QGroupBox):
         
         self.initUi()
         self.updateMonitor()
+        self.updateProfileMonitor()
         self.registerEvent()
         
     #----------------------------------------------------------------------
@@ -80,22 +83,27 @@ class CtaStrategyManager(QtGui.QGroupBox):
         
         self.paramMonitor = CtaValueMonitor(self)
         self.varMonitor = CtaValueMonitor(self)
+        self.profileMonitor = CtaValueMonitor(self)
         
         height = 65
         self.paramMonitor.setFixedHeight(height)
         self.varMonitor.setFixedHeight(height)
+        self.profileMonitor.setFixedHeight(height)
         
         buttonInit = QtGui.QPushButton(text.INIT)
         buttonStart = QtGui.QPushButton(text.START)
         buttonStop = QtGui.QPushButton(text.STOP)
+        buttonReload = QtGui.QPushButton(text.RELOAD)
         buttonInit.clicked.connect(self.init)
         buttonStart.clicked.connect(self.start)
         buttonStop.clicked.connect(self.stop)
+        buttonReload.clicked.connect(self.reload)
         
         hbox1 = QtGui.QHBoxLayout()     
         hbox1.addWidget(buttonInit)
         hbox1.addWidget(buttonStart)
         hbox1.addWidget(buttonStop)
+        hbox1.addWidget(buttonReload)
         hbox1.addStretch()
         
         hbox2 = QtGui.QHBoxLayout()
@@ -104,10 +112,14 @@ class CtaStrategyManager(QtGui.QGroupBox):
         hbox3 = QtGui.QHBoxLayout()
         hbox3.addWidget(self.varMonitor)
         
+        hbox4 = QtGui.QHBoxLayout()
+        hbox4.addWidget(self.profileMonitor)
+        
         vbox = QtGui.QVBoxLayout()
         vbox.addLayout(hbox1)
         vbox.addLayout(hbox2)
         vbox.addLayout(hbox3)
+        vbox.addLayout(hbox4)
 
         self.setLayout(vbox)
         
@@ -122,11 +134,21 @@ class CtaStrategyManager(QtGui.QGroupBox):
         if varDict:
             self.varMonitor.updateData(varDict)        
             
+    #----------------------------------------------------------------------
+    def updateProfileMonitor(self, event=None):
+        """显示策略的耗时统计"""
+        profileDict = self.ctaEngine.getStrategyProfile(self.name)
+        if profileDict:
+            self.profileMonitor.updateData(profileDict)
+            
     #----------------------------------------------------------------------
     def registerEvent(self):
         """注册事件监听"""
         self.signal.connect(self.updateMonitor)
         self.eventEngine.register(EVENT_CTA_STRATEGY+self.name, self.signal.emit)
+        
+        self.signalTimer.connect(self.updateProfileMonitor)
+        self.eventEngine.register(EVENT_TIMER, self.signalTimer.emit)
     
     #----------------------------------------------------------------------
     def init(self):
@@ -142,6 +164,11 @@ class CtaStrategyManager(QtGui.QGroupBox):
     def stop(self):
         """停止策略"""
         self.ctaEngine.stopStrategy(self.name)
+        
+    #----------------------------------------------------------------------
+    def reload(self):
+        """重新载入策略"""
+        self.ctaEngine.reloadStrategies([self.name])
 
 
 ########################################################################
@@ -225,8 +252,7 @@ class CtaEngineManager(QtGui.QWidget):
     #----------------------------------------------------------------------
     def initAll(self):
         """全部初始化"""
-        for name in self.ctaEngine.strategyDict.keys():
-            self.ctaEngine.initStrategy(name)    
+        self.ctaEngine.initStrategies(self.ctaEngine.strategyDict.keys())    
             
     #----------------------------------------------------------------------
     def startAll(self):
@@ -19,6 +19,12 @@ DAILY_DB_NAME = 'VnTrader_Daily_Db'
 MINUTE_DB_NAME = 'VnTrader_1Min_Db'
 
 
+#----------------------------------------------------------------------
+def getMinuteDbName(interval):
+    """获取N分钟K线的数据库名称"""
+    return 'VnTrader_%sMin_Db' %interval
+
+
 # CTA引擎中涉及的数据类定义
 from vtConstant import EMPTY_UNICODE, EMPTY_STRING, EMPTY_FLOAT, EMPTY_INT
 
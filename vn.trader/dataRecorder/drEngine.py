@@ -3,21 +3,41 @@
 '''
 本文件中实现了行情数据记录引擎，用于汇总TICK数据，并生成K线插入数据库。
 
-使用DR_setting.json来配置需要收集的合约，以及主力合约代码。
+使用DR_setting.json来配置需要收集的合约。K线数据每个合约只保存一份，
+主力连续合约的K线在使用时通过vtContinuous根据各合约的成交量和持仓量生成。
+vtContinuous目前不生成连续Tick，因此active中配置的主力合约Tick仍然同时保存到主力合约代码下。
+
+K线按照DR_setting.json中session配置的交易时段合成，除1分钟线外还可以通过barInterval
+为每个合约配置其他周期（分钟），N分钟线保存在VnTrader_NMin_Db中。
+
+数据插入线程按集合缓存数据，当缓存数量达到flushSize或距离上次写入超过flushInterval秒时，
+使用insert_many批量写入数据库。写入失败（如数据库连接中断）时数据保留在缓存中，
+等待retryInterval秒后重试，写入线程不会退出。VT_setting.json中dataStoreType设为local时，改为写入本地的列式存储，
+此时DR_setting.json中tickCompression设为true则新建的Tick集合使用差分编码压缩保存。
+写入MongoDB时自动为每个集合创建datetime索引，tickBucket设为true时Tick数据按分钟分桶保存。
+
+记录日志每隔logInterval秒汇总发出一次（各合约的Tick数量、各周期K线数量、写入积压和最近写入时间），
+逐条Tick和K线的日志只在debugLog设为true时发出，用于调试。
 '''
 
 import json
 import os
+import re
 import copy
+import traceback
 from collections import OrderedDict
 from datetime import datetime, timedelta
-from Queue import Queue
+from Queue import Queue, Empty
 from threading import Thread
+from time import time
 
 from eventEngine import *
 from vtGateway import VtSubscribeReq, VtLogData
 from drBase import *
-from vtFunction import todayDate
+from drSession import DrSession, DrBarAggregator
+from vtFunction import todayDate, loadDataStoreSetting, getTickDatetime
+from vtDataStore import VtDataStore
+from vtTickBucket import makeBucketUpdates
 from language import text
 
 
@@ -39,19 +59,65 @@ class DrEngine(object):
         self.today = todayDate()
         
         # 主力合约代码映射字典，key为具体的合约代码（如IF1604），value为主力合约代码（如IF0000）
+        # 只用于Tick数据，主力连续K线由vtContinuous生成
         self.activeSymbolDict = {}
         
         # Tick对象字典
         self.tickDict = {}
         
-        # K线对象字典
+        # K线合成器字典，key为vtSymbol，value为该合约各周期的DrBarAggregator列表
         self.barDict = {}
         
+        # 交易时段配置，key为品种代码（如IF）或者vtSymbol，default为默认时段
+        self.sessionSetting = {}
+        
+        # K线周期配置，key为vtSymbol，default为默认周期，1分钟线总是会合成
+        self.intervalSetting = {}
+        
+        # 时段收盘后等待多少时间推出最后一根K线
+        self.barTimeout = timedelta(seconds=5)
+        
         # 负责执行数据库插入的单独线程相关
         self.active = False                     # 工作状态
         self.queue = Queue()                    # 队列
         self.thread = Thread(target=self.run)   # 线程
         
+        # 批量写入相关
+        self.flushSize = 500                    # 单个集合缓存达到该数量时写入
+        self.flushInterval = 1.0                # 距离上次写入超过该时间（秒）时写入所有缓存
+        self.bufferDict = {}                    # 写入缓存，key为(dbName, collectionName)，value为数据列表
+        self.bufferCount = 0                    # 缓存中的数据数量
+        self.retryInterval = 5.0                # 写入失败后等待多少时间（秒）再重试
+        self.retryTime = 0                      # 写入失败后允许重试的时间
+        
+        # 本地列式存储，为None时写入MongoDB
+        self.dataStore = None
+        storeType, storePath = loadDataStoreSetting()
+        if storeType == 'local':
+            self.dataStore = VtDataStore(storePath)
+        
+        # MongoDB写入相关
+        self.tickBucket = False                 # Tick数据是否按分钟分桶保存
+        self.indexSet = set()                   # 已经创建过索引的集合，元素为(dbName, collectionName)
+        
+        # 压缩Tick数据使用的priceTick，key为集合名，value为priceTick
+        self.priceTickDict = {}
+        
+        # 写入统计
+        self.flushCount = 0                     # 批量写入次数
+        self.insertCount = 0                    # 写入的数据总量
+        self.lastFlushLatency = 0               # 最近一次写入耗时（秒）
+        self.maxFlushLatency = 0                # 最大写入耗时（秒）
+        self.lastWriteTime = None               # 最近一次写入完成的时间
+        self.errorCount = 0                     # 写入失败次数
+        
+        # 日志统计相关
+        self.debugLog = False                   # 是否逐条发出Tick和K线的日志
+        self.logInterval = 60                   # 汇总日志的发出间隔（秒）
+        self.logCount = 0                       # 距离上次发出汇总日志的秒数
+        self.tickCountDict = {}                 # 周期内记录的Tick数量，key为vtSymbol
+        self.barCountDict = {}                  # 周期内记录的K线数量，key为vtSymbol，value为{周期: 数量}
+        
         # 载入设置，订阅行情
         self.loadSetting()
         
@@ -66,6 +132,20 @@ class DrEngine(object):
             if not working:
                 return
             
+            self.flushSize = drSetting.get('flushSize', self.flushSize)
+            self.flushInterval = drSetting.get('flushInterval', self.flushInterval)
+            
+            self.tickBucket = drSetting.get('tickBucket', self.tickBucket)
+            
+            if self.dataStore:
+                self.dataStore.compressTick = drSetting.get('tickCompression', False)
+            
+            self.debugLog = drSetting.get('debugLog', self.debugLog)
+            self.logInterval = drSetting.get('logInterval', self.logInterval)
+            
+            self.sessionSetting = drSetting.get('session', {})
+            self.intervalSetting = drSetting.get('barInterval', {})
+            
             if 'tick' in drSetting:
                 l = drSetting['tick']
                 
@@ -111,8 +191,7 @@ class DrEngine(object):
                     
                     self.mainEngine.subscribe(req, setting[1])  
                     
-                    bar = DrBarData() 
-                    self.barDict[vtSymbol] = bar
+                    self.barDict[vtSymbol] = self.createAggregators(vtSymbol)
                     
             if 'active' in drSetting:
                 d = drSetting['active']
@@ -134,73 +213,146 @@ class DrEngine(object):
         vtSymbol = tick.vtSymbol
 
         # 转化Tick格式
+        getTickDatetime(tick)
         drTick = DrTickData()
         d = drTick.__dict__
         for key in d.keys():
-            if key != 'datetime':
-                d[key] = tick.__getattribute__(key)
-        drTick.datetime = datetime.strptime(' '.join([tick.date, tick.time]), '%Y%m%d %H:%M:%S.%f')            
+            d[key] = tick.__getattribute__(key)
         
         # 更新Tick数据
         if vtSymbol in self.tickDict:
+            if self.dataStore and vtSymbol not in self.priceTickDict:
+                self.updatePriceTick(vtSymbol)
+            
             self.insertData(TICK_DB_NAME, vtSymbol, drTick)
             
             if vtSymbol in self.activeSymbolDict:
                 activeSymbol = self.activeSymbolDict[vtSymbol]
                 self.insertData(TICK_DB_NAME, activeSymbol, drTick)
             
-            # 发出日志
-            self.writeDrLog(text.TICK_LOGGING_MESSAGE.format(symbol=drTick.vtSymbol,
-                                                             time=drTick.time, 
-                                                             last=drTick.lastPrice, 
-                                                             bid=drTick.bidPrice1, 
-                                                             ask=drTick.askPrice1))
+            self.tickCountDict[vtSymbol] = self.tickCountDict.get(vtSymbol, 0) + 1
             
-        # 更新分钟线数据
-        if vtSymbol in self.barDict:
-            bar = self.barDict[vtSymbol]
+            # 调试模式下逐条发出日志
+            if self.debugLog:
+                self.writeDrLog(text.TICK_LOGGING_MESSAGE.format(symbol=drTick.vtSymbol,
+                                                                 time=drTick.time, 
+                                                                 last=drTick.lastPrice, 
+                                                                 bid=drTick.bidPrice1, 
+                                                                 ask=drTick.askPrice1))
             
-            # 如果第一个TICK或者新的一分钟
-            if not bar.datetime or bar.datetime.minute != drTick.datetime.minute:    
-                if bar.vtSymbol:
-                    newBar = copy.copy(bar)
-                    self.insertData(MINUTE_DB_NAME, vtSymbol, newBar)
-                    
-                    if vtSymbol in self.activeSymbolDict:
-                        activeSymbol = self.activeSymbolDict[vtSymbol]
-                        self.insertData(MINUTE_DB_NAME, activeSymbol, newBar)                    
-                    
-                    self.writeDrLog(text.BAR_LOGGING_MESSAGE.format(symbol=bar.vtSymbol, 
-                                                                    time=bar.time, 
-                                                                    open=bar.open, 
-                                                                    high=bar.high, 
-                                                                    low=bar.low, 
-                                                                    close=bar.close))
-                         
-                bar.vtSymbol = drTick.vtSymbol
-                bar.symbol = drTick.symbol
-                bar.exchange = drTick.exchange
-                
-                bar.open = drTick.lastPrice
-                bar.high = drTick.lastPrice
-                bar.low = drTick.lastPrice
-                bar.close = drTick.lastPrice
-                
-                bar.date = drTick.date
-                bar.time = drTick.time
-                bar.datetime = drTick.datetime
-                bar.volume = drTick.volume
-                bar.openInterest = drTick.openInterest        
-            # 否则继续累加新的K线
-            else:                               
-                bar.high = max(bar.high, drTick.lastPrice)
-                bar.low = min(bar.low, drTick.lastPrice)
-                bar.close = drTick.lastPrice            
+        # 更新K线数据
+        if vtSymbol in self.barDict:
+            for aggregator in self.barDict[vtSymbol]:
+                bar = aggregator.updateTick(drTick)
+                if bar:
+                    self.insertBar(aggregator.interval, bar)
+
+    #----------------------------------------------------------------------
+    def processTimerEvent(self, event):
+        """定时检查，推出交易时段收盘后没有后续tick的K线，并定期发出汇总日志"""
+        now = datetime.now()
+        for l in self.barDict.values():
+            for aggregator in l:
+                bar = aggregator.checkTimeout(now, self.barTimeout)
+                if bar:
+                    self.insertBar(aggregator.interval, bar)
+        
+        self.logCount += 1
+        if self.logCount >= self.logInterval:
+            self.logCount = 0
+            self.writeStatisticsLog()
+    
+    #----------------------------------------------------------------------
+    def writeStatisticsLog(self):
+        """发出周期内的记录统计日志，然后清空统计"""
+        metrics = self.getMetrics()
+        backlog = metrics['queueSize'] + metrics['bufferCount']
+        
+        # 没有新数据也没有积压时不发出日志，避免非交易时段刷屏
+        if not self.tickCountDict and not self.barCountDict and not backlog:
+            return
+        
+        symbolList = []
+        for vtSymbol in sorted(set(self.tickCountDict.keys()) | set(self.barCountDict.keys())):
+            l = [vtSymbol]
+            if vtSymbol in self.tickCountDict:
+                l.append('Tick:%s' %self.tickCountDict[vtSymbol])
+            for interval, count in sorted(self.barCountDict.get(vtSymbol, {}).items()):
+                l.append('%sMin:%s' %(interval, count))
+            symbolList.append(' '.join(l))
+        
+        if self.lastWriteTime:
+            lastWrite = self.lastWriteTime.strftime('%H:%M:%S')
+        else:
+            lastWrite = '-'
+        
+        content = text.STATISTICS_LOGGING_MESSAGE.format(interval=self.logInterval,
+                                                         tick=sum(self.tickCountDict.values()),
+                                                         bar=sum([sum(d.values()) for d in self.barCountDict.values()]),
+                                                         backlog=backlog,
+                                                         lastWrite=lastWrite)
+        if symbolList:
+            content = u'%s\n%s' %(content, u'\n'.join(symbolList))
+        self.writeDrLog(content)
+        
+        self.tickCountDict.clear()
+        self.barCountDict.clear()
+    
+    #----------------------------------------------------------------------
+    def updatePriceTick(self, vtSymbol):
+        """从合约信息中获取priceTick，主力合约使用相同的priceTick，合约信息尚未收到时下次再查"""
+        contract = self.mainEngine.getContract(vtSymbol)
+        if not contract or not contract.priceTick:
+            return
+        
+        self.priceTickDict[vtSymbol] = contract.priceTick
+        if vtSymbol in self.activeSymbolDict:
+            self.priceTickDict[self.activeSymbolDict[vtSymbol]] = contract.priceTick
+    
+    #----------------------------------------------------------------------
+    def getSession(self, vtSymbol):
+        """获取合约的交易时段，依次查找vtSymbol、品种代码、default的配置"""
+        product = re.match(r'[A-Za-z]*', vtSymbol).group()
+        
+        for key in [vtSymbol, product, 'default']:
+            if key in self.sessionSetting:
+                return DrSession(self.sessionSetting[key])
+        
+        # 没有配置时视为全天连续交易
+        return DrSession()
+    
+    #----------------------------------------------------------------------
+    def createAggregators(self, vtSymbol):
+        """创建合约各周期的K线合成器"""
+        session = self.getSession(vtSymbol)
+        
+        intervals = set([1])
+        intervals.update(self.intervalSetting.get(vtSymbol, self.intervalSetting.get('default', [])))
+        
+        return [DrBarAggregator(interval, session) for interval in sorted(intervals)]
+    
+    #----------------------------------------------------------------------
+    def insertBar(self, interval, bar):
+        """保存完成的K线"""
+        dbName = getMinuteDbName(interval)
+        self.insertData(dbName, bar.vtSymbol, bar)
+        
+        d = self.barCountDict.setdefault(bar.vtSymbol, {})
+        d[interval] = d.get(interval, 0) + 1
+        
+        if self.debugLog:
+            self.writeDrLog(text.BAR_LOGGING_MESSAGE.format(symbol=bar.vtSymbol, 
+                                                            time=bar.time, 
+                                                            open=bar.open, 
+                                                            high=bar.high, 
+                                                            low=bar.low, 
+                                                            close=bar.close))
 
     #----------------------------------------------------------------------
     def registerEvent(self):
         """注册事件监听"""
         self.eventEngine.register(EVENT_TICK, self.procecssTickEvent)
+        self.eventEngine.register(EVENT_TIMER, self.processTimerEvent)
  
     #----------------------------------------------------------------------
     def insertData(self, dbName, collectionName, data):
@@ -210,13 +362,110 @@ class DrEngine(object):
     #----------------------------------------------------------------------
     def run(self):
         """运行插入线程"""
+        lastFlushTime = time()
+        
         while self.active:
+            timeout = max(lastFlushTime + self.flushInterval - time(), 0.01)
             try:
-                dbName, collectionName, d = self.queue.get(block=True, timeout=1)
-                self.mainEngine.dbInsert(dbName, collectionName, d)
+                dbName, collectionName, d = self.queue.get(block=True, timeout=timeout)
+                self.bufferData(dbName, collectionName, d)
             except Empty:
                 pass
             
+            if time() - lastFlushTime >= self.flushInterval:
+                self.flushAll()
+                lastFlushTime = time()
+        
+        # 退出前写入队列和缓存中剩余的数据
+        while True:
+            try:
+                dbName, collectionName, d = self.queue.get(block=False)
+                self.bufferData(dbName, collectionName, d)
+            except Empty:
+                break
+        self.flushAll(force=True)
+        
+        if self.dataStore:
+            self.dataStore.close()
+    
+    #----------------------------------------------------------------------
+    def bufferData(self, dbName, collectionName, d):
+        """缓存数据，集合缓存达到数量阈值时立即写入"""
+        key = (dbName, collectionName)
+        l = self.bufferDict.get(key, None)
+        if l is None:
+            l = []
+            self.bufferDict[key] = l
+        
+        l.append(d)
+        self.bufferCount += 1
+        
+        if len(l) >= self.flushSize:
+            self.flush(key)
+    
+    #----------------------------------------------------------------------
+    def flush(self, key, force=False):
+        """将某个集合的缓存写入数据库，写入失败时数据保留在缓存中，
+        retryInterval秒内不再尝试写入，force为True时忽略等待时间"""
+        if not force and time() < self.retryTime:
+            return
+        
+        l = self.bufferDict.get(key, None)
+        if not l:
+            return
+        
+        start = time()
+        dbName, collectionName = key
+        try:
+            if self.dataStore:
+                self.dataStore.appendMany(dbName, collectionName, l, self.priceTickDict.get(collectionName, None))
+            else:
+                if key not in self.indexSet:
+                    self.mainEngine.dbCreateIndex(dbName, collectionName, 'datetime')
+                    self.indexSet.add(key)
+                
+                if self.tickBucket and dbName == TICK_DB_NAME:
+                    self.mainEngine.dbBulkUpsert(dbName, collectionName, makeBucketUpdates(l))
+                else:
+                    self.mainEngine.dbInsertMany(dbName, collectionName, l)
+        except Exception:
+            self.errorCount += 1
+            self.retryTime = time() + self.retryInterval
+            self.writeDrLog(text.FLUSH_ERROR_MESSAGE.format(collection=collectionName,
+                                                            count=len(l),
+                                                            error=traceback.format_exc()))
+            return
+        latency = time() - start
+        
+        del self.bufferDict[key]
+        self.bufferCount -= len(l)
+        
+        self.flushCount += 1
+        self.insertCount += len(l)
+        self.lastFlushLatency = latency
+        self.maxFlushLatency = max(self.maxFlushLatency, latency)
+        self.lastWriteTime = datetime.now()
+    
+    #----------------------------------------------------------------------
+    def flushAll(self, force=False):
+        """将所有缓存写入数据库"""
+        for key in self.bufferDict.keys():
+            self.flush(key, force)
+    
+    #----------------------------------------------------------------------
+    def getMetrics(self):
+        """查询写入统计，返回字典"""
+        d = OrderedDict()
+        d['queueSize'] = self.queue.qsize()             # 队列中等待缓存的数据数量
+        d['bufferCount'] = self.bufferCount             # 缓存中等待写入的数据数量
+        d['flushCount'] = self.flushCount
+        d['insertCount'] = self.insertCount
+        d['lastFlushLatency'] = self.lastFlushLatency
+        d['maxFlushLatency'] = self.maxFlushLatency
+        d['lastWriteTime'] = self.lastWriteTime
+        d['errorCount'] = self.errorCount
+        return d
+            
     #----------------------------------------------------------------------
     def start(self):
         """启动"""
@@ -0,0 +1,172 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了按交易时段合成多周期K线的功能：
+1. DrSession保存一个品种的交易时段，支持跨越午夜的夜盘时段
+2. DrBarAggregator将tick合成为N分钟K线，K线边界从每个交易时段的开始时间对齐，
+   时段结束时即使不满N分钟也结束当前K线（如10:15的休盘）
+3. 时段收盘的tick（如15:00:00）归入最后一分钟的K线，开盘前一分钟的集合竞价tick
+   归入第一分钟的K线
+'''
+
+from datetime import timedelta
+
+from drBase import DrBarData
+
+
+MINUTES_PER_DAY = 1440
+
+
+#----------------------------------------------------------------------
+def parseMinute(s):
+    """将HH:MM格式的时间转换为当日的分钟数"""
+    hour, minute = s.split(':')
+    return int(hour) * 60 + int(minute)
+
+
+########################################################################
+class DrSession(object):
+    """交易时段"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, sessionList=None):
+        """Constructor，sessionList为[['09:00', '10:15'], ...]，为空时视为全天连续交易"""
+        self.sessionList = []           # (开始分钟, 时长分钟)的列表
+
+        if sessionList:
+            for start, end in sessionList:
+                startMinute = parseMinute(start)
+                length = (parseMinute(end) - startMinute) % MINUTES_PER_DAY
+                self.sessionList.append((startMinute, length))
+        else:
+            self.sessionList.append((0, MINUTES_PER_DAY))
+
+    #----------------------------------------------------------------------
+    def locate(self, minute):
+        """查询某一分钟所在的时段，返回(时段序号, 距离时段开始的分钟数, 归入的分钟相对实际分钟的调整)，
+        不在交易时段内返回None"""
+        for i, (startMinute, length) in enumerate(self.sessionList):
+            offset = (minute - startMinute) % MINUTES_PER_DAY
+
+            if offset < length:
+                return i, offset, 0
+            # 收盘时刻的tick归入最后一分钟
+            elif offset == length:
+                return i, length - 1, -1
+            # 开盘前一分钟的集合竞价归入第一分钟
+            elif offset == MINUTES_PER_DAY - 1:
+                return i, 0, 1
+
+        return None
+
+    #----------------------------------------------------------------------
+    def getLength(self, index):
+        """获取时段的长度（分钟）"""
+        return self.sessionList[index][1]
+
+
+########################################################################
+class DrBarAggregator(object):
+    """按交易时段对齐的N分钟K线合成器"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, interval, session):
+        """Constructor"""
+        self.interval = interval            # K线周期（分钟）
+        self.session = session              # DrSession对象
+
+        self.bar = None                     # 当前正在合成的K线
+        self.barKey = None                  # 当前K线的(时段序号, 起始偏移)
+        self.barEnd = None                  # 当前K线的结束时间，datetime对象
+        self.lastVolume = None              # 上一个tick的累计成交量，用于计算K线成交量
+
+    #----------------------------------------------------------------------
+    def updateTick(self, tick):
+        """更新tick，返回已经完成的K线（没有则返回None）"""
+        dt = tick.datetime
+        minute = dt.hour * 60 + dt.minute
+
+        location = self.session.locate(minute)
+        if not location:
+            return None
+        index, offset, shift = location
+        
+        # 按归入的分钟调整时间，之后的比较都使用调整后的时间
+        if shift:
+            dt += timedelta(minutes=shift)
+
+        # 已经结束的K线之前的延迟tick直接丢弃
+        if self.barEnd and not self.bar and dt < self.barEnd:
+            return None
+
+        barOffset = offset // self.interval * self.interval
+        key = (index, barOffset)
+
+        finishedBar = None
+        if self.bar and (key != self.barKey or dt >= self.barEnd):
+            finishedBar = self.finishBar()
+
+        if not self.bar:
+            self.newBar(tick, dt, key, offset - barOffset)
+        else:
+            bar = self.bar
+            bar.high = max(bar.high, tick.lastPrice)
+            bar.low = min(bar.low, tick.lastPrice)
+            bar.close = tick.lastPrice
+            bar.openInterest = tick.openInterest
+
+        self.updateVolume(tick)
+
+        return finishedBar
+
+    #----------------------------------------------------------------------
+    def newBar(self, tick, dt, key, minutesIn):
+        """创建新的K线，dt为调整后的tick时间"""
+        index, barOffset = key
+
+        # K线开始时间对齐到周期边界，结束时间不超过时段收盘
+        dt = dt.replace(second=0, microsecond=0)
+        start = dt - timedelta(minutes=minutesIn)
+        length = min(self.interval, self.session.getLength(index) - barOffset)
+
+        bar = DrBarData()
+        bar.vtSymbol = tick.vtSymbol
+        bar.symbol = tick.symbol
+        bar.exchange = tick.exchange
+
+        bar.open = tick.lastPrice
+        bar.high = tick.lastPrice
+        bar.low = tick.lastPrice
+        bar.close = tick.lastPrice
+
+        bar.datetime = start
+        bar.date = start.strftime('%Y%m%d')
+        bar.time = start.strftime('%H:%M:%S')
+
+        bar.volume = 0
+        bar.openInterest = tick.openInterest
+
+        self.bar = bar
+        self.barKey = key
+        self.barEnd = start + timedelta(minutes=length)
+
+    #----------------------------------------------------------------------
+    def updateVolume(self, tick):
+        """用累计成交量的变化更新K线成交量，累计成交量变小（新交易日）时重新计算"""
+        if self.lastVolume is not None and tick.volume >= self.lastVolume:
+            self.bar.volume += tick.volume - self.lastVolume
+        self.lastVolume = tick.volume
+
+    #----------------------------------------------------------------------
+    def finishBar(self):
+        """结束当前K线并返回"""
+        bar = self.bar
+        self.bar = None
+        return bar
+
+    #----------------------------------------------------------------------
+    def checkTimeout(self, now, delay):
+        """检查当前K线是否已经超过结束时间delay，是则结束并返回该K线（用于时段收盘时推出最后一根K线）"""
+        if self.bar and now >= self.barEnd + delay:
+            return self.finishBar()
+        return None
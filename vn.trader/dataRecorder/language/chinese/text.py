@@ -13,4 +13,6 @@ DOMINANT_CONTRACT = u'主力合约'
 DOMINANT_SYMBOL = u'主力代码'
 
 TICK_LOGGING_MESSAGE = u'记录Tick数据{symbol}，时间:{time}, last:{last}, bid:{bid}, ask:{ask}'
-BAR_LOGGING_MESSAGE = u'记录分钟线数据{symbol}，时间:{time}, O:{open}, H:{high}, L:{low}, C:{close}'
\ No newline at end of file
+BAR_LOGGING_MESSAGE = u'记录分钟线数据{symbol}，时间:{time}, O:{open}, H:{high}, L:{low}, C:{close}'
+STATISTICS_LOGGING_MESSAGE = u'最近{interval}秒记录Tick数据{tick}条，K线数据{bar}根，待写入{backlog}条，最近写入时间:{lastWrite}'
+FLUSH_ERROR_MESSAGE = u'写入{collection}失败，{count}条数据保留在缓存中等待重试：{error}'
\ No newline at end of file
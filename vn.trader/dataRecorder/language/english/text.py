@@ -12,4 +12,6 @@ DOMINANT_CONTRACT = u'Dominant Contract'
 DOMINANT_SYMBOL = u'Dominant Symbol'
 
 TICK_LOGGING_MESSAGE = u'Record Tick Data {symbol}, Time:{time}, last:{last}, bid:{bid}, ask:{ask}'
-BAR_LOGGING_MESSAGE = u'Record Bar Data {symbol}, Time:{time}, O:{open}, H:{high}, L:{low}, C:{close}'
\ No newline at end of file
+BAR_LOGGING_MESSAGE = u'Record Bar Data {symbol}, Time:{time}, O:{open}, H:{high}, L:{low}, C:{close}'
+STATISTICS_LOGGING_MESSAGE = u'Recorded {tick} Ticks and {bar} Bars in last {interval}s, Backlog:{backlog}, Last Write:{lastWrite}'
+FLUSH_ERROR_MESSAGE = u'Failed to write {collection}, {count} records kept in buffer for retry: {error}'
\ No newline at end of file
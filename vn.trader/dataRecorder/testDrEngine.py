@@ -0,0 +1,144 @@
+# encoding: UTF-8
+
+'''
+行情记录引擎写入线程的测试，在vn.trader/dataRecorder目录下运行：
+python testDrEngine.py
+'''
+
+import os
+import sys
+import unittest
+from time import sleep
+
+# 和vtEngine一样通过dataRecorder包导入，使用dataRecorder自己的language包
+path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, path)
+
+from dataRecorder.drEngine import DrEngine
+from dataRecorder.drBase import MINUTE_DB_NAME
+
+
+########################################################################
+class FakeMainEngine(object):
+    """测试用的主引擎，前failCount次批量写入抛出异常"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, failCount):
+        """Constructor"""
+        self.failCount = failCount
+        self.insertList = []
+
+    #----------------------------------------------------------------------
+    def dbCreateIndex(self, dbName, collectionName, field):
+        """创建索引"""
+        pass
+
+    #----------------------------------------------------------------------
+    def dbInsertMany(self, dbName, collectionName, l):
+        """批量写入"""
+        if self.failCount:
+            self.failCount -= 1
+            raise IOError('connection lost')
+        self.insertList.extend(l)
+
+
+########################################################################
+class FakeEventEngine(object):
+    """测试用的事件引擎，记录发出的事件"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.eventList = []
+
+    #----------------------------------------------------------------------
+    def register(self, type_, handler):
+        """注册事件处理函数"""
+        pass
+
+    #----------------------------------------------------------------------
+    def put(self, event):
+        """推送事件"""
+        self.eventList.append(event)
+
+
+########################################################################
+class TestDrEngine(DrEngine):
+    """不读取配置文件、写入MongoDB的行情记录引擎"""
+
+    #----------------------------------------------------------------------
+    def loadSetting(self):
+        """不载入设置"""
+        self.dataStore = None
+
+
+########################################################################
+class FlushErrorTest(unittest.TestCase):
+    """写入失败测试"""
+
+    #----------------------------------------------------------------------
+    def setUp(self):
+        """创建引擎"""
+        self.mainEngine = FakeMainEngine(1)
+        self.eventEngine = FakeEventEngine()
+        self.engine = TestDrEngine(self.mainEngine, self.eventEngine)
+        self.engine.flushSize = 2
+        self.engine.flushInterval = 0.01
+        self.engine.retryInterval = 0.05
+
+    #----------------------------------------------------------------------
+    def insert(self, n):
+        """向队列放入n条数据"""
+        for i in range(n):
+            self.engine.queue.put((MINUTE_DB_NAME, 'IF1706', {'i': i}))
+
+    #----------------------------------------------------------------------
+    def testFlushKeepsBuffer(self):
+        """写入失败时数据保留在缓存中，等待时间内不重试"""
+        key = (MINUTE_DB_NAME, 'IF1706')
+        self.engine.bufferData(key[0], key[1], {'i': 0})
+        self.engine.bufferData(key[0], key[1], {'i': 1})
+
+        self.assertEqual(self.engine.bufferDict[key], [{'i': 0}, {'i': 1}])
+        self.assertEqual(self.engine.bufferCount, 2)
+        self.assertEqual(self.engine.errorCount, 1)
+        self.assertEqual(len(self.eventEngine.eventList), 1)
+
+        # 等待时间内只缓存，不写入
+        self.engine.bufferData(key[0], key[1], {'i': 2})
+        self.assertEqual(self.engine.bufferCount, 3)
+        self.assertEqual(self.mainEngine.insertList, [])
+
+        # 等待时间过后重试，数据不丢失
+        sleep(self.engine.retryInterval)
+        self.engine.flushAll()
+        self.assertEqual(self.mainEngine.insertList, [{'i': 0}, {'i': 1}, {'i': 2}])
+        self.assertEqual(self.engine.bufferDict, {})
+        self.assertEqual(self.engine.bufferCount, 0)
+
+    #----------------------------------------------------------------------
+    def testThreadSurvives(self):
+        """写入失败后写入线程继续运行，之后的数据正常写入"""
+        self.engine.start()
+        self.insert(2)
+        sleep(0.02)
+        self.insert(2)
+        sleep(0.2)
+
+        self.assertTrue(self.engine.thread.is_alive())
+        self.assertEqual(self.engine.errorCount, 1)
+        self.assertEqual(len(self.mainEngine.insertList), 4)
+
+        self.insert(1)
+        self.engine.stop()
+        self.assertEqual(len(self.mainEngine.insertList), 5)
+        self.assertEqual(self.engine.getMetrics()['bufferCount'], 0)
+
+    #----------------------------------------------------------------------
+    def tearDown(self):
+        """停止写入线程"""
+        self.engine.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,12 @@ EVENT_ACCOUNT = 'eAccount.'             # 账户回报事件
 EVENT_CONTRACT = 'eContract.'           # 合约基础信息回报事件
 EVENT_ERROR = 'eError.'                 # 错误回报事件
 
+# Level2相关
+EVENT_L2_ORDER = 'eL2Order'             # L2逐笔委托事件
+EVENT_L2_TRADE = 'eL2Trade'             # L2逐笔成交事件
+EVENT_L2_DEPTH = 'eL2Depth.'            # L2重建后的盘口变化事件，后接具体的vtSymbol
+EVENT_L2_QUEUE = 'eL2Queue.'            # L2委托排队位置变化事件，后接具体的vtSymbol
+
 # CTA模块相关
 EVENT_CTA_LOG = 'eCtaLog'               # CTA相关的日志事件
 EVENT_CTA_STRATEGY = 'eCtaStrategy.'    # CTA策略状态变化事件
@@ -31,6 +37,12 @@ EVENT_CTA_STRATEGY = 'eCtaStrategy.'    # CTA策略状态变化事件
 # 行情记录模块相关
 EVENT_DATARECORDER_LOG = 'eDataRecorderLog' # 行情记录日志更新事件
 
+# 风控模块相关
+EVENT_RM_QUEUE = 'eRmQueue'             # 风控排队委托处理事件
+
+# 组合盈亏相关
+EVENT_PORTFOLIO = 'ePortfolio'          # 组合盈亏更新事件
+
 # Wind接口相关
 EVENT_WIND_CONNECTREQ = 'eWindConnectReq'   # Wind接口请求连接事件
 
@@ -158,6 +158,16 @@ class CtpGateway(VtGateway):
         """撤单"""
         self.tdApi.cancelOrder(cancelOrderReq)
         
+    #----------------------------------------------------------------------
+    def sendOrders(self, orderReqList):
+        """批量发单"""
+        return self.tdApi.sendOrders(orderReqList)
+        
+    #----------------------------------------------------------------------
+    def cancelOrders(self, cancelOrderReqList):
+        """批量撤单"""
+        self.tdApi.cancelOrders(cancelOrderReqList)
+        
     #----------------------------------------------------------------------
     def qryAccount(self):
         """查询账户资金"""
@@ -713,7 +723,7 @@ class CtpTdApi(TdApi):
         pos.position += data['Position']
         pos.positionProfit += data['PositionProfit']
         
-        # 计算持仓均价
+        # 计算持仓均价，PositionCost包含合约乘数，推送前再除以合约大小
         if pos.position:
             pos.price = (cost + data['PositionCost']) / pos.position
         
@@ -725,8 +735,12 @@ class CtpTdApi(TdApi):
         
         # 查询回报结束
         if last:
-            # 遍历推送
+            # 遍历推送，持仓均价换算为每单位的价格，合约信息尚未收到的持仓等下次查询再推送
             for pos in self.posDict.values():
+                size = self.symbolSizeDict.get(pos.symbol, None)
+                if not size:
+                    continue
+                pos.price /= size
                 self.gateway.onPosition(pos)
             
             # 清空缓存
@@ -1383,9 +1397,8 @@ class CtpTdApi(TdApi):
         self.reqQryInvestorPosition(req, self.reqID)
         
     #----------------------------------------------------------------------
-    def sendOrder(self, orderReq):
-        """发单"""
-        self.reqID += 1
+    def makeOrderReq(self, orderReq):
+        """生成报单请求，同时分配新的报单引用"""
         self.orderRef += 1
         
         req = {}
@@ -1420,8 +1433,15 @@ class CtpTdApi(TdApi):
         if orderReq.priceType == PRICETYPE_FOK:
             req['OrderPriceType'] = defineDict["THOST_FTDC_OPT_LimitPrice"]
             req['TimeCondition'] = defineDict['THOST_FTDC_TC_IOC']
-            req['VolumeCondition'] = defineDict['THOST_FTDC_VC_CV']        
+            req['VolumeCondition'] = defineDict['THOST_FTDC_VC_CV']
         
+        return req
+    
+    #----------------------------------------------------------------------
+    def sendOrder(self, orderReq):
+        """发单"""
+        self.reqID += 1
+        req = self.makeOrderReq(orderReq)
         self.reqOrderInsert(req, self.reqID)
         
         # 返回订单号（字符串），便于某些算法进行动态管理
@@ -1447,6 +1467,38 @@ class CtpTdApi(TdApi):
         
         self.reqOrderAction(req, self.reqID)
         
+    #----------------------------------------------------------------------
+    def sendOrders(self, orderReqList):
+        """批量发单，连续调用报单函数，返回订单号列表"""
+        vtOrderIDList = []
+        for orderReq in orderReqList:
+            self.reqID += 1
+            req = self.makeOrderReq(orderReq)
+            self.reqOrderInsert(req, self.reqID)
+            vtOrderIDList.append('.'.join([self.gatewayName, str(self.orderRef)]))
+        
+        return vtOrderIDList
+    
+    #----------------------------------------------------------------------
+    def cancelOrders(self, cancelOrderReqList):
+        """批量撤单"""
+        actionFlag = defineDict['THOST_FTDC_AF_Delete']
+        
+        for cancelOrderReq in cancelOrderReqList:
+            self.reqID += 1
+            
+            req = {}
+            req['InstrumentID'] = cancelOrderReq.symbol
+            req['ExchangeID'] = cancelOrderReq.exchange
+            req['OrderRef'] = cancelOrderReq.orderID
+            req['FrontID'] = cancelOrderReq.frontID
+            req['SessionID'] = cancelOrderReq.sessionID
+            req['ActionFlag'] = actionFlag
+            req['BrokerID'] = self.brokerID
+            req['InvestorID'] = self.userID
+            
+            self.reqOrderAction(req, self.reqID)
+        
     #----------------------------------------------------------------------
     def close(self):
         """关闭"""
@@ -19,6 +19,7 @@ from copy import copy
 
 from vnib import *
 from vtGateway import *
+from vtOrderBook import VtOrderBook
 from language import text
 
 
@@ -123,6 +124,9 @@ class IbGateway(VtGateway):
         self.tickerId = 0               # 订阅行情时的代码编号    
         self.tickDict = {}              # tick快照字典，key为tickerId，value为VtTickData对象
         self.tickProductDict = {}       # tick对应的产品类型字典，key为tickerId，value为产品类型
+        self.bookDict = {}              # 深度行情订单簿字典，key为tickerId，value为VtOrderBook对象
+        self.depthRowDict = {}          # 深度行情逐行报价字典，key为tickerId，value为(卖盘, 买盘)的[价格, 数量]列表
+        self.depthRows = 5              # 订阅深度行情的行数，为0时不订阅
         
         self.orderId  = 0               # 订单编号
         self.orderDict = {}             # 报单字典，key为orderId，value为VtOrderData对象
@@ -161,6 +165,7 @@ class IbGateway(VtGateway):
             self.port = int(setting['port'])
             self.clientId = int(setting['clientId'])
             self.accountCode = str(setting['accountCode'])
+            self.depthRows = int(setting.get('depthRows', self.depthRows))
         except KeyError:
             log = VtLogData()
             log.gatewayName = self.gatewayName
@@ -216,6 +221,13 @@ class IbGateway(VtGateway):
         tick.gatewayName = self.gatewayName
         self.tickDict[self.tickerId] = tick   
         self.tickProductDict[self.tickerId] = subscribeReq.productClass
+        
+        # 订阅深度行情，使用单独的tickerId并对应到同一个Tick对象，推送通过updateMktDepth和updateMktDepthL2更新订单簿
+        if self.depthRows:
+            self.tickerId += 1
+            self.api.reqMktDepth(self.tickerId, contract, self.depthRows, TagValueList())
+            self.tickDict[self.tickerId] = tick
+            self.tickProductDict[self.tickerId] = subscribeReq.productClass
 
     #----------------------------------------------------------------------
     def sendOrder(self, orderReq):
@@ -301,6 +313,8 @@ class IbWrapper(IbApi):
         self.accountDict = gateway.accountDict      # account字典
         self.contractDict = gateway.contractDict    # contract字典
         self.tickProductDict = gateway.tickProductDict
+        self.bookDict = gateway.bookDict
+        self.depthRowDict = gateway.depthRowDict
         self.subscribeReqDict = gateway.subscribeReqDict
 
     #----------------------------------------------------------------------
@@ -582,13 +596,62 @@ class IbWrapper(IbApi):
 
     #----------------------------------------------------------------------
     def updateMktDepth(self, id_, position, operation, side, price, size):
-        """"""
-        pass
+        """深度行情推送（按档位位置增量更新）"""
+        self.updateDepth(id_, position, operation, side, price, size)
 
     #----------------------------------------------------------------------
     def updateMktDepthL2(self, id_, position, marketMaker, operation, side, price, size):
-        """"""
-        pass
+        """L2深度行情推送（按做市商报价行增量更新），同一价格的报价合并为一个档位"""
+        self.updateDepth(id_, position, operation, side, price, size)
+
+    #----------------------------------------------------------------------
+    def updateDepth(self, id_, position, operation, side, price, size):
+        """按行位置更新深度行情，再将受影响价格上各行的数量汇总到订单簿"""
+        if id_ not in self.tickDict:
+            return
+        
+        if id_ not in self.bookDict:
+            self.bookDict[id_] = VtOrderBook()
+            self.depthRowDict[id_] = ([], [])
+        book = self.bookDict[id_]
+        
+        # side为1代表买盘，0代表卖盘
+        rows = self.depthRowDict[id_][side]
+        if side == 1:
+            updateLevel = book.updateBid
+        else:
+            updateLevel = book.updateAsk
+        
+        # IB按行位置推送，operation为0代表插入，1代表更新，2代表删除，
+        # 插入和删除会移动之后各行的位置，L2行情中同一价格可能有多个做市商的报价行
+        priceSet = set()
+        if operation == 0:
+            rows.insert(position, [price, size])
+            priceSet.add(price)
+        elif position < len(rows):
+            priceSet.add(rows[position][0])
+            if operation == 1:
+                rows[position] = [price, size]
+                priceSet.add(price)
+            else:
+                del rows[position]
+        
+        for p in priceSet:
+            updateLevel(p, sum([row[1] for row in rows if row[0] == p]))
+        
+        # 盘口变化时才更新tick缓存，推送规则和tickPrice相同
+        if book.checkTopChanged():
+            tick = self.tickDict[id_]
+            book.fillTick(tick)
+            
+            if self.tickProductDict[id_] == PRODUCT_FOREX:
+                tick.lastPrice = (tick.bidPrice1 + tick.askPrice1) / 2
+                dt = datetime.now()
+                tick.time = dt.strftime('%H:%M:%S.%f')
+                tick.date = dt.strftime('%Y%m%d')
+                
+                newtick = copy(tick)
+                self.gateway.onTick(newtick)
 
     #----------------------------------------------------------------------
     def updateNewsBulletin(self, msgId, msgType, newsMessage, originExch):
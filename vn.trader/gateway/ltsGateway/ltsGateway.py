@@ -69,6 +69,8 @@ class LtsGateway(VtGateway):
         self.tdConnected = False
         self.qryConnected = False
         
+        self.l2Api = None               # L2逐笔行情接口，只有配置了l2Address才创建
+        
         self.qryEnabled = False         # 是否要启动循环查询
     
     #----------------------------------------------------------------------
@@ -112,6 +114,10 @@ class LtsGateway(VtGateway):
         self.tdApi.connect(userID, tdPassword, brokerID, tdAddress, productInfo, authCode)
         self.qryApi.connect(userID, tdPassword, brokerID, qryAddress, productInfo, authCode)
         
+        # 可选的L2逐笔行情
+        if 'l2Address' in setting:
+            self.connectL2(setting)
+        
         # 初始化并启动查询
         self.initQuery()
         self.startQuery()
@@ -150,6 +156,29 @@ class LtsGateway(VtGateway):
             self.tdApi.close()
         if self.qryConnected:
             self.qryApi.close()        
+        if self.l2Api:
+            self.l2Api.close()
+            
+    #----------------------------------------------------------------------
+    def connectL2(self, setting):
+        """连接L2逐笔行情"""
+        try:
+            from ltsL2Api import LtsL2Api
+        except ImportError:
+            log = VtLogData()
+            log.gatewayName = self.gatewayName
+            log.logContent = u'载入L2行情模块失败，请检查vnltsl2'
+            self.onLog(log)
+            return
+        
+        l2UserID = str(setting.get('l2UserID', setting['userID']))
+        l2Password = str(setting.get('l2Password', setting['mdPassword']))
+        brokerID = str(setting['brokerID'])
+        l2Address = str(setting['l2Address'])
+        
+        if not self.l2Api:
+            self.l2Api = LtsL2Api(self)
+        self.l2Api.connect(l2UserID, l2Password, brokerID, l2Address)
         
     #----------------------------------------------------------------------
     def initQuery(self):
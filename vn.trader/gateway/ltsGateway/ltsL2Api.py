@@ -0,0 +1,247 @@
+# encoding: UTF-8
+
+'''
+vn.lts的L2行情接入，只负责逐笔委托和逐笔成交，转化后推送给L2引擎进行订单簿重建。
+
+由于需要单独的vnltsl2模块和L2行情权限，只有在LTS_connect.json中配置了l2Address时
+才会由LtsGateway载入本文件。
+'''
+
+import os
+
+from vnltsl2 import L2MdApi
+from vtGateway import *
+
+
+# 交易所类型映射（L2行情中的交易所代码）
+exchangeMapReverse = {}
+exchangeMapReverse['SSE'] = EXCHANGE_SSE
+exchangeMapReverse['SZE'] = EXCHANGE_SZSE
+
+# 功能码映射
+FUNCTIONCODE_BUY = 'B'          # 买入
+FUNCTIONCODE_SELL = 'S'         # 卖出
+FUNCTIONCODE_CANCEL = 'C'       # 撤单（深交所撤单通过逐笔成交推送）
+
+
+########################################################################
+class LtsL2Api(L2MdApi):
+    """LTS L2行情API实现"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, gateway):
+        """Constructor"""
+        super(LtsL2Api, self).__init__()
+
+        self.gateway = gateway                     # gateway对象
+        self.gatewayName = gateway.gatewayName     # gateway对象名称
+
+        self.reqID = EMPTY_INT                  # 操作请求编号
+
+        self.connectionStatus = False           # 连接状态
+        self.loginStatus = False                # 登陆状态
+
+        self.userID = EMPTY_STRING          # 账号
+        self.password = EMPTY_STRING        # 密码
+        self.brokerID = EMPTY_STRING        # 经纪商代码
+        self.address = EMPTY_STRING         # 服务器地址
+
+        # 合约代码缓存，避免每笔数据都拼接vtSymbol
+        self.vtSymbolDict = {}
+
+    #----------------------------------------------------------------------
+    def onFrontConnected(self):
+        """服务器连接"""
+        self.connectionStatus = True
+        self.writeLog(u'L2行情服务器连接成功')
+        self.login()
+
+    #----------------------------------------------------------------------
+    def onFrontDisconnected(self, n):
+        """服务器断开"""
+        self.connectionStatus = False
+        self.loginStatus = False
+        self.writeLog(u'L2行情服务器连接断开')
+
+    #----------------------------------------------------------------------
+    def onHeartBeatWarning(self, n):
+        """心跳报警"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRspError(self, error, n, last):
+        """错误回报"""
+        err = VtErrorData()
+        err.gatewayName = self.gatewayName
+        err.errorID = error['ErrorID']
+        err.errorMsg = error['ErrorMsg'].decode('gbk')
+        self.gateway.onError(err)
+
+    #----------------------------------------------------------------------
+    def onRspUserLogin(self, data, error, n, last):
+        """登陆回报"""
+        if error['ErrorID'] == 0:
+            self.loginStatus = True
+            self.writeLog(u'L2行情服务器登录完成')
+
+            # 逐笔数据为全市场订阅
+            self.subscribeL2OrderAndTrade()
+        else:
+            self.onRspError(error, n, last)
+
+    #----------------------------------------------------------------------
+    def onRspUserLogout(self, data, error, n, last):
+        """登出回报"""
+        if error['ErrorID'] == 0:
+            self.loginStatus = False
+            self.writeLog(u'L2行情服务器登出完成')
+        else:
+            self.onRspError(error, n, last)
+
+    #----------------------------------------------------------------------
+    def onRspSubL2MarketData(self, data, error, n, last):
+        """订阅L2合约回报"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRspUnSubL2MarketData(self, data, error, n, last):
+        """退订L2合约回报"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRspSubL2Index(self, data, error, n, last):
+        """订阅L2指数回报"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRspUnSubL2Index(self, data, error, n, last):
+        """退订L2指数回报"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRtnL2MarketData(self, data):
+        """L2快照行情推送（快照行情由LtsMdApi负责）"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRtnL2Index(self, data):
+        """L2指数行情推送"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRspSubL2OrderAndTrade(self, error, n, last):
+        """订阅L2订单、成交回报"""
+        if error['ErrorID'] == 0:
+            self.writeLog(u'L2逐笔数据订阅成功')
+        else:
+            self.onRspError(error, n, last)
+
+    #----------------------------------------------------------------------
+    def onRspUnSubL2OrderAndTrade(self, error, n, last):
+        """退订L2订单、成交回报"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onNtfCheckOrderList(self, instrumentID, functionID):
+        """通知清理SSE买卖一队列中数量为0的报单"""
+        pass
+
+    #----------------------------------------------------------------------
+    def onRtnL2Order(self, data):
+        """L2逐笔委托推送"""
+        order = VtL2OrderData()
+        order.gatewayName = self.gatewayName
+
+        order.symbol = data['InstrumentID']
+        order.exchange = exchangeMapReverse.get(data['ExchangeID'], EXCHANGE_UNKNOWN)
+        order.vtSymbol = self.getVtSymbol(order.symbol, order.exchange)
+
+        order.groupID = data['OrderGroupID']
+        order.orderIndex = data['OrderIndex']
+        order.orderKind = data['OrderKind']
+        order.price = data['Price']
+        order.volume = data['Volume']
+        order.orderTime = data['OrderTime']
+
+        if data['FunctionCode'] == FUNCTIONCODE_BUY:
+            order.direction = DIRECTION_LONG
+        else:
+            order.direction = DIRECTION_SHORT
+
+        self.gateway.onL2Order(order)
+
+    #----------------------------------------------------------------------
+    def onRtnL2Trade(self, data):
+        """L2逐笔成交推送"""
+        trade = VtL2TradeData()
+        trade.gatewayName = self.gatewayName
+
+        trade.symbol = data['InstrumentID']
+        trade.exchange = exchangeMapReverse.get(data['ExchangeID'], EXCHANGE_UNKNOWN)
+        trade.vtSymbol = self.getVtSymbol(trade.symbol, trade.exchange)
+
+        trade.groupID = data['TradeGroupID']
+        trade.tradeIndex = data['TradeIndex']
+        trade.buyIndex = data['BuyIndex']
+        trade.sellIndex = data['SellIndex']
+        trade.cancelled = (data['FunctionCode'] == FUNCTIONCODE_CANCEL)
+        trade.price = data['Price']
+        trade.volume = data['Volume']
+        trade.tradeTime = data['TradeTime']
+
+        self.gateway.onL2Trade(trade)
+
+    #----------------------------------------------------------------------
+    def getVtSymbol(self, symbol, exchange):
+        """获取vtSymbol"""
+        key = (symbol, exchange)
+        vtSymbol = self.vtSymbolDict.get(key, None)
+        if not vtSymbol:
+            vtSymbol = '.'.join([symbol, exchange])
+            self.vtSymbolDict[key] = vtSymbol
+        return vtSymbol
+
+    #----------------------------------------------------------------------
+    def connect(self, userID, password, brokerID, address):
+        """初始化连接"""
+        self.userID = userID
+        self.password = password
+        self.brokerID = brokerID
+        self.address = address
+
+        if not self.connectionStatus:
+            path = os.getcwd() + '/temp/' + self.gatewayName + 'L2/'
+            if not os.path.exists(path):
+                os.makedirs(path)
+            self.createFtdcL2MDUserApi(path)
+
+            self.registerFront(self.address)
+            self.init()
+        else:
+            if not self.loginStatus:
+                self.login()
+
+    #----------------------------------------------------------------------
+    def login(self):
+        """登录"""
+        if self.userID and self.password and self.brokerID:
+            req = {}
+            req['UserID'] = self.userID
+            req['Password'] = self.password
+            req['BrokerID'] = self.brokerID
+            req['DataLevel'] = '0'          # 全量行情
+            self.reqID += 1
+            self.reqUserLogin(req, self.reqID)
+
+    #----------------------------------------------------------------------
+    def close(self):
+        """关闭"""
+        self.exit()
+
+    #----------------------------------------------------------------------
+    def writeLog(self, content):
+        """发出日志"""
+        log = VtLogData()
+        log.gatewayName = self.gatewayName
+        log.logContent = content
+        self.gateway.onLog(log)
@@ -18,6 +18,7 @@ from threading import Thread
 
 import vnokcoin
 from vtGateway import *
+from vtOrderBook import VtOrderBook
 
 # 价格类型映射
 priceTypeMap = {}
@@ -245,6 +246,7 @@ class Api(vnokcoin.OkCoinApi):
 
         self.cbDict = {}
         self.tickDict = {}
+        self.bookDict = {}              # 订单簿字典，key为symbol，value为VtOrderBook对象
         self.orderDict = {}
         
         self.localNo = 0                # 本地委托号
@@ -427,18 +429,16 @@ class Api(vnokcoin.OkCoinApi):
             return
         rawData = data['data']
         
-        tick.bidPrice1, tick.bidVolume1 = rawData['bids'][0]
-        tick.bidPrice2, tick.bidVolume2 = rawData['bids'][1]
-        tick.bidPrice3, tick.bidVolume3 = rawData['bids'][2]
-        tick.bidPrice4, tick.bidVolume4 = rawData['bids'][3]
-        tick.bidPrice5, tick.bidVolume5 = rawData['bids'][4]
+        if symbol not in self.bookDict:
+            self.bookDict[symbol] = VtOrderBook()
+        book = self.bookDict[symbol]
         
-        tick.askPrice1, tick.askVolume1 = rawData['asks'][-1]
-        tick.askPrice2, tick.askVolume2 = rawData['asks'][-2]
-        tick.askPrice3, tick.askVolume3 = rawData['asks'][-3]
-        tick.askPrice4, tick.askVolume4 = rawData['asks'][-4]
-        tick.askPrice5, tick.askVolume5 = rawData['asks'][-5]     
+        # 深度推送为全量快照，只有前5档发生变化时才推送新的tick
+        book.setSnapshot(rawData['bids'], rawData['asks'])
+        if not book.checkTopChanged():
+            return
         
+        book.fillTick(tick)
         tick.date, tick.time = generateDateTime(rawData['timestamp'])
         
         newtick = copy(tick)
@@ -130,4 +130,6 @@ DATABASE_CONNECTING_COMPLETED = u'MongoDB连接成功'
 DATABASE_CONNECTING_FAILED = u'MongoDB连接失败'
 DATA_INSERT_FAILED = u'数据插入失败，MongoDB没有连接'
 DATA_QUERY_FAILED = u'数据查询失败，MongoDB没有连接'
+DATA_BULK_INSERT_ERROR = u'批量插入{collection}部分失败，失败数量：{count}'
 DATA_UPDATE_FAILED = u'数据更新失败，MongoDB没有连接'
+DATA_BULK_UPDATE_ERROR = u'批量更新{collection}部分失败，失败数量：{count}'
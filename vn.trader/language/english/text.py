@@ -130,4 +130,6 @@ DATABASE_CONNECTING_COMPLETED = u'MongoDB is connected.'
 DATABASE_CONNECTING_FAILED = u'Failed to connect to MongoDB.'
 DATA_INSERT_FAILED = u'Data insert failed，please connect MongoDB first.'
 DATA_QUERY_FAILED = u'Data query failed, please connect MongoDB first.'
-DATA_UPDATE_FAILED = u'Data update failed, please connect MongoDB first.'
\ No newline at end of file
+DATA_BULK_INSERT_ERROR = u'Bulk insert into {collection} partially failed, failed count: {count}'
+DATA_UPDATE_FAILED = u'Data update failed, please connect MongoDB first.'
+DATA_BULK_UPDATE_ERROR = u'Bulk update of {collection} partially failed, failed count: {count}'
\ No newline at end of file
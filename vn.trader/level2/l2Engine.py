@@ -0,0 +1,393 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了Level2逐笔数据的订单簿重建引擎：
+1. 基于L2逐笔委托和逐笔成交（深交所的撤单也通过成交推送）实时重建每个证券的完整订单簿
+2. 价格档位使用VtOrderBook的有序数组保存，存活委托使用可复用槽位的紧凑数组保存
+3. 每个证券检查委托序号和成交序号，丢弃重复或乱序的数据；深交所同一频道的委托
+   和成交共用序号，因此额外按频道检查序号是否连续，发现缺口时记录日志
+4. 盘口前depth档变化时推送EVENT_L2_DEPTH事件，被关注委托的排队位置变化时推送
+   EVENT_L2_QUEUE事件，为了支持全市场订阅，两者都只推送后接vtSymbol的特定事件
+'''
+
+import json
+import os
+from array import array
+from datetime import datetime
+
+from eventEngine import *
+from vtConstant import *
+from vtGateway import VtTickData, VtLogData
+from vtOrderBook import VtOrderBook
+
+
+# 报单类型：本方最优（委托价格为0，按委托时本方最优价计算）
+ORDERKIND_BESTOWN = 'U'
+
+# 委托方向在数组中的保存方式
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+
+########################################################################
+class L2QueueData(object):
+    """L2委托排队位置数据"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.vtSymbol = EMPTY_STRING
+        self.orderIndex = EMPTY_INT         # 委托序号
+        self.direction = EMPTY_UNICODE      # 委托方向
+        self.price = EMPTY_FLOAT            # 委托价格
+        self.volume = EMPTY_INT             # 剩余数量
+        self.volumeAhead = EMPTY_INT        # 排在前面的委托数量
+
+
+########################################################################
+class L2SecurityBook(object):
+    """单个证券的逐笔订单簿"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, vtSymbol, depth):
+        """Constructor"""
+        self.vtSymbol = vtSymbol
+        self.book = VtOrderBook(depth)      # 按价格汇总的档位
+
+        # 存活委托保存在槽位数组中，委托结束后槽位回收再利用
+        self.slotDict = {}                  # key为orderIndex，value为槽位
+        self.freeSlots = []                 # 可复用的槽位
+        self.slotPrice = array('d')         # 委托价格（为0代表不在档位中的市价委托）
+        self.slotVolume = array('l')        # 剩余数量
+        self.slotSide = array('b')          # 委托方向
+
+        # 序号检查
+        self.lastOrderIndex = 0
+        self.lastTradeIndex = 0
+
+        # 最新数据
+        self.lastPrice = EMPTY_FLOAT
+        self.volume = EMPTY_INT             # 累计成交量
+        self.time = EMPTY_STRING
+
+        # 被关注的委托，key为orderIndex，value为排在前面的数量
+        self.watchDict = {}
+        self.watchChanged = False           # 被关注委托的排队位置是否变化
+
+    #----------------------------------------------------------------------
+    def addOrder(self, orderIndex, side, price, volume):
+        """新增委托"""
+        if self.freeSlots:
+            slot = self.freeSlots.pop()
+            self.slotPrice[slot] = price
+            self.slotVolume[slot] = volume
+            self.slotSide[slot] = side
+        else:
+            slot = len(self.slotPrice)
+            self.slotPrice.append(price)
+            self.slotVolume.append(volume)
+            self.slotSide.append(side)
+        self.slotDict[orderIndex] = slot
+
+        if price > 0:
+            if side == SIDE_BUY:
+                self.book.addBid(price, volume)
+            else:
+                self.book.addAsk(price, volume)
+
+    #----------------------------------------------------------------------
+    def reduceOrder(self, orderIndex, volume):
+        """减少委托的剩余数量（成交或撤单），返回实际减少的数量"""
+        slot = self.slotDict.get(orderIndex, None)
+        if slot is None:
+            return 0
+
+        remaining = self.slotVolume[slot]
+        volume = min(volume, remaining)
+        remaining -= volume
+        price = self.slotPrice[slot]
+        side = self.slotSide[slot]
+
+        if price > 0:
+            if side == SIDE_BUY:
+                self.book.addBid(price, -volume)
+            else:
+                self.book.addAsk(price, -volume)
+
+        # 更新被关注委托的排队位置
+        if self.watchDict:
+            if orderIndex in self.watchDict:
+                self.watchChanged = True
+            self.updateWatch(orderIndex, side, price, volume)
+
+        if remaining > 0:
+            self.slotVolume[slot] = remaining
+        else:
+            del self.slotDict[orderIndex]
+            self.freeSlots.append(slot)
+
+        return volume
+
+    #----------------------------------------------------------------------
+    def updateWatch(self, orderIndex, side, price, volume):
+        """同价同向且排在前面的委托减少时，更新被关注委托的排队位置"""
+        for watchIndex in self.watchDict.keys():
+            slot = self.slotDict.get(watchIndex, None)
+            if slot is None or watchIndex == orderIndex:
+                continue
+            if orderIndex < watchIndex and self.slotSide[slot] == side and self.slotPrice[slot] == price:
+                self.watchDict[watchIndex] -= volume
+                self.watchChanged = True
+
+    #----------------------------------------------------------------------
+    def watchOrder(self, orderIndex):
+        """关注某个委托的排队位置，返回当前排在前面的数量"""
+        slot = self.slotDict.get(orderIndex, None)
+        if slot is None:
+            return None
+
+        price = self.slotPrice[slot]
+        side = self.slotSide[slot]
+
+        # 同价同向、序号更小的存活委托都排在前面
+        volumeAhead = 0
+        for index, s in self.slotDict.items():
+            if index < orderIndex and self.slotSide[s] == side and self.slotPrice[s] == price:
+                volumeAhead += self.slotVolume[s]
+
+        self.watchDict[orderIndex] = volumeAhead
+        return volumeAhead
+
+    #----------------------------------------------------------------------
+    def getOrderVolume(self, orderIndex):
+        """查询委托剩余数量"""
+        slot = self.slotDict.get(orderIndex, None)
+        if slot is None:
+            return 0
+        return self.slotVolume[slot]
+
+    #----------------------------------------------------------------------
+    def getOrderCount(self):
+        """查询存活委托数量"""
+        return len(self.slotDict)
+
+
+########################################################################
+class L2Engine(object):
+    """L2订单簿重建引擎"""
+    settingFileName = 'L2_setting.json'
+    path = os.path.abspath(os.path.dirname(__file__))
+    settingFileName = os.path.join(path, settingFileName)
+
+    name = u'L2引擎'
+
+    #----------------------------------------------------------------------
+    def __init__(self, mainEngine, eventEngine):
+        """Constructor"""
+        self.mainEngine = mainEngine
+        self.eventEngine = eventEngine
+
+        self.active = False             # 是否启动
+        self.depth = 5                  # 盘口档位数量
+
+        # 证券订单簿字典，key为vtSymbol，value为L2SecurityBook对象
+        self.bookDict = {}
+
+        # 频道序号检查（深交所），key为(exchange, groupID)，value为最新序号
+        self.groupSeqDict = {}
+        self.gapCount = 0               # 发现的序号缺口数量
+        self.dropCount = 0              # 丢弃的重复或乱序数据数量
+
+        # 深交所委托和成交在同一频道内共用序号
+        self.groupSeqExchanges = set([EXCHANGE_SZSE])
+
+        self.loadSetting()
+        self.registerEvent()
+
+    #----------------------------------------------------------------------
+    def loadSetting(self):
+        """读取配置"""
+        try:
+            with open(self.settingFileName) as f:
+                d = json.load(f)
+                self.active = d['active']
+                self.depth = d['depth']
+        except (IOError, KeyError, ValueError):
+            pass
+
+    #----------------------------------------------------------------------
+    def registerEvent(self):
+        """注册事件监听"""
+        self.eventEngine.register(EVENT_L2_ORDER, self.processOrderEvent)
+        self.eventEngine.register(EVENT_L2_TRADE, self.processTradeEvent)
+
+    #----------------------------------------------------------------------
+    def getBook(self, vtSymbol):
+        """获取证券订单簿，不存在则创建"""
+        book = self.bookDict.get(vtSymbol, None)
+        if not book:
+            book = L2SecurityBook(vtSymbol, self.depth)
+            self.bookDict[vtSymbol] = book
+        return book
+
+    #----------------------------------------------------------------------
+    def checkGroupSeq(self, exchange, groupID, seq):
+        """检查频道序号是否连续"""
+        if exchange not in self.groupSeqExchanges:
+            return
+
+        key = (exchange, groupID)
+        lastSeq = self.groupSeqDict.get(key, 0)
+        if seq > lastSeq:
+            if lastSeq and seq != lastSeq + 1:
+                self.gapCount += 1
+                self.writeL2Log(u'%s频道%s序号缺口：%s到%s' %(exchange, groupID, lastSeq, seq))
+            self.groupSeqDict[key] = seq
+
+    #----------------------------------------------------------------------
+    def processOrderEvent(self, event):
+        """处理逐笔委托"""
+        if not self.active:
+            return
+
+        order = event.dict_['data']
+        book = self.getBook(order.vtSymbol)
+
+        # 丢弃重复或乱序的委托
+        if order.orderIndex <= book.lastOrderIndex:
+            self.dropCount += 1
+            return
+        book.lastOrderIndex = order.orderIndex
+        self.checkGroupSeq(order.exchange, order.groupID, order.orderIndex)
+
+        if order.direction == DIRECTION_LONG:
+            side = SIDE_BUY
+        else:
+            side = SIDE_SELL
+
+        # 本方最优委托以当前本方最优价进入队列
+        price = order.price
+        if price <= 0 and order.orderKind == ORDERKIND_BESTOWN:
+            if side == SIDE_BUY and book.book.getBidCount():
+                price = book.book.getBid(0)[0]
+            elif side == SIDE_SELL and book.book.getAskCount():
+                price = book.book.getAsk(0)[0]
+
+        book.addOrder(order.orderIndex, side, price, order.volume)
+        book.time = order.orderTime
+
+        self.publishBook(book)
+
+    #----------------------------------------------------------------------
+    def processTradeEvent(self, event):
+        """处理逐笔成交（包括深交所的撤单）"""
+        if not self.active:
+            return
+
+        trade = event.dict_['data']
+        book = self.getBook(trade.vtSymbol)
+
+        if trade.tradeIndex <= book.lastTradeIndex:
+            self.dropCount += 1
+            return
+        book.lastTradeIndex = trade.tradeIndex
+        self.checkGroupSeq(trade.exchange, trade.groupID, trade.tradeIndex)
+
+        if trade.cancelled:
+            # 撤单时买方或卖方委托序号中只有一个非0
+            book.reduceOrder(trade.buyIndex or trade.sellIndex, trade.volume)
+        else:
+            book.reduceOrder(trade.buyIndex, trade.volume)
+            book.reduceOrder(trade.sellIndex, trade.volume)
+            book.lastPrice = trade.price
+            book.volume += trade.volume
+
+        book.time = trade.tradeTime
+
+        self.publishBook(book)
+
+    #----------------------------------------------------------------------
+    def publishBook(self, book):
+        """推送盘口和排队位置的变化"""
+        if book.book.checkTopChanged():
+            tick = VtTickData()
+            tick.vtSymbol = book.vtSymbol
+            tick.symbol, _, tick.exchange = book.vtSymbol.partition('.')
+            tick.lastPrice = book.lastPrice
+            tick.volume = book.volume
+            tick.time = book.time
+            tick.date = datetime.now().strftime('%Y%m%d')
+            book.book.fillTick(tick)
+
+            event = Event(type_=EVENT_L2_DEPTH+book.vtSymbol)
+            event.dict_['data'] = tick
+            self.eventEngine.put(event)
+
+        if book.watchChanged:
+            book.watchChanged = False
+            
+            for orderIndex, volumeAhead in book.watchDict.items():
+                slot = book.slotDict.get(orderIndex, None)
+
+                queue = L2QueueData()
+                queue.vtSymbol = book.vtSymbol
+                queue.orderIndex = orderIndex
+                queue.volumeAhead = max(volumeAhead, 0)
+                if slot is not None:
+                    queue.price = book.slotPrice[slot]
+                    queue.volume = book.slotVolume[slot]
+                    if book.slotSide[slot] == SIDE_BUY:
+                        queue.direction = DIRECTION_LONG
+                    else:
+                        queue.direction = DIRECTION_SHORT
+                # 委托已经结束，不再关注
+                else:
+                    del book.watchDict[orderIndex]
+
+                event = Event(type_=EVENT_L2_QUEUE+book.vtSymbol)
+                event.dict_['data'] = queue
+                self.eventEngine.put(event)
+
+    #----------------------------------------------------------------------
+    def watchOrder(self, vtSymbol, orderIndex):
+        """关注某个L2委托的排队位置，返回当前排在前面的数量"""
+        book = self.bookDict.get(vtSymbol, None)
+        if not book:
+            return None
+        return book.watchOrder(orderIndex)
+
+    #----------------------------------------------------------------------
+    def unwatchOrder(self, vtSymbol, orderIndex):
+        """取消关注"""
+        book = self.bookDict.get(vtSymbol, None)
+        if book and orderIndex in book.watchDict:
+            del book.watchDict[orderIndex]
+
+    #----------------------------------------------------------------------
+    def getDepth(self, vtSymbol, n=None):
+        """查询重建后的盘口，返回(买盘列表, 卖盘列表)"""
+        book = self.bookDict.get(vtSymbol, None)
+        if not book:
+            return [], []
+        return book.book.getTopBids(n), book.book.getTopAsks(n)
+
+    #----------------------------------------------------------------------
+    def getQueueVolume(self, vtSymbol, direction, price):
+        """查询某个价格上的排队数量，即此刻以该价格新挂委托时排在前面的数量"""
+        book = self.bookDict.get(vtSymbol, None)
+        if not book:
+            return 0
+        if direction == DIRECTION_LONG:
+            return book.book.getBidVolume(price)
+        else:
+            return book.book.getAskVolume(price)
+
+    #----------------------------------------------------------------------
+    def writeL2Log(self, content):
+        """快速发出日志事件"""
+        log = VtLogData()
+        log.logContent = content
+        log.gatewayName = self.name
+        event = Event(type_=EVENT_LOG)
+        event.dict_['data'] = log
+        self.eventEngine.put(event)
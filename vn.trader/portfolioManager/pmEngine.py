@@ -0,0 +1,439 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了组合盈亏引擎，在每个tick上对持仓进行盯市，不再依赖接口的定时持仓、资金查询：
+1. 按接口、按CTA策略、按账户三个维度统计组合的平仓盈亏和持仓盈亏
+2. 持仓以（净持仓，持仓成本）保存，成交和持仓回报只更新对应的持仓，
+   tick到来时只处理该合约的持仓，组合盈亏按价格变化量增量累加
+3. 每日结算时间用numpy对全部持仓重新计算一遍，消除增量累加产生的误差
+4. 组合盈亏按固定间隔推送，只推送发生了变化的组合
+'''
+
+import json
+import os
+from copy import copy
+from datetime import datetime
+
+from eventEngine import *
+from vtConstant import *
+from vtGateway import VtLogData
+
+
+# 组合维度
+DIMENSION_GATEWAY = u'接口'
+DIMENSION_STRATEGY = u'策略'
+DIMENSION_ACCOUNT = u'账户'
+
+
+########################################################################
+class PmPortfolioData(object):
+    """组合盈亏数据"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.name = EMPTY_UNICODE           # 组合名称，如接口名、策略名、账户代码
+        self.dimension = EMPTY_UNICODE      # 组合维度
+
+        self.closeProfit = EMPTY_FLOAT      # 平仓盈亏
+        self.positionProfit = EMPTY_FLOAT   # 持仓盈亏
+        self.totalProfit = EMPTY_FLOAT      # 总盈亏
+
+        self.positionCount = EMPTY_INT      # 持仓合约数量
+        self.updateTime = EMPTY_STRING      # 更新时间
+
+
+########################################################################
+class PmPosition(object):
+    """组合中单个合约的持仓"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, portfolio, vtSymbol, size):
+        """Constructor"""
+        self.portfolio = portfolio          # 所属组合
+        self.vtSymbol = vtSymbol
+        self.size = size                    # 合约大小
+
+        self.pos = EMPTY_INT                # 净持仓，多正空负
+        self.cost = EMPTY_FLOAT             # 持仓成本，即每笔持仓的数量（带方向）乘以价格之和
+        self.lastPrice = EMPTY_FLOAT        # 最新价，为0时说明还没有收到行情
+        self.positionProfit = EMPTY_FLOAT   # 持仓盈亏
+
+        self.snapshotDict = {}              # 持仓回报快照，key为方向，value为(数量, 均价)
+
+    #----------------------------------------------------------------------
+    def calculateProfit(self):
+        """重新计算持仓盈亏，返回相对之前的变化量"""
+        if self.lastPrice:
+            profit = (self.lastPrice * self.pos - self.cost) * self.size
+        else:
+            profit = EMPTY_FLOAT
+
+        delta = profit - self.positionProfit
+        self.positionProfit = profit
+        return delta
+
+
+########################################################################
+class PmPortfolio(object):
+    """组合"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, name, dimension):
+        """Constructor"""
+        self.name = name
+        self.dimension = dimension
+
+        self.positionDict = {}              # key为vtSymbol，value为PmPosition对象
+
+        self.closeProfit = EMPTY_FLOAT
+        self.positionProfit = EMPTY_FLOAT
+
+        self.changed = False                # 自上次推送以来是否发生了变化
+
+    #----------------------------------------------------------------------
+    def toData(self):
+        """生成组合盈亏数据"""
+        data = PmPortfolioData()
+        data.name = self.name
+        data.dimension = self.dimension
+        data.closeProfit = self.closeProfit
+        data.positionProfit = self.positionProfit
+        data.totalProfit = self.closeProfit + self.positionProfit
+        data.positionCount = len([p for p in self.positionDict.values() if p.pos])
+        data.updateTime = datetime.now().strftime('%H:%M:%S')
+        return data
+
+
+########################################################################
+class PmEngine(object):
+    """组合盈亏引擎"""
+    settingFileName = 'PM_setting.json'
+    path = os.path.abspath(os.path.dirname(__file__))
+    settingFileName = os.path.join(path, settingFileName)
+
+    name = u'组合盈亏'
+
+    #----------------------------------------------------------------------
+    def __init__(self, mainEngine, eventEngine):
+        """Constructor"""
+        self.mainEngine = mainEngine
+        self.eventEngine = eventEngine
+
+        self.active = False                 # 是否启动
+        self.publishInterval = 1            # 推送间隔（秒）
+        self.publishTimer = EMPTY_INT       # 推送计时
+        self.settleTime = '15:30:00'        # 每日结算重算时间
+        self.settleDate = EMPTY_STRING      # 最近一次结算的日期
+
+        # 组合字典，key为(维度, 名称)，value为PmPortfolio对象
+        self.portfolioDict = {}
+
+        # 合约持仓索引，key为vtSymbol，value为所有组合中该合约的PmPosition列表
+        self.symbolPositionDict = {}
+
+        # 合约大小缓存，key为vtSymbol
+        self.sizeDict = {}
+
+        # 接口和账户的映射，key为gatewayName，value为vtAccountID
+        self.gatewayAccountDict = {}
+
+        # 已处理过的成交编号，用于过滤接口重连后重复推送的成交
+        self.tradeSet = set()
+
+        self.loadSetting()
+        self.registerEvent()
+
+    #----------------------------------------------------------------------
+    def loadSetting(self):
+        """读取配置"""
+        try:
+            with open(self.settingFileName) as f:
+                d = json.load(f)
+                self.active = d['active']
+                self.publishInterval = d['publishInterval']
+                self.settleTime = str(d['settleTime'])
+        except (IOError, KeyError, ValueError):
+            pass
+
+    #----------------------------------------------------------------------
+    def registerEvent(self):
+        """注册事件监听"""
+        self.eventEngine.register(EVENT_TICK, self.processTickEvent)
+        self.eventEngine.register(EVENT_TRADE, self.processTradeEvent)
+        self.eventEngine.register(EVENT_POSITION, self.processPositionEvent)
+        self.eventEngine.register(EVENT_ACCOUNT, self.processAccountEvent)
+        self.eventEngine.register(EVENT_TIMER, self.processTimerEvent)
+
+    #----------------------------------------------------------------------
+    def getSize(self, vtSymbol):
+        """获取合约大小，查询不到合约时返回1且不缓存"""
+        size = self.sizeDict.get(vtSymbol, None)
+        if size is None:
+            contract = self.mainEngine.getContract(vtSymbol)
+            if contract and contract.size:
+                size = contract.size
+                self.sizeDict[vtSymbol] = size
+            else:
+                size = 1
+        return size
+
+    #----------------------------------------------------------------------
+    def getPortfolio(self, dimension, name):
+        """获取组合，不存在则创建"""
+        key = (dimension, name)
+        portfolio = self.portfolioDict.get(key, None)
+        if not portfolio:
+            portfolio = PmPortfolio(name, dimension)
+            self.portfolioDict[key] = portfolio
+        return portfolio
+
+    #----------------------------------------------------------------------
+    def getPosition(self, portfolio, vtSymbol):
+        """获取组合中某个合约的持仓，不存在则创建并加入合约索引"""
+        position = portfolio.positionDict.get(vtSymbol, None)
+        if not position:
+            position = PmPosition(portfolio, vtSymbol, self.getSize(vtSymbol))
+            portfolio.positionDict[vtSymbol] = position
+
+            # 同一合约在其他组合中已经有行情，直接沿用最新价
+            l = self.symbolPositionDict.setdefault(vtSymbol, [])
+            if l:
+                position.lastPrice = l[0].lastPrice
+            l.append(position)
+        return position
+
+    #----------------------------------------------------------------------
+    def getGatewayPortfolios(self, gatewayName):
+        """获取接口对应的组合列表（接口组合和账户组合）"""
+        l = [self.getPortfolio(DIMENSION_GATEWAY, gatewayName)]
+
+        accountID = self.gatewayAccountDict.get(gatewayName, None)
+        if accountID:
+            l.append(self.getPortfolio(DIMENSION_ACCOUNT, accountID))
+        return l
+
+    #----------------------------------------------------------------------
+    def processTickEvent(self, event):
+        """行情推送，按价格变化量增量更新持仓盈亏"""
+        if not self.active:
+            return
+
+        tick = event.dict_['data']
+        l = self.symbolPositionDict.get(tick.vtSymbol, None)
+        if not l or not tick.lastPrice:
+            return
+
+        price = tick.lastPrice
+        for position in l:
+            if position.lastPrice == price:
+                continue
+
+            if position.lastPrice and position.pos:
+                delta = (price - position.lastPrice) * position.pos * position.size
+                position.positionProfit += delta
+                position.lastPrice = price
+            else:
+                position.lastPrice = price
+                delta = position.calculateProfit()
+
+            if delta:
+                portfolio = position.portfolio
+                portfolio.positionProfit += delta
+                portfolio.changed = True
+
+    #----------------------------------------------------------------------
+    def processTradeEvent(self, event):
+        """成交推送"""
+        if not self.active:
+            return
+
+        trade = event.dict_['data']
+        if trade.vtTradeID in self.tradeSet:
+            return
+        self.tradeSet.add(trade.vtTradeID)
+
+        if trade.direction == DIRECTION_LONG:
+            volume = trade.volume
+        else:
+            volume = -trade.volume
+
+        portfolioList = self.getGatewayPortfolios(trade.gatewayName)
+
+        # 通过CTA引擎的委托映射找到所属策略
+        strategy = self.mainEngine.ctaEngine.orderStrategyDict.get(trade.vtOrderID, None)
+        if strategy:
+            portfolioList.append(self.getPortfolio(DIMENSION_STRATEGY, strategy.name))
+
+        for portfolio in portfolioList:
+            position = self.getPosition(portfolio, trade.vtSymbol)
+            self.updatePositionTrade(position, volume, trade.price)
+
+    #----------------------------------------------------------------------
+    def updatePositionTrade(self, position, volume, price):
+        """用成交更新持仓，平仓部分按持仓均价计算平仓盈亏"""
+        portfolio = position.portfolio
+        pos = position.pos
+
+        # 开仓（或原本无持仓）
+        if not pos or (pos > 0) == (volume > 0):
+            position.cost += volume * price
+        else:
+            closeVolume = min(abs(volume), abs(pos))
+            if pos < 0:
+                closeVolume = -closeVolume
+
+            avgPrice = position.cost / pos
+            portfolio.closeProfit += (price - avgPrice) * closeVolume * position.size
+            position.cost -= avgPrice * closeVolume
+
+            # 反手部分按成交价建立新的成本
+            openVolume = volume + closeVolume
+            if openVolume:
+                position.cost = openVolume * price
+
+        position.pos += volume
+        if not position.pos:
+            position.cost = EMPTY_FLOAT
+
+        if not position.lastPrice:
+            position.lastPrice = price
+        portfolio.positionProfit += position.calculateProfit()
+        portfolio.changed = True
+
+    #----------------------------------------------------------------------
+    def processPositionEvent(self, event):
+        """持仓推送，用接口的持仓快照校正接口和账户组合中的持仓，
+        快照中的price为每单位的持仓均价（不含合约乘数），和成交价格一致"""
+        if not self.active:
+            return
+
+        data = event.dict_['data']
+
+        for portfolio in self.getGatewayPortfolios(data.gatewayName):
+            position = self.getPosition(portfolio, data.vtSymbol)
+
+            snapshot = (data.position, data.price)
+            if position.snapshotDict.get(data.direction, None) == snapshot:
+                continue
+            position.snapshotDict[data.direction] = snapshot
+
+            pos = EMPTY_INT
+            cost = EMPTY_FLOAT
+            for direction, (volume, price) in position.snapshotDict.items():
+                if direction == DIRECTION_SHORT:
+                    volume = -volume
+                pos += volume
+                cost += volume * price
+
+            position.pos = pos
+            position.cost = cost
+            portfolio.positionProfit += position.calculateProfit()
+            portfolio.changed = True
+
+    #----------------------------------------------------------------------
+    def processAccountEvent(self, event):
+        """账户推送，记录接口对应的账户"""
+        account = event.dict_['data']
+        if account.gatewayName not in self.gatewayAccountDict:
+            self.gatewayAccountDict[account.gatewayName] = account.vtAccountID
+
+            # 将接口组合已有的持仓复制到账户组合中
+            gatewayPortfolio = self.getPortfolio(DIMENSION_GATEWAY, account.gatewayName)
+            accountPortfolio = self.getPortfolio(DIMENSION_ACCOUNT, account.vtAccountID)
+            accountPortfolio.closeProfit += gatewayPortfolio.closeProfit
+
+            for vtSymbol, gatewayPosition in gatewayPortfolio.positionDict.items():
+                position = self.getPosition(accountPortfolio, vtSymbol)
+                position.pos += gatewayPosition.pos
+                position.cost += gatewayPosition.cost
+                position.snapshotDict.update(gatewayPosition.snapshotDict)
+                accountPortfolio.positionProfit += position.calculateProfit()
+
+            accountPortfolio.changed = True
+
+    #----------------------------------------------------------------------
+    def processTimerEvent(self, event):
+        """定时推送组合盈亏，并在结算时间执行全量重算"""
+        if not self.active:
+            return
+
+        now = datetime.now()
+        if now.strftime('%H:%M:%S') >= self.settleTime:
+            today = now.strftime('%Y%m%d')
+            if self.settleDate != today:
+                self.settleDate = today
+                self.settle()
+
+        self.publishTimer += 1
+        if self.publishTimer >= self.publishInterval:
+            self.publishTimer = 0
+            self.publish()
+
+    #----------------------------------------------------------------------
+    def publish(self):
+        """推送发生了变化的组合"""
+        for portfolio in self.portfolioDict.values():
+            if portfolio.changed:
+                portfolio.changed = False
+
+                event = Event(type_=EVENT_PORTFOLIO)
+                event.dict_['data'] = portfolio.toData()
+                self.eventEngine.put(event)
+
+    #----------------------------------------------------------------------
+    def settle(self):
+        """结算时对所有持仓做一次向量化的全量重算"""
+        import numpy as np
+
+        portfolioList = self.portfolioDict.values()
+        positionList = []
+        indexList = []
+        for i, portfolio in enumerate(portfolioList):
+            for position in portfolio.positionDict.values():
+                positionList.append(position)
+                indexList.append(i)
+
+        if positionList:
+            pos = np.array([p.pos for p in positionList], dtype=float)
+            cost = np.array([p.cost for p in positionList], dtype=float)
+            lastPrice = np.array([p.lastPrice for p in positionList], dtype=float)
+            size = np.array([p.size for p in positionList], dtype=float)
+
+            # 没有行情的持仓盈亏为0
+            profit = np.where(lastPrice > 0, (lastPrice * pos - cost) * size, 0)
+            total = np.bincount(indexList, weights=profit, minlength=len(portfolioList))
+
+            for position, p in zip(positionList, profit):
+                position.positionProfit = float(p)
+        else:
+            total = [0] * len(portfolioList)
+
+        for portfolio, p in zip(portfolioList, total):
+            portfolio.positionProfit = float(p)
+            portfolio.changed = True
+
+        self.writePmLog(u'组合盈亏结算重算完成，持仓数量：%s' %len(positionList))
+
+    #----------------------------------------------------------------------
+    def getPortfolioData(self, dimension, name):
+        """查询某个组合的盈亏数据"""
+        portfolio = self.portfolioDict.get((dimension, name), None)
+        if portfolio:
+            return portfolio.toData()
+        return None
+
+    #----------------------------------------------------------------------
+    def getAllPortfolioData(self):
+        """查询所有组合的盈亏数据"""
+        return [portfolio.toData() for portfolio in self.portfolioDict.values()]
+
+    #----------------------------------------------------------------------
+    def writePmLog(self, content):
+        """快速发出日志事件"""
+        log = VtLogData()
+        log.logContent = content
+        log.gatewayName = self.name
+        event = Event(type_=EVENT_LOG)
+        event.dict_['data'] = log
+        self.eventEngine.put(event)
@@ -0,0 +1,177 @@
+# encoding: UTF-8
+
+'''
+组合盈亏引擎的测试，在vn.trader/portfolioManager目录下运行：
+python testPmEngine.py
+'''
+
+import os
+import sys
+import unittest
+
+# vn.trader目录需要在portfolioManager目录之前，避免同名的language包冲突
+path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, path)
+sys.path.insert(1, os.path.join(path, 'gateway', 'ctpGateway'))
+
+from eventEngine import Event, EVENT_TICK, EVENT_TRADE, EVENT_POSITION
+from vtConstant import *
+from vtGateway import VtContractData, VtTickData, VtTradeData
+from pmEngine import PmEngine, DIMENSION_GATEWAY
+from ctpGateway import CtpTdApi, defineDict
+
+
+SYMBOL = 'IF1706'
+SIZE = 300
+
+
+########################################################################
+class FakeCtaEngine(object):
+    """测试用的CTA引擎"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.orderStrategyDict = {}
+
+
+########################################################################
+class FakeMainEngine(object):
+    """测试用的主引擎"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.ctaEngine = FakeCtaEngine()
+
+    #----------------------------------------------------------------------
+    def getContract(self, vtSymbol):
+        """查询合约"""
+        contract = VtContractData()
+        contract.vtSymbol = vtSymbol
+        contract.size = SIZE
+        return contract
+
+
+########################################################################
+class FakeEventEngine(object):
+    """测试用的事件引擎"""
+
+    #----------------------------------------------------------------------
+    def register(self, type_, handler):
+        """注册事件处理函数"""
+        pass
+
+    #----------------------------------------------------------------------
+    def put(self, event):
+        """推送事件"""
+        pass
+
+
+########################################################################
+class FakeGateway(object):
+    """测试用的接口，记录推送的持仓"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        self.positionList = []
+
+    #----------------------------------------------------------------------
+    def onPosition(self, position):
+        """持仓推送"""
+        self.positionList.append(position)
+
+
+#----------------------------------------------------------------------
+def makeEvent(type_, data):
+    """生成事件"""
+    event = Event(type_=type_)
+    event.dict_['data'] = data
+    return event
+
+#----------------------------------------------------------------------
+def makeCtpPosition(volume, price, sizeDict):
+    """通过CtpTdApi的持仓查询回报生成持仓数据，PositionCost包含合约乘数"""
+    tdApi = CtpTdApi.__new__(CtpTdApi)
+    tdApi.gatewayName = 'CTP'
+    tdApi.gateway = FakeGateway()
+    tdApi.posDict = {}
+    tdApi.symbolSizeDict = sizeDict
+
+    data = {
+        'InstrumentID': SYMBOL,
+        'PosiDirection': defineDict['THOST_FTDC_PD_Long'],
+        'YdPosition': 0,
+        'TodayPosition': volume,
+        'Position': volume,
+        'PositionProfit': 0,
+        'PositionCost': price * volume * SIZE,
+        'LongFrozen': 0,
+        'ShortFrozen': 0
+    }
+    tdApi.onRspQryInvestorPosition(data, {}, 1, True)
+    return tdApi.gateway.positionList
+
+
+########################################################################
+class PositionCostTest(unittest.TestCase):
+    """持仓成本测试，合约大小为300"""
+
+    #----------------------------------------------------------------------
+    def setUp(self):
+        """创建引擎"""
+        self.engine = PmEngine(FakeMainEngine(), FakeEventEngine())
+        self.engine.active = True
+
+    #----------------------------------------------------------------------
+    def pushTick(self, price):
+        """推送行情"""
+        tick = VtTickData()
+        tick.vtSymbol = SYMBOL
+        tick.lastPrice = price
+        self.engine.processTickEvent(makeEvent(EVENT_TICK, tick))
+
+    #----------------------------------------------------------------------
+    def getProfit(self):
+        """CTP接口组合的持仓盈亏"""
+        return self.engine.getPortfolioData(DIMENSION_GATEWAY, 'CTP').positionProfit
+
+    #----------------------------------------------------------------------
+    def testCtpPositionPrice(self):
+        """CTP持仓回报的均价换算为每单位的价格"""
+        positionList = makeCtpPosition(2, 3500, {SYMBOL: SIZE})
+        self.assertEqual(len(positionList), 1)
+        self.assertAlmostEqual(positionList[0].price, 3500)
+
+        self.engine.processPositionEvent(makeEvent(EVENT_POSITION, positionList[0]))
+        self.pushTick(3510)
+        self.assertAlmostEqual(self.getProfit(), 10 * 2 * SIZE)
+
+    #----------------------------------------------------------------------
+    def testCtpPositionBeforeContract(self):
+        """合约信息尚未收到时不推送持仓"""
+        self.assertEqual(makeCtpPosition(2, 3500, {}), [])
+
+    #----------------------------------------------------------------------
+    def testTradeThenSnapshot(self):
+        """成交建立的成本和持仓快照一致，收到快照后盈亏不变"""
+        trade = VtTradeData()
+        trade.gatewayName = 'CTP'
+        trade.vtSymbol = SYMBOL
+        trade.vtTradeID = 'CTP.1'
+        trade.direction = DIRECTION_LONG
+        trade.price = 3500
+        trade.volume = 2
+        self.engine.processTradeEvent(makeEvent(EVENT_TRADE, trade))
+
+        self.pushTick(3510)
+        self.assertAlmostEqual(self.getProfit(), 10 * 2 * SIZE)
+
+        position = makeCtpPosition(2, 3500, {SYMBOL: SIZE})[0]
+        self.engine.processPositionEvent(makeEvent(EVENT_POSITION, position))
+        self.assertAlmostEqual(self.getProfit(), 10 * 2 * SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@
 
 '''
 本文件中实现了风控引擎，用于提供一系列常用的风控功能：
-1. 委托流控（单位时间内最大允许发出的委托数量）
+1. 委托流控（按接口和按合约的令牌桶限速，超出速率的委托进入排队队列，
+   等待令牌补充后发出，超过最长等待时间或队列已满时才拒绝）
 2. 总成交限制（每日总成交数量限制）
 3. 单笔委托的委托数量控制
 '''
@@ -10,12 +11,63 @@
 import json
 import os
 import platform
+from bisect import insort
+from threading import Thread, RLock
+from time import time, sleep
 
 from eventEngine import *
 from vtConstant import *
 from vtGateway import VtLogData
 
 
+# 排队委托的编号前缀
+QUEUEORDERPREFIX = 'RmQueue.'
+
+
+########################################################################
+class TokenBucket(object):
+    """令牌桶，令牌按时间连续补充，速率和容量由调用方传入以便参数修改后立即生效"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, capacity):
+        """Constructor"""
+        self.tokens = float(capacity)       # 当前令牌数量
+        self.lastTime = time()              # 上次补充时间
+
+    #----------------------------------------------------------------------
+    def refill(self, now, rate, capacity):
+        """补充令牌"""
+        self.tokens = min(capacity, self.tokens + (now - self.lastTime) * rate)
+        self.lastTime = now
+
+    #----------------------------------------------------------------------
+    def fill(self, capacity):
+        """补满令牌"""
+        self.tokens = float(capacity)
+        self.lastTime = time()
+
+
+########################################################################
+class RmQueueOrder(object):
+    """排队中的委托"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, queueID, priority, seq, orderReq, gatewayName, callback):
+        """Constructor"""
+        self.queueID = queueID              # 排队编号
+        self.priority = priority            # 优先级，越小越优先
+        self.seq = seq                      # 进入队列的顺序
+        self.orderReq = orderReq
+        self.gatewayName = gatewayName
+        self.callback = callback            # 发出或拒绝后的回调函数，参数为(queueID, vtOrderID)
+        self.queueTime = time()             # 进入队列的时间
+
+    #----------------------------------------------------------------------
+    def __lt__(self, other):
+        """排序：优先级相同时先进先出"""
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
 ########################################################################
 class RmEngine(object):
     """风控引擎"""
@@ -34,11 +86,27 @@ class RmEngine(object):
         # 是否启动风控
         self.active = False
 
-        # 流控相关
-        self.orderFlowCount = EMPTY_INT     # 单位时间内委托计数
+        # 流控相关（接口令牌桶容量为orderFlowLimit，每orderFlowClear秒补满）
         self.orderFlowLimit = EMPTY_INT     # 委托限制
-        self.orderFlowClear = EMPTY_INT     # 计数清空时间（秒）
-        self.orderFlowTimer = EMPTY_INT     # 计数清空时间计时
+        self.orderFlowClear = EMPTY_INT     # 令牌补满时间（秒）
+        self.symbolFlowLimit = EMPTY_INT    # 单合约委托限制
+        self.symbolFlowClear = EMPTY_INT    # 单合约令牌补满时间（秒）
+        self.gatewayBucketDict = {}         # 接口令牌桶，key为gatewayName
+        self.symbolBucketDict = {}          # 合约令牌桶，key为(gatewayName, symbol)
+
+        # 排队相关
+        self.orderQueueWait = EMPTY_FLOAT   # 委托最长排队时间（秒）
+        self.orderQueueDepth = EMPTY_INT    # 排队队列最大长度
+        self.orderQueue = []                # 按优先级排序的排队委托列表
+        self.gatewayQueueCount = {}         # 每个接口排队中的委托数量
+        self.queueOrderCount = EMPTY_INT    # 排队编号计数
+        self.queueOrderDict = {}            # 排队委托发出后的编号映射，key为queueID，value为vtOrderID
+        self.queueInterval = 0.05           # 队列检查间隔（秒）
+        self.queueEventPending = False      # 是否已有待处理的队列事件
+        self.queueLock = RLock()            # 队列和令牌桶的锁，发单可能来自事件引擎、界面和策略工作线程
+        self.queueThreadActive = True
+        self.queueThread = Thread(target=self.runQueue)
+        self.queueThread.daemon = True
 
         # 单笔委托相关
         self.orderSizeLimit = EMPTY_INT     # 单笔委托最大限制
@@ -56,6 +124,7 @@ class RmEngine(object):
 
         self.loadSetting()
         self.registerEvent()
+        self.queueThread.start()
 
     #----------------------------------------------------------------------
     def loadSetting(self):
@@ -68,6 +137,11 @@ class RmEngine(object):
 
             self.orderFlowLimit = d['orderFlowLimit']
             self.orderFlowClear = d['orderFlowClear']
+            self.symbolFlowLimit = d.get('symbolFlowLimit', self.orderFlowLimit)
+            self.symbolFlowClear = d.get('symbolFlowClear', self.orderFlowClear)
+
+            self.orderQueueWait = d.get('orderQueueWait', 1.0)
+            self.orderQueueDepth = d.get('orderQueueDepth', 50)
 
             self.orderSizeLimit = d['orderSizeLimit']
 
@@ -88,6 +162,11 @@ class RmEngine(object):
 
             d['orderFlowLimit'] = self.orderFlowLimit
             d['orderFlowClear'] = self.orderFlowClear
+            d['symbolFlowLimit'] = self.symbolFlowLimit
+            d['symbolFlowClear'] = self.symbolFlowClear
+
+            d['orderQueueWait'] = self.orderQueueWait
+            d['orderQueueDepth'] = self.orderQueueDepth
 
             d['orderSizeLimit'] = self.orderSizeLimit
 
@@ -105,8 +184,8 @@ class RmEngine(object):
     def registerEvent(self):
         """注册事件监听"""
         self.eventEngine.register(EVENT_TRADE, self.updateTrade)
-        self.eventEngine.register(EVENT_TIMER, self.updateTimer)
         self.eventEngine.register(EVENT_ORDER, self.updateOrder)
+        self.eventEngine.register(EVENT_RM_QUEUE, self.processQueue)
         
     #----------------------------------------------------------------------
     def updateOrder(self, event):
@@ -128,14 +207,172 @@ class RmEngine(object):
         self.tradeCount += trade.volume
 
     #----------------------------------------------------------------------
-    def updateTimer(self, event):
-        """更新定时器"""
-        self.orderFlowTimer += 1
+    def runQueue(self):
+        """队列线程，有排队委托时定期向事件引擎发出队列处理事件"""
+        while self.queueThreadActive:
+            sleep(self.queueInterval)
+            if self.orderQueue and not self.queueEventPending:
+                self.queueEventPending = True
+                self.eventEngine.put(Event(type_=EVENT_RM_QUEUE))
+
+    #----------------------------------------------------------------------
+    def stop(self):
+        """停止"""
+        self.queueThreadActive = False
+
+    #----------------------------------------------------------------------
+    def getBuckets(self, gatewayName, symbol):
+        """获取接口和合约的令牌桶，并补充令牌"""
+        gatewayBucket = self.gatewayBucketDict.get(gatewayName, None)
+        if not gatewayBucket:
+            gatewayBucket = TokenBucket(self.orderFlowLimit)
+            self.gatewayBucketDict[gatewayName] = gatewayBucket
+
+        key = (gatewayName, symbol)
+        symbolBucket = self.symbolBucketDict.get(key, None)
+        if not symbolBucket:
+            symbolBucket = TokenBucket(self.symbolFlowLimit)
+            self.symbolBucketDict[key] = symbolBucket
+
+        now = time()
+        gatewayBucket.refill(now, self.orderFlowLimit / float(self.orderFlowClear or 1), self.orderFlowLimit)
+        symbolBucket.refill(now, self.symbolFlowLimit / float(self.symbolFlowClear or 1), self.symbolFlowLimit)
+
+        return gatewayBucket, symbolBucket
+
+    #----------------------------------------------------------------------
+    def acquireToken(self, gatewayName, symbol):
+        """尝试获取发单令牌"""
+        gatewayBucket, symbolBucket = self.getBuckets(gatewayName, symbol)
+        if gatewayBucket.tokens >= 1 and symbolBucket.tokens >= 1:
+            gatewayBucket.tokens -= 1
+            symbolBucket.tokens -= 1
+            return True
+        return False
 
-        # 如果计时超过了流控清空的时间间隔，则执行清空
-        if self.orderFlowTimer >= self.orderFlowClear:
-            self.orderFlowCount = 0
-            self.orderFlowTimer = 0
+    #----------------------------------------------------------------------
+    def throttleOrder(self, orderReq, gatewayName, callback=None):
+        """流控发单，有令牌时立即发出，否则进入排队队列，返回vtOrderID或排队编号"""
+        return self.throttleOrders([orderReq], gatewayName, callback)[0]
+
+    #----------------------------------------------------------------------
+    def throttleOrders(self, orderReqList, gatewayName, callback=None):
+        """批量流控发单，能立即发出的委托合并成一次批量发单"""
+        gateway = self.mainEngine.gatewayDict[gatewayName]
+
+        # 风控未启动时直接发单
+        if not self.active:
+            return gateway.sendOrders(orderReqList)
+
+        resultList = []
+        sendList = []
+
+        with self.queueLock:
+            for orderReq in orderReqList:
+                # 同一接口已有排队委托时新委托也进入队列，保证优先级顺序
+                if not self.gatewayQueueCount.get(gatewayName, 0) and self.acquireToken(gatewayName, orderReq.symbol):
+                    sendList.append(orderReq)
+                    resultList.append(None)
+                else:
+                    resultList.append(self.queueOrder(orderReq, gatewayName, callback))
+
+        # 发单在锁外执行，避免持有队列锁时调用接口
+        if sendList:
+            vtOrderIDs = iter(gateway.sendOrders(sendList))
+            resultList = [next(vtOrderIDs) if result is None else result for result in resultList]
+
+        return resultList
+
+    #----------------------------------------------------------------------
+    def queueOrder(self, orderReq, gatewayName, callback):
+        """委托进入排队队列，返回排队编号，队列已满时返回空字符串（需持有queueLock）"""
+        if len(self.orderQueue) >= self.orderQueueDepth:
+            self.writeRiskLog(u'委托排队队列已满%s，拒绝%s委托'
+                              %(self.orderQueueDepth, orderReq.symbol))
+            return ''
+
+        self.queueOrderCount += 1
+        queueID = QUEUEORDERPREFIX + str(self.queueOrderCount)
+
+        # 平仓委托优先于开仓委托
+        if orderReq.offset == OFFSET_OPEN:
+            priority = 1
+        else:
+            priority = 0
+
+        qo = RmQueueOrder(queueID, priority, self.queueOrderCount, orderReq, gatewayName, callback)
+        insort(self.orderQueue, qo)
+        self.gatewayQueueCount[gatewayName] = self.gatewayQueueCount.get(gatewayName, 0) + 1
+
+        return queueID
+
+    #----------------------------------------------------------------------
+    def processQueue(self, event):
+        """处理排队委托，按优先级发出获得令牌的委托，拒绝超时的委托"""
+        self.queueEventPending = False
+
+        now = time()
+        remainList = []
+        expireList = []         # 排队超时的委托
+        sendDict = {}           # key为gatewayName，value为可以发出的排队委托列表
+
+        # 在锁内从队列中取出要处理的委托，发单和回调在锁外执行，
+        # 取出的委托在finishQueueOrder之前仍计入gatewayQueueCount，期间的新委托继续排队
+        with self.queueLock:
+            for qo in self.orderQueue:
+                if now - qo.queueTime > self.orderQueueWait:
+                    expireList.append(qo)
+                elif self.acquireToken(qo.gatewayName, qo.orderReq.symbol):
+                    sendDict.setdefault(qo.gatewayName, []).append(qo)
+                else:
+                    remainList.append(qo)
+
+            self.orderQueue = remainList
+
+        for qo in expireList:
+            self.writeRiskLog(u'委托%s排队超过%s秒，拒绝%s委托'
+                              %(qo.queueID, self.orderQueueWait, qo.orderReq.symbol))
+            self.finishQueueOrder(qo, '')
+
+        for gatewayName, qoList in sendDict.items():
+            gateway = self.mainEngine.gatewayDict[gatewayName]
+            vtOrderIDList = gateway.sendOrders([qo.orderReq for qo in qoList])
+            for qo, vtOrderID in zip(qoList, vtOrderIDList):
+                self.finishQueueOrder(qo, vtOrderID)
+
+    #----------------------------------------------------------------------
+    def finishQueueOrder(self, qo, vtOrderID):
+        """排队委托结束（发出或拒绝），回调在锁外执行"""
+        with self.queueLock:
+            self.gatewayQueueCount[qo.gatewayName] -= 1
+            self.queueOrderDict[qo.queueID] = vtOrderID
+
+        if qo.callback:
+            qo.callback(qo.queueID, vtOrderID)
+
+    #----------------------------------------------------------------------
+    def cancelQueueOrder(self, queueID):
+        """撤销排队中的委托，成功返回True"""
+        with self.queueLock:
+            for qo in self.orderQueue:
+                if qo.queueID == queueID:
+                    self.orderQueue.remove(qo)
+                    break
+            else:
+                return False
+
+        self.finishQueueOrder(qo, '')
+        return True
+
+    #----------------------------------------------------------------------
+    def getQueueOrderID(self, queueID):
+        """查询排队委托发出后的vtOrderID，还在排队或被拒绝时返回空字符串"""
+        return self.queueOrderDict.get(queueID, '')
+
+    #----------------------------------------------------------------------
+    def getQueueLength(self):
+        """查询排队委托数量"""
+        return len(self.orderQueue)
 
     #----------------------------------------------------------------------
     def writeRiskLog(self, content):
@@ -173,14 +410,8 @@ class RmEngine(object):
                               %(self.tradeCount, self.tradeLimit))
             return False
 
-        # 检查流控
-        if self.orderFlowCount >= self.orderFlowLimit:
-            self.writeRiskLog(u'委托流数量%s，超过限制每%s秒%s'
-                              %(self.orderFlowCount, self.orderFlowClear, self.orderFlowLimit))
-            return False
-
         # 检查总活动合约
-        workingOrderCount = len(self.mainEngine.getAllWorkingOrders())
+        workingOrderCount = self.mainEngine.getWorkingOrderCount()
         if workingOrderCount >= self.workingOrderLimit:
             self.writeRiskLog(u'当前活动委托数量%s，超过限制%s'
                               %(workingOrderCount, self.workingOrderLimit))
@@ -191,16 +422,56 @@ class RmEngine(object):
             self.writeRiskLog(u'当日%s撤单次数%s，超过限制%s'
                               %(orderReq.symbol, self.orderCancelDict[orderReq.symbol], self.orderCancelLimit))
             return False
-        
-        # 对于通过风控的委托，增加流控计数
-        self.orderFlowCount += 1
 
         return True
 
+    #----------------------------------------------------------------------
+    def checkRiskBatch(self, orderReqList):
+        """批量检查风险，返回与委托一一对应的检查结果列表
+        成交、活动委托这些全局限制对整个批次只检查一次"""
+        n = len(orderReqList)
+
+        # 如果没有启动风控检查，则直接返回成功
+        if not self.active:
+            return [True] * n
+
+        # 检查成交合约量
+        if self.tradeCount >= self.tradeLimit:
+            self.writeRiskLog(u'今日总成交合约数量%s，超过限制%s'
+                              %(self.tradeCount, self.tradeLimit))
+            return [False] * n
+
+        # 检查总活动合约
+        workingOrderCount = self.mainEngine.getWorkingOrderCount()
+        if workingOrderCount + n > self.workingOrderLimit:
+            self.writeRiskLog(u'当前活动委托数量%s，加上批量委托%s后超过限制%s'
+                              %(workingOrderCount, n, self.workingOrderLimit))
+            return [False] * n
+
+        # 逐笔检查委托数量和撤单次数
+        resultList = []
+        for orderReq in orderReqList:
+            if orderReq.volume > self.orderSizeLimit:
+                self.writeRiskLog(u'单笔委托数量%s，超过限制%s'
+                                  %(orderReq.volume, self.orderSizeLimit))
+                resultList.append(False)
+            elif self.orderCancelDict.get(orderReq.symbol, 0) >= self.orderCancelLimit:
+                self.writeRiskLog(u'当日%s撤单次数%s，超过限制%s'
+                                  %(orderReq.symbol, self.orderCancelDict[orderReq.symbol], self.orderCancelLimit))
+                resultList.append(False)
+            else:
+                resultList.append(True)
+
+        return resultList
+
     #----------------------------------------------------------------------
     def clearOrderFlowCount(self):
-        """清空流控计数"""
-        self.orderFlowCount = 0
+        """清空流控计数，即补满所有令牌桶"""
+        with self.queueLock:
+            for bucket in self.gatewayBucketDict.values():
+                bucket.fill(self.orderFlowLimit)
+            for bucket in self.symbolBucketDict.values():
+                bucket.fill(self.symbolFlowLimit)
         self.writeRiskLog(u'清空流控计数')
 
     #----------------------------------------------------------------------
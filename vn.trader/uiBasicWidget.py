@@ -1033,6 +1033,9 @@ class TradingWidget(QtGui.QFrame):
     #----------------------------------------------------------------------
     def cancelAll(self):
         """一键撤销所有委托"""
+        # 按接口分组后批量撤单
+        reqDict = {}
+        
         l = self.mainEngine.getAllWorkingOrders()
         for order in l:
             req = VtCancelOrderReq()
@@ -1041,7 +1044,10 @@ class TradingWidget(QtGui.QFrame):
             req.frontID = order.frontID
             req.sessionID = order.sessionID
             req.orderID = order.orderID
-            self.mainEngine.cancelOrder(req, order.gatewayName)
+            reqDict.setdefault(order.gatewayName, []).append(req)
+        
+        for gatewayName, reqList in reqDict.items():
+            self.mainEngine.cancelOrders(reqList, gatewayName)
             
     #----------------------------------------------------------------------
     def closePosition(self, cell):
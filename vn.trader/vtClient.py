@@ -57,6 +57,7 @@ class ClientEngine(object):
         
         # 扩展模块
         self.ctaEngine = CtaEngine(self, self.eventEngine)
+        self.ctaEngine.historyCache.maxThreads = 1      # RPC客户端的请求不支持多线程并发
         self.drEngine = DrEngine(self, self.eventEngine)
         self.rmEngine = RmEngine(self, self.eventEngine)
     
@@ -80,6 +81,16 @@ class ClientEngine(object):
         """对特定接口撤单"""
         self.client.cancelOrder(cancelOrderReq, gatewayName)
         
+    #----------------------------------------------------------------------
+    def sendOrders(self, orderReqList, gatewayName):
+        """对特定接口批量发单"""
+        return self.client.sendOrders(orderReqList, gatewayName)
+    
+    #----------------------------------------------------------------------
+    def cancelOrders(self, cancelOrderReqList, gatewayName):
+        """对特定接口批量撤单"""
+        self.client.cancelOrders(cancelOrderReqList, gatewayName)
+        
     #----------------------------------------------------------------------
     def qryAccont(self, gatewayName):
         """查询特定接口的账户"""
@@ -117,6 +128,21 @@ class ClientEngine(object):
         """向MongoDB中插入数据，d是具体数据"""
         self.client.dbInsert(dbName, collectionName, d)
     
+    #----------------------------------------------------------------------
+    def dbInsertMany(self, dbName, collectionName, l):
+        """向MongoDB中批量插入数据，l是数据列表"""
+        self.client.dbInsertMany(dbName, collectionName, l)
+    
+    #----------------------------------------------------------------------
+    def dbBulkUpsert(self, dbName, collectionName, l):
+        """向MongoDB中批量更新数据，l是(过滤条件, 更新内容)的列表"""
+        self.client.dbBulkUpsert(dbName, collectionName, l)
+    
+    #----------------------------------------------------------------------
+    def dbCreateIndex(self, dbName, collectionName, key):
+        """为MongoDB集合的某个字段创建升序索引"""
+        self.client.dbCreateIndex(dbName, collectionName, key)
+    
     #----------------------------------------------------------------------
     def dbQuery(self, dbName, collectionName, d):
         """从MongoDB中读取数据，d是查询要求，返回的是数据库查询的数据列表"""
@@ -137,6 +163,26 @@ class ClientEngine(object):
         """查询所有合约（返回列表）"""
         return self.client.getAllContracts()
     
+    #----------------------------------------------------------------------
+    def getContractsByExchange(self, exchange):
+        """查询某个交易所的所有合约（返回列表）"""
+        return self.client.getContractsByExchange(exchange)
+    
+    #----------------------------------------------------------------------
+    def getContractsByProductClass(self, productClass):
+        """查询某个产品类型的所有合约（返回列表）"""
+        return self.client.getContractsByProductClass(productClass)
+    
+    #----------------------------------------------------------------------
+    def getContractsByUnderlying(self, underlyingSymbol):
+        """查询某个标的物的所有合约（返回列表）"""
+        return self.client.getContractsByUnderlying(underlyingSymbol)
+    
+    #----------------------------------------------------------------------
+    def getContractsByGateway(self, gatewayName):
+        """查询某个接口的所有合约（返回列表）"""
+        return self.client.getContractsByGateway(gatewayName)
+    
     #----------------------------------------------------------------------
     def getOrder(self, vtOrderID):
         """查询委托"""
@@ -147,10 +193,45 @@ class ClientEngine(object):
         """查询所有的活跃的委托（返回列表）"""
         return self.client.getAllWorkingOrders()
     
+    #----------------------------------------------------------------------
+    def getWorkingOrderCount(self):
+        """查询活动委托数量"""
+        return self.client.getWorkingOrderCount()
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrdersBySymbol(self, vtSymbol):
+        """查询某个合约的活动委托（返回列表）"""
+        return self.client.getWorkingOrdersBySymbol(vtSymbol)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrderCountBySymbol(self, vtSymbol):
+        """查询某个合约的活动委托数量"""
+        return self.client.getWorkingOrderCountBySymbol(vtSymbol)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrdersByGateway(self, gatewayName):
+        """查询某个接口的活动委托（返回列表）"""
+        return self.client.getWorkingOrdersByGateway(gatewayName)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrderCountByGateway(self, gatewayName):
+        """查询某个接口的活动委托数量"""
+        return self.client.getWorkingOrderCountByGateway(gatewayName)
+    
+    #----------------------------------------------------------------------
+    def getTradedVolume(self, vtSymbol):
+        """查询某个合约的累计成交数量"""
+        return self.client.getTradedVolume(vtSymbol)
+    
     #----------------------------------------------------------------------
     def getAllGatewayNames(self):
         """查询所有的接口名称"""
         return self.client.getAllGatewayNames()
+    
+    #----------------------------------------------------------------------
+    def getCtaProfile(self, name=''):
+        """查询服务器上CTA策略的耗时统计，name为空时返回所有策略"""
+        return self.client.getCtaProfile(name)
 
 
 #----------------------------------------------------------------------
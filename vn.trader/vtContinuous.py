@@ -0,0 +1,384 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了连续合约K线的生成，替代行情记录时按主力合约重复写入数据的做法。
+
+1. 行情记录只保存具体合约的数据，连续合约在使用时根据各合约的数据生成
+2. 按交易日统计每个合约的成交量和持仓量（夜盘K线通过TRADING_DAY_OFFSET归入下一个交易日），
+   持仓量（或成交量）超过当前主力合约连续confirmDays个交易日后，从下一个交易日开始切换主力，
+   主力只会向更远月份的合约切换（合约按交割月份排序，郑商所3位数字代码的年份根据合约数据的开始时间推断）
+3. 支持不复权（raw）、差价复权（add）和比例复权（ratio）三种连续序列，
+   复权以最新主力合约的价格为基准，调整之前各段的历史价格
+4. 统计和拼接都使用numpy数组运算，结果缓存在本地存储目录下，数据源没有变化时直接读取缓存
+'''
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+
+from vtDataStore import (STORE_BAR, BAR_FIELDS, StoreDataView,
+                         getNumpyDtype, datetimeToInt, intToDatetime)
+
+
+# 复权方式
+ADJUST_RAW = 'raw'
+ADJUST_ADD = 'add'
+ADJUST_RATIO = 'ratio'
+
+# 主力合约判断指标
+METRIC_OPENINTEREST = 'openInterest'
+METRIC_VOLUME = 'volume'
+
+# 连续合约代码后缀
+CONTINUOUS_SUFFIX = '0000'
+
+# 交易日的计算偏移，夜盘（21:00之后）的K线加上偏移后归入下一个自然日
+TRADING_DAY_OFFSET = timedelta(hours=4)
+
+# 需要复权的价格字段
+PRICE_FIELDS = ['open', 'high', 'low', 'close']
+
+DAY_MICROSECONDS = 86400 * 1000000
+
+
+#----------------------------------------------------------------------
+def getProduct(symbol):
+    """获取合约的品种代码，如IF1606返回IF"""
+    return re.match(r'[A-Za-z]*', symbol).group()
+
+#----------------------------------------------------------------------
+def getContinuousSymbol(product):
+    """获取品种的连续合约代码，如IF返回IF0000"""
+    return product + CONTINUOUS_SUFFIX
+
+#----------------------------------------------------------------------
+def isContinuousSymbol(symbol):
+    """检查是否为连续合约代码"""
+    return bool(re.match(r'^[A-Za-z]+%s$' %CONTINUOUS_SUFFIX, symbol))
+
+#----------------------------------------------------------------------
+def getDeliveryMonth(symbol, start=None):
+    """获取合约的交割月份，如IF1606返回201606
+    郑商所的3位数字代码（如SR901）只有年份的个位，取不早于合约数据开始时间start的最近年份"""
+    digits = re.search(r'\d+$', symbol).group()
+    month = int(digits[-2:])
+
+    if len(digits) == 3:
+        start = start or datetime.now()
+        year = start.year + (int(digits[0]) - start.year) % 10
+    else:
+        year = 2000 + int(digits[:-2])
+
+    return year * 100 + month
+
+
+########################################################################
+class MongoBarSource(object):
+    """从MongoDB读取K线数据"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, dbClient, dbName):
+        """Constructor"""
+        self.db = dbClient[dbName]
+        self.dbName = dbName
+
+    #----------------------------------------------------------------------
+    def listContracts(self, product):
+        """获取品种下所有具体合约的代码"""
+        pattern = re.compile(r'^%s\d+$' %product)
+        l = [name for name in self.db.collection_names()
+             if pattern.match(name) and not isContinuousSymbol(name)]
+        return sorted(l, key=lambda name: getDeliveryMonth(name, self.getStartDatetime(name)))
+
+    #----------------------------------------------------------------------
+    def getStartDatetime(self, symbol):
+        """获取合约数据的开始时间，没有数据时返回None"""
+        first = self.db[symbol].find_one(sort=[('datetime', 1)])
+        return first['datetime'] if first else None
+
+    #----------------------------------------------------------------------
+    def loadArray(self, symbol):
+        """读取合约的全部K线，返回按时间排序的结构化数组"""
+        import numpy as np
+
+        fields = ['datetime'] + BAR_FIELDS
+        cursor = self.db[symbol].find({}, dict.fromkeys(fields, 1)).sort('datetime', 1)
+        l = [tuple([datetimeToInt(d['datetime'])] + [d.get(name, 0) or 0 for name in BAR_FIELDS])
+             for d in cursor]
+        return np.array(l, dtype=getNumpyDtype(STORE_BAR))
+
+    #----------------------------------------------------------------------
+    def getSignature(self, symbol):
+        """获取合约数据的标识（数量和最后时间），用于判断缓存是否过期"""
+        collection = self.db[symbol]
+        count = collection.count()
+        last = collection.find_one(sort=[('datetime', -1)])
+        lastTime = str(last['datetime']) if last else ''
+        return '%s|%s' %(count, lastTime)
+
+
+########################################################################
+class StoreBarSource(object):
+    """从本地列式存储读取K线数据"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, dataStore, dbName):
+        """Constructor"""
+        self.dataStore = dataStore
+        self.dbName = dbName
+
+    #----------------------------------------------------------------------
+    def listContracts(self, product):
+        """获取品种下所有具体合约的代码"""
+        path = os.path.join(self.dataStore.rootPath, self.dbName)
+        if not os.path.exists(path):
+            return []
+
+        pattern = re.compile(r'^%s\d+$' %product)
+        l = [name for name in os.listdir(path)
+             if pattern.match(name) and not isContinuousSymbol(name)]
+        return sorted(l, key=lambda name: getDeliveryMonth(name, self.getStartDatetime(name)))
+
+    #----------------------------------------------------------------------
+    def getStartDatetime(self, symbol):
+        """获取合约数据的开始时间（第一个数据文件的日期），没有数据时返回None"""
+        meta = self.dataStore.loadMeta(self.dbName, symbol)
+        if not meta:
+            return None
+
+        fileList = self.dataStore.getFileList(self.dbName, symbol, meta, datetime(1970, 1, 1))
+        if not fileList:
+            return None
+        return datetime.strptime(fileList[0][0], '%Y%m%d')
+
+    #----------------------------------------------------------------------
+    def loadArray(self, symbol):
+        """读取合约的全部K线，返回按时间排序的结构化数组"""
+        return self.dataStore.loadArray(self.dbName, symbol, datetime(1970, 1, 1))
+
+    #----------------------------------------------------------------------
+    def getSignature(self, symbol):
+        """获取合约数据的标识（各文件的大小），用于判断缓存是否过期"""
+        path = self.dataStore.getPath(self.dbName, symbol)
+        l = ['%s:%s' %(name, os.path.getsize(os.path.join(path, name)))
+             for name in sorted(os.listdir(path))]
+        return '|'.join(l)
+
+
+########################################################################
+class ContinuousBuilder(object):
+    """连续合约生成器"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, source, cachePath=None):
+        """Constructor，source为MongoBarSource或StoreBarSource，cachePath为空时不缓存"""
+        self.source = source
+        self.cachePath = cachePath
+
+        self.metric = METRIC_OPENINTEREST       # 主力合约判断指标
+        self.confirmDays = 1                    # 指标连续超过当前主力的交易日数
+        self.rollSchedule = []                  # 最近一次生成的换月计划，(交易日, 合约代码)的列表
+
+    #----------------------------------------------------------------------
+    def getTradingDays(self, array):
+        """计算每根K线所属的交易日（1970年起的天数）"""
+        offset = datetimeToInt(datetime(1970, 1, 1) + TRADING_DAY_OFFSET)
+        return (array['datetime'] + offset) // DAY_MICROSECONDS
+
+    #----------------------------------------------------------------------
+    def calculateDailyMetric(self, arrayList, dayList):
+        """计算各合约每个交易日的指标，返回(交易日数组, 指标矩阵[交易日, 合约])"""
+        import numpy as np
+
+        allDays = np.unique(np.concatenate(dayList))
+        matrix = np.zeros((len(allDays), len(arrayList)))
+
+        for j, (array, days) in enumerate(zip(arrayList, dayList)):
+            if not len(array):
+                continue
+            index = np.searchsorted(allDays, days)
+
+            if self.metric == METRIC_VOLUME:
+                matrix[:, j] = np.bincount(index, weights=array['volume'], minlength=len(allDays))
+            else:
+                # 每个交易日最后一根K线的持仓量
+                last = np.flatnonzero(np.diff(index)).tolist() + [len(index) - 1]
+                matrix[index[last], j] = array['openInterest'][last]
+
+        return allDays, matrix
+
+    #----------------------------------------------------------------------
+    def calculateRollSchedule(self, allDays, matrix):
+        """根据指标矩阵计算换月计划，返回(开始交易日, 合约序号)的列表"""
+        schedule = []
+        current = None
+        count = 0
+
+        for i in range(len(allDays)):
+            row = matrix[i]
+
+            if current is None:
+                if row.max() > 0:
+                    current = int(row.argmax())
+                    schedule.append((allDays[i], current))
+                continue
+
+            # 只向更远月份的合约切换
+            later = row[current+1:]
+            if not len(later):
+                continue
+            best = current + 1 + int(later.argmax())
+
+            if row[best] > row[current]:
+                count += 1
+            else:
+                count = 0
+
+            # 从下一个交易日开始切换
+            if count >= self.confirmDays and i + 1 < len(allDays):
+                current = best
+                count = 0
+                schedule.append((allDays[i+1], current))
+
+        return schedule
+
+    #----------------------------------------------------------------------
+    def build(self, product, adjust=ADJUST_RAW, refresh=False):
+        """生成品种的连续合约K线，返回结构化数组，数据源没有变化时读取缓存"""
+        import numpy as np
+
+        symbolList = self.source.listContracts(product)
+        if not symbolList:
+            return np.zeros(0, dtype=getNumpyDtype(STORE_BAR))
+
+        signature = [self.source.getSignature(symbol) for symbol in symbolList]
+        if not refresh:
+            array = self.loadCache(product, adjust, symbolList, signature)
+            if array is not None:
+                return array
+
+        arrayList = [self.source.loadArray(symbol) for symbol in symbolList]
+        dayList = [self.getTradingDays(array) for array in arrayList]
+        allDays, matrix = self.calculateDailyMetric(arrayList, dayList)
+        schedule = self.calculateRollSchedule(allDays, matrix)
+
+        # 按换月计划截取每个合约的数据
+        segmentList = []
+        for k, (startDay, j) in enumerate(schedule):
+            if k + 1 < len(schedule):
+                endDay = schedule[k+1][0]
+            else:
+                endDay = allDays[-1] + 1
+            mask = (dayList[j] >= startDay) & (dayList[j] < endDay)
+            segmentList.append(arrayList[j][mask].copy())
+
+        if adjust != ADJUST_RAW:
+            self.adjustSegments(segmentList, schedule, arrayList, adjust)
+
+        if segmentList:
+            array = np.concatenate(segmentList)
+        else:
+            array = np.zeros(0, dtype=getNumpyDtype(STORE_BAR))
+
+        self.rollSchedule = [(intToDatetime(day * DAY_MICROSECONDS).strftime('%Y%m%d'), symbolList[j])
+                             for day, j in schedule]
+        self.saveCache(product, adjust, symbolList, signature, array)
+        return array
+
+    #----------------------------------------------------------------------
+    def adjustSegments(self, segmentList, schedule, arrayList, adjust):
+        """复权，以最后一段为基准，从后向前调整之前各段的价格"""
+        import numpy as np
+
+        gapAdd = 0.0
+        gapRatio = 1.0
+
+        for k in range(len(segmentList) - 1, 0, -1):
+            prevSegment = segmentList[k-1]
+            if not len(prevSegment):
+                continue
+
+            # 使用旧合约最后一根K线时新合约的收盘价计算价差
+            startDay, j = schedule[k]
+            lastTime = prevSegment['datetime'][-1]
+            newArray = arrayList[j]
+            pos = np.searchsorted(newArray['datetime'], lastTime, 'right') - 1
+
+            if pos >= 0 and newArray['close'][pos] and prevSegment['close'][-1]:
+                if adjust == ADJUST_ADD:
+                    gapAdd += newArray['close'][pos] - prevSegment['close'][-1]
+                else:
+                    gapRatio *= newArray['close'][pos] / prevSegment['close'][-1]
+
+            for name in PRICE_FIELDS:
+                if adjust == ADJUST_ADD:
+                    prevSegment[name] += gapAdd
+                else:
+                    prevSegment[name] *= gapRatio
+
+    #----------------------------------------------------------------------
+    def getCacheFileName(self, product, adjust):
+        """获取缓存文件名（不含后缀）"""
+        name = '_'.join([product, adjust, self.metric, str(self.confirmDays)])
+        return os.path.join(self.cachePath, self.source.dbName, name)
+
+    #----------------------------------------------------------------------
+    def loadCache(self, product, adjust, symbolList, signature):
+        """读取缓存，缓存不存在或者数据源发生变化时返回None"""
+        import numpy as np
+
+        if not self.cachePath:
+            return None
+
+        fileName = self.getCacheFileName(product, adjust)
+        try:
+            with open(fileName + '.json') as f:
+                cache = json.load(f)
+            if cache['symbolList'] != symbolList or cache['signature'] != signature:
+                return None
+            array = np.load(fileName + '.npy')
+        except (IOError, ValueError, KeyError):
+            return None
+
+        self.rollSchedule = [tuple(l) for l in cache['rollSchedule']]
+        return array
+
+    #----------------------------------------------------------------------
+    def saveCache(self, product, adjust, symbolList, signature, array):
+        """保存缓存"""
+        import numpy as np
+
+        if not self.cachePath:
+            return
+
+        fileName = self.getCacheFileName(product, adjust)
+        path = os.path.dirname(fileName)
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        np.save(fileName + '.npy', array)
+        with open(fileName + '.json', 'w') as f:
+            json.dump({'symbolList': symbolList,
+                       'signature': signature,
+                       'rollSchedule': self.rollSchedule}, f, indent=4)
+
+    #----------------------------------------------------------------------
+    def loadData(self, product, start, end=None, adjust=ADJUST_RAW, dataClass=None, includeEnd=True):
+        """读取[start, end]时间区间内的连续合约K线，返回按需生成数据对象的视图"""
+        import numpy as np
+
+        array = self.build(product, adjust)
+
+        dtArray = array['datetime']
+        i = np.searchsorted(dtArray, datetimeToInt(start), 'left')
+        if end is None:
+            j = len(array)
+        elif includeEnd:
+            j = np.searchsorted(dtArray, datetimeToInt(end), 'right')
+        else:
+            j = np.searchsorted(dtArray, datetimeToInt(end), 'left')
+
+        symbol = getContinuousSymbol(product)
+        meta = {'vtSymbol': symbol, 'symbol': symbol, 'exchange': ''}
+        return StoreDataView(array[i:j], meta, dataClass)
@@ -0,0 +1,472 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了本地的列式行情数据存储，作为MongoDB之外的另一种选择。
+
+1. 每个合约每天一个文件：根目录/数据库名/集合名/YYYYMMDD.dat，
+   文件由定长的二进制记录组成，只追加写入
+2. 时间以1970年起的微秒数（int64）保存，其余数值字段统一为float64，
+   vtSymbol等字符串字段保存在集合目录下的meta.json中
+3. 读取时通过numpy.memmap映射文件，按时间二分查找截取区间，
+   可以直接返回结构化数组，也可以返回按需生成数据对象的视图
+4. 写入只依赖struct，行情记录进程不需要numpy
+5. 创建时开启compressTick的存储，新建的Tick集合使用vtTickCodec中的差分编码保存为.vtz文件，
+   读取时流式解码，集合是否压缩以及priceTick、volumeTick记录在meta.json中，
+   volumeTick由调用方指定，否则根据新建集合时第一批数据中的成交量等字段是否都是整数选择
+'''
+
+import json
+import os
+import struct
+from datetime import datetime, timedelta
+
+from vtTickCodec import (TickEncoder, TickDecoder, countRecords, scanRecords,
+                         DEFAULT_KEYFRAME_INTERVAL, PRICE_FIELDS)
+
+
+# 数据类型
+STORE_TICK = 'tick'
+STORE_BAR = 'bar'
+
+# 各类型的数值字段（datetime字段固定在第一列）
+TICK_FIELDS = ['lastPrice', 'volume', 'openInterest', 'upperLimit', 'lowerLimit',
+               'bidPrice1', 'bidPrice2', 'bidPrice3', 'bidPrice4', 'bidPrice5',
+               'askPrice1', 'askPrice2', 'askPrice3', 'askPrice4', 'askPrice5',
+               'bidVolume1', 'bidVolume2', 'bidVolume3', 'bidVolume4', 'bidVolume5',
+               'askVolume1', 'askVolume2', 'askVolume3', 'askVolume4', 'askVolume5']
+BAR_FIELDS = ['open', 'high', 'low', 'close', 'volume', 'openInterest']
+
+FIELDS_DICT = {STORE_TICK: TICK_FIELDS, STORE_BAR: BAR_FIELDS}
+
+# 字符串字段，保存在meta.json中
+META_FIELDS = ['vtSymbol', 'symbol', 'exchange']
+
+EPOCH = datetime(1970, 1, 1)
+FILE_SUFFIX = '.dat'
+COMPRESS_FILE_SUFFIX = '.vtz'
+META_FILE_NAME = 'meta.json'
+
+# 没有合约信息时使用的priceTick
+DEFAULT_PRICE_TICK = 0.000001
+
+# 成交量、持仓量等字段都是整数时使用的volumeTick
+DEFAULT_VOLUME_TICK = 1
+
+# 成交量等字段带小数（如数字货币）时使用的volumeTick
+FRACTIONAL_VOLUME_TICK = 0.00000001
+
+
+#----------------------------------------------------------------------
+def datetimeToInt(dt):
+    """datetime转换为1970年起的微秒数"""
+    delta = dt - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+#----------------------------------------------------------------------
+def intToDatetime(n):
+    """1970年起的微秒数转换为datetime"""
+    return EPOCH + timedelta(microseconds=int(n))
+
+#----------------------------------------------------------------------
+def getNumpyDtype(storeType):
+    """获取某种数据类型对应的numpy结构化dtype"""
+    import numpy as np
+    l = [('datetime', '<i8')]
+    l.extend([(name, '<f8') for name in FIELDS_DICT[storeType]])
+    return np.dtype(l)
+
+#----------------------------------------------------------------------
+def getFileSuffix(meta):
+    """获取集合数据文件的后缀"""
+    if meta.get('compress', False):
+        return COMPRESS_FILE_SUFFIX
+    return FILE_SUFFIX
+
+#----------------------------------------------------------------------
+def getVolumeTick(l):
+    """根据一批Tick数据选择volumeTick，成交量等非价格字段都是整数时为1，否则使用FRACTIONAL_VOLUME_TICK"""
+    fields = [name for name in TICK_FIELDS if name not in PRICE_FIELDS]
+    for d in l:
+        for name in fields:
+            v = float(d.get(name, 0) or 0)
+            if v != int(v):
+                return FRACTIONAL_VOLUME_TICK
+    return DEFAULT_VOLUME_TICK
+
+#----------------------------------------------------------------------
+def recordToData(names, record, meta, dataClass=None):
+    """将(时间微秒数, 字段值...)的记录转换为数据对象，dataClass为None时返回字典"""
+    d = dict(zip(names, record))
+    d.update(meta)
+
+    dt = intToDatetime(d['datetime'])
+    d['datetime'] = dt
+    d['date'] = dt.strftime('%Y%m%d')
+    d['time'] = dt.strftime('%H:%M:%S.%f')
+
+    if not dataClass:
+        return d
+
+    data = dataClass()
+    data.__dict__.update(d)
+    return data
+
+
+########################################################################
+class StoreDataView(object):
+    """数据视图，按需将结构化数组中的记录转换为数据对象（或字典）"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, array, meta, dataClass=None):
+        """Constructor"""
+        self.array = array              # numpy结构化数组（通常是memmap的切片）
+        self.meta = meta                # 字符串字段字典
+        self.dataClass = dataClass      # 数据类，为None时返回字典
+        self.names = array.dtype.names
+
+    #----------------------------------------------------------------------
+    def __len__(self):
+        """数据数量"""
+        return len(self.array)
+
+    #----------------------------------------------------------------------
+    def count(self):
+        """数据数量，和MongoDB查询指针保持一致"""
+        return len(self.array)
+
+    #----------------------------------------------------------------------
+    def __getitem__(self, i):
+        """生成第i条数据"""
+        return recordToData(self.names, self.array[i].item(), self.meta, self.dataClass)
+
+    #----------------------------------------------------------------------
+    def __iter__(self):
+        """逐条生成数据"""
+        for i in xrange(len(self.array)):
+            yield self[i]
+
+
+########################################################################
+class CompressedDataView(object):
+    """压缩Tick数据的视图，遍历时逐个文件流式解码，只支持顺序读取"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, fileList, meta, start, end=None, includeEnd=True, dataClass=None):
+        """Constructor，fileList为区间内按日期排序的(日期, 文件路径)列表"""
+        self.fileList = fileList
+        self.meta = {name: meta.get(name, '') for name in META_FIELDS}
+        self.priceTick = meta['priceTick']
+        self.volumeTick = meta.get('volumeTick', DEFAULT_VOLUME_TICK)     # 早期的集合没有volumeTick
+        self.dataClass = dataClass
+        self.names = ['datetime'] + TICK_FIELDS
+
+        self.startInt = datetimeToInt(start)
+        self.endInt = datetimeToInt(end) if end else None
+        self.includeEnd = includeEnd
+        self.startDate = start.strftime('%Y%m%d')
+        self.endDate = end.strftime('%Y%m%d') if end else None
+
+        self.length = None              # 数据数量缓存
+
+    #----------------------------------------------------------------------
+    def inRange(self, n):
+        """检查时间是否在区间内，返回-1（之前）、0（区间内）或1（之后）"""
+        if n < self.startInt:
+            return -1
+        if self.endInt is not None:
+            if n > self.endInt or (n == self.endInt and not self.includeEnd):
+                return 1
+        return 0
+
+    #----------------------------------------------------------------------
+    def iterRecords(self):
+        """逐条生成区间内的记录"""
+        decoder = TickDecoder(TICK_FIELDS, self.priceTick, self.volumeTick)
+
+        for date, fileName in self.fileList:
+            with open(fileName, 'rb') as f:
+                buf = f.read()
+
+            for record in decoder.iterRecords(buf):
+                result = self.inRange(record[0])
+                if result < 0:
+                    continue
+                elif result > 0:
+                    return
+                yield record
+
+    #----------------------------------------------------------------------
+    def __iter__(self):
+        """逐条生成数据"""
+        for record in self.iterRecords():
+            yield recordToData(self.names, record, self.meta, self.dataClass)
+
+    #----------------------------------------------------------------------
+    def __len__(self):
+        """数据数量，区间首尾的文件需要解码，中间的文件只统计记录数"""
+        if self.length is None:
+            decoder = TickDecoder(TICK_FIELDS, self.priceTick, self.volumeTick)
+            length = 0
+
+            for date, fileName in self.fileList:
+                with open(fileName, 'rb') as f:
+                    buf = f.read()
+
+                if date != self.startDate and date != self.endDate:
+                    length += countRecords(buf)
+                else:
+                    for record in decoder.iterRecords(buf):
+                        if not self.inRange(record[0]):
+                            length += 1
+
+            self.length = length
+
+        return self.length
+
+    #----------------------------------------------------------------------
+    def count(self):
+        """数据数量，和MongoDB查询指针保持一致"""
+        return len(self)
+
+
+########################################################################
+class VtDataStore(object):
+    """本地列式行情数据存储"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, rootPath, compressTick=False, keyframeInterval=DEFAULT_KEYFRAME_INTERVAL):
+        """Constructor"""
+        self.rootPath = rootPath
+        self.compressTick = compressTick            # 新建的Tick集合是否压缩保存
+        self.keyframeInterval = keyframeInterval    # 压缩时的关键帧间隔
+
+        # 写入相关
+        self.fileDict = {}              # 打开的文件，key为(dbName, collectionName)，value为(日期, 文件对象)
+        self.packerDict = {}            # 各数据类型的struct对象
+        self.metaDict = {}              # 集合的meta信息缓存，key为(dbName, collectionName)
+        self.encoderDict = {}           # 压缩集合的编码器，key为(dbName, collectionName)
+
+        for storeType, fields in FIELDS_DICT.items():
+            self.packerDict[storeType] = struct.Struct('<q' + 'd' * len(fields))
+
+    #----------------------------------------------------------------------
+    def getPath(self, dbName, collectionName):
+        """获取集合目录"""
+        return os.path.join(self.rootPath, dbName, collectionName)
+
+    #----------------------------------------------------------------------
+    def loadMeta(self, dbName, collectionName):
+        """读取集合的meta信息，不存在返回None"""
+        fileName = os.path.join(self.getPath(dbName, collectionName), META_FILE_NAME)
+        try:
+            with open(fileName) as f:
+                return json.load(f)
+        except IOError:
+            return None
+
+    #----------------------------------------------------------------------
+    def initCollection(self, dbName, collectionName, l, priceTick=None, volumeTick=None):
+        """根据第一批数据初始化集合目录和meta信息，返回meta信息"""
+        key = (dbName, collectionName)
+        meta = self.metaDict.get(key, None)
+        if meta:
+            return meta
+
+        meta = self.loadMeta(dbName, collectionName)
+        if not meta:
+            path = self.getPath(dbName, collectionName)
+            if not os.path.exists(path):
+                os.makedirs(path)
+
+            d = l[0]
+            meta = {name: d.get(name, '') for name in META_FIELDS}
+            if 'lastPrice' in d:
+                meta['type'] = STORE_TICK
+            else:
+                meta['type'] = STORE_BAR
+
+            if meta['type'] == STORE_TICK and self.compressTick:
+                meta['compress'] = True
+                meta['priceTick'] = priceTick or DEFAULT_PRICE_TICK
+                meta['volumeTick'] = volumeTick or getVolumeTick(l)
+
+            with open(os.path.join(path, META_FILE_NAME), 'w') as f:
+                json.dump(meta, f, indent=4)
+
+        self.metaDict[key] = meta
+        return meta
+
+    #----------------------------------------------------------------------
+    def getFile(self, dbName, collectionName, date, suffix=FILE_SUFFIX, recordSize=0):
+        """获取某天的数据文件对象，日期变化时关闭之前的文件，recordSize为未压缩文件的定长记录大小"""
+        key = (dbName, collectionName)
+        fileDate, f = self.fileDict.get(key, (None, None))
+
+        if fileDate != date:
+            if f:
+                f.close()
+            fileName = os.path.join(self.getPath(dbName, collectionName), date + suffix)
+
+            # 压缩文件之间相互独立，每个文件从关键帧开始，
+            # 同时截掉上次写入中断留下的不完整记录，避免之后追加的记录无法解码
+            if suffix == COMPRESS_FILE_SUFFIX:
+                if key in self.encoderDict:
+                    self.encoderDict[key].reset()
+
+                if os.path.exists(fileName):
+                    with open(fileName, 'r+b') as f:
+                        count, validLength = scanRecords(f.read())
+                        f.truncate(validLength)
+
+            # 未压缩文件截掉末尾不足一条记录的部分，避免之后追加的记录错位
+            elif recordSize and os.path.exists(fileName):
+                size = os.path.getsize(fileName)
+                if size % recordSize:
+                    with open(fileName, 'r+b') as f:
+                        f.truncate(size - size % recordSize)
+
+            f = open(fileName, 'ab')
+            self.fileDict[key] = (date, f)
+
+        return f
+
+    #----------------------------------------------------------------------
+    def appendMany(self, dbName, collectionName, l, priceTick=None, volumeTick=None):
+        """追加写入数据，l是字典（如CtaTickData.__dict__）的列表，要求按时间顺序，
+        priceTick和volumeTick只在新建压缩的Tick集合时使用"""
+        if not l:
+            return
+
+        meta = self.initCollection(dbName, collectionName, l, priceTick, volumeTick)
+        storeType = meta['type']
+        fields = FIELDS_DICT[storeType]
+        suffix = getFileSuffix(meta)
+
+        if meta.get('compress', False):
+            key = (dbName, collectionName)
+            encoder = self.encoderDict.get(key, None)
+            if not encoder:
+                encoder = TickEncoder(fields, meta['priceTick'], self.keyframeInterval,
+                                      meta.get('volumeTick', DEFAULT_VOLUME_TICK))
+                self.encoderDict[key] = encoder
+            pack = lambda *record: encoder.encode(record)
+        else:
+            pack = self.packerDict[storeType].pack
+
+        f = None
+        date = None
+        for d in l:
+            dt = d['datetime']
+            dtDate = dt.strftime('%Y%m%d')
+            if dtDate != date:
+                if f:
+                    f.flush()
+                date = dtDate
+                f = self.getFile(dbName, collectionName, date, suffix, self.packerDict[storeType].size)
+
+            values = [float(d[name] or 0) for name in fields]
+            f.write(pack(datetimeToInt(dt), *values))
+
+        f.flush()
+
+    #----------------------------------------------------------------------
+    def append(self, dbName, collectionName, d, priceTick=None, volumeTick=None):
+        """追加写入单条数据"""
+        self.appendMany(dbName, collectionName, [d], priceTick, volumeTick)
+
+    #----------------------------------------------------------------------
+    def close(self):
+        """关闭所有打开的文件"""
+        for date, f in self.fileDict.values():
+            f.close()
+        self.fileDict.clear()
+        self.encoderDict.clear()
+
+    #----------------------------------------------------------------------
+    def hasCollection(self, dbName, collectionName):
+        """检查集合是否存在"""
+        return self.loadMeta(dbName, collectionName) is not None
+
+    #----------------------------------------------------------------------
+    def getFileList(self, dbName, collectionName, meta, start, end=None):
+        """获取时间区间内按日期排序的(日期, 文件路径)列表"""
+        path = self.getPath(dbName, collectionName)
+        suffix = getFileSuffix(meta)
+        startDate = start.strftime('%Y%m%d')
+        endDate = end.strftime('%Y%m%d') if end else '99999999'
+
+        fileList = []
+        for fileName in sorted(os.listdir(path)):
+            if not fileName.endswith(suffix):
+                continue
+            date = fileName[:-len(suffix)]
+            if date < startDate or date > endDate:
+                continue
+            fileList.append((date, os.path.join(path, fileName)))
+
+        return fileList
+
+    #----------------------------------------------------------------------
+    def loadArray(self, dbName, collectionName, start, end=None, includeEnd=True):
+        """读取[start, end]时间区间内的数据，返回numpy结构化数组
+        区间只在一个文件内时直接返回memmap的切片，不复制数据，压缩的集合解码后返回"""
+        import numpy as np
+
+        meta = self.loadMeta(dbName, collectionName)
+        if not meta:
+            return None
+        dtype = getNumpyDtype(meta['type'])
+        fileList = self.getFileList(dbName, collectionName, meta, start, end)
+
+        if meta.get('compress', False):
+            view = CompressedDataView(fileList, meta, start, end, includeEnd)
+            return np.array(list(view.iterRecords()), dtype=dtype)
+
+        startDate = start.strftime('%Y%m%d')
+        endDate = end.strftime('%Y%m%d') if end else '99999999'
+        startInt = datetimeToInt(start)
+        endInt = datetimeToInt(end) if end else None
+
+        arrayList = []
+        for date, fileName in fileList:
+            # 忽略写入中断造成的不完整记录
+            n = os.path.getsize(fileName) // dtype.itemsize
+            if not n:
+                continue
+            array = np.memmap(fileName, dtype=dtype, mode='r', shape=(n,))
+
+            # 按时间二分查找截取区间
+            dtArray = array['datetime']
+            i = 0
+            j = n
+            if date == startDate:
+                i = np.searchsorted(dtArray, startInt, 'left')
+            if endInt is not None and date == endDate:
+                if includeEnd:
+                    j = np.searchsorted(dtArray, endInt, 'right')
+                else:
+                    j = np.searchsorted(dtArray, endInt, 'left')
+            if i < j:
+                arrayList.append(array[i:j])
+
+        if not arrayList:
+            return np.zeros(0, dtype=dtype)
+        elif len(arrayList) == 1:
+            return arrayList[0]
+        else:
+            return np.concatenate(arrayList)
+
+    #----------------------------------------------------------------------
+    def loadData(self, dbName, collectionName, start, end=None, dataClass=None, includeEnd=True):
+        """读取[start, end]时间区间内的数据，返回按需生成数据对象的视图"""
+        meta = self.loadMeta(dbName, collectionName)
+        if not meta:
+            return []
+
+        if meta.get('compress', False):
+            fileList = self.getFileList(dbName, collectionName, meta, start, end)
+            return CompressedDataView(fileList, meta, start, end, includeEnd, dataClass)
+
+        array = self.loadArray(dbName, collectionName, start, end, includeEnd)
+        meta = {name: meta.get(name, '') for name in META_FIELDS}
+        return StoreDataView(array, meta, dataClass)
@@ -2,20 +2,23 @@
 
 import shelve
 from collections import OrderedDict
+from copy import copy
 from datetime import datetime
 
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo import MongoClient, UpdateOne, ASCENDING
+from pymongo.errors import ConnectionFailure, BulkWriteError
 
 from eventEngine import *
 from vtGateway import *
-from vtFunction import loadMongoSetting
+from vtFunction import loadMongoSetting, loadContractSetting
 from language import text
 
 from gateway import GATEWAY_DICT
 from ctaStrategy.ctaEngine import CtaEngine
 from dataRecorder.drEngine import DrEngine
 from riskManager.rmEngine import RmEngine
+from level2.l2Engine import L2Engine
+from portfolioManager.pmEngine import PmEngine
 
 
 ########################################################################
@@ -45,6 +48,8 @@ class MainEngine(object):
         self.ctaEngine = CtaEngine(self, self.eventEngine)
         self.drEngine = DrEngine(self, self.eventEngine)
         self.rmEngine = RmEngine(self, self.eventEngine)
+        self.l2Engine = L2Engine(self, self.eventEngine)
+        self.pmEngine = PmEngine(self, self.eventEngine)
         
     #----------------------------------------------------------------------
     def initGateway(self):
@@ -88,15 +93,16 @@ class MainEngine(object):
             self.writeLog(text.GATEWAY_NOT_EXIST.format(gateway=gatewayName))        
         
     #----------------------------------------------------------------------
-    def sendOrder(self, orderReq, gatewayName):
-        """对特定接口发单"""
+    def sendOrder(self, orderReq, gatewayName, callback=None):
+        """对特定接口发单
+        超出流控速率的委托会进入风控排队队列，此时返回排队编号，
+        委托最终发出或被拒绝后以(排队编号, vtOrderID)调用callback"""
         # 如果风控检查失败则不发单
         if not self.rmEngine.checkRisk(orderReq):
             return ''
 
         if gatewayName in self.gatewayDict:
-            gateway = self.gatewayDict[gatewayName]
-            return gateway.sendOrder(orderReq)
+            return self.rmEngine.throttleOrder(orderReq, gatewayName, callback)
         else:
             self.writeLog(text.GATEWAY_NOT_EXIST.format(gateway=gatewayName))        
     
@@ -109,6 +115,30 @@ class MainEngine(object):
         else:
             self.writeLog(text.GATEWAY_NOT_EXIST.format(gateway=gatewayName))
             
+    #----------------------------------------------------------------------
+    def sendOrders(self, orderReqList, gatewayName, callback=None):
+        """对特定接口批量发单，返回与请求一一对应的vtOrderID（或排队编号）列表，未通过风控的为空字符串"""
+        if gatewayName not in self.gatewayDict:
+            self.writeLog(text.GATEWAY_NOT_EXIST.format(gateway=gatewayName))
+            return [''] * len(orderReqList)
+        
+        # 整个批次只做一次风控检查
+        resultList = self.rmEngine.checkRiskBatch(orderReqList)
+        passedList = [req for req, result in zip(orderReqList, resultList) if result]
+        if not passedList:
+            return [''] * len(orderReqList)
+        
+        vtOrderIDs = iter(self.rmEngine.throttleOrders(passedList, gatewayName, callback))
+        return [next(vtOrderIDs) if result else '' for result in resultList]
+    
+    #----------------------------------------------------------------------
+    def cancelOrders(self, cancelOrderReqList, gatewayName):
+        """对特定接口批量撤单"""
+        if gatewayName in self.gatewayDict:
+            gateway = self.gatewayDict[gatewayName]
+            gateway.cancelOrders(cancelOrderReqList)
+        else:
+            self.writeLog(text.GATEWAY_NOT_EXIST.format(gateway=gatewayName))
         
     #----------------------------------------------------------------------
     def qryAccount(self, gatewayName):
@@ -138,6 +168,12 @@ class MainEngine(object):
         # 停止事件引擎
         self.eventEngine.stop()      
         
+        # 停止风控引擎的排队线程
+        self.rmEngine.stop()
+        
+        # 停止CTA策略的工作线程
+        self.ctaEngine.stop()
+        
         # 停止数据记录引擎
         self.drEngine.stop()
         
@@ -186,6 +222,44 @@ class MainEngine(object):
         else:
             self.writeLog(text.DATA_INSERT_FAILED)
     
+    #----------------------------------------------------------------------
+    def dbInsertMany(self, dbName, collectionName, l):
+        """向MongoDB中批量插入数据，l是数据列表，使用无序插入，单条失败不影响其他数据"""
+        if self.dbClient:
+            db = self.dbClient[dbName]
+            collection = db[collectionName]
+            try:
+                collection.insert_many(l, ordered=False)
+            except BulkWriteError as e:
+                self.writeLog(text.DATA_BULK_INSERT_ERROR.format(collection=collectionName,
+                                                                 count=len(e.details.get('writeErrors', []))))
+        else:
+            self.writeLog(text.DATA_INSERT_FAILED)
+    
+    #----------------------------------------------------------------------
+    def dbBulkUpsert(self, dbName, collectionName, l):
+        """向MongoDB中批量更新数据，l是(过滤条件, 更新内容)的列表，不存在时插入"""
+        if self.dbClient:
+            db = self.dbClient[dbName]
+            collection = db[collectionName]
+            try:
+                collection.bulk_write([UpdateOne(flt, update, upsert=True) for flt, update in l], ordered=False)
+            except BulkWriteError as e:
+                self.writeLog(text.DATA_BULK_UPDATE_ERROR.format(collection=collectionName,
+                                                                 count=len(e.details.get('writeErrors', []))))
+        else:
+            self.writeLog(text.DATA_UPDATE_FAILED)
+    
+    #----------------------------------------------------------------------
+    def dbCreateIndex(self, dbName, collectionName, key):
+        """为MongoDB集合的某个字段创建升序索引，索引已存在时不做任何操作"""
+        if self.dbClient:
+            db = self.dbClient[dbName]
+            collection = db[collectionName]
+            collection.create_index([(key, ASCENDING)], background=True)
+        else:
+            self.writeLog(text.DATA_UPDATE_FAILED)
+    
     #----------------------------------------------------------------------
     def dbQuery(self, dbName, collectionName, d):
         """从MongoDB中读取数据，d是查询要求，返回的是数据库查询的指针"""
@@ -232,6 +306,26 @@ class MainEngine(object):
         """查询所有合约（返回列表）"""
         return self.dataEngine.getAllContracts()
     
+    #----------------------------------------------------------------------
+    def getContractsByExchange(self, exchange):
+        """查询某个交易所的所有合约（返回列表）"""
+        return self.dataEngine.getContractsByExchange(exchange)
+    
+    #----------------------------------------------------------------------
+    def getContractsByProductClass(self, productClass):
+        """查询某个产品类型的所有合约（返回列表）"""
+        return self.dataEngine.getContractsByProductClass(productClass)
+    
+    #----------------------------------------------------------------------
+    def getContractsByUnderlying(self, underlyingSymbol):
+        """查询某个标的物的所有合约（返回列表）"""
+        return self.dataEngine.getContractsByUnderlying(underlyingSymbol)
+    
+    #----------------------------------------------------------------------
+    def getContractsByGateway(self, gatewayName):
+        """查询某个接口的所有合约（返回列表）"""
+        return self.dataEngine.getContractsByGateway(gatewayName)
+    
     #----------------------------------------------------------------------
     def getOrder(self, vtOrderID):
         """查询委托"""
@@ -242,10 +336,45 @@ class MainEngine(object):
         """查询所有的活跃的委托（返回列表）"""
         return self.dataEngine.getAllWorkingOrders()
     
+    #----------------------------------------------------------------------
+    def getWorkingOrderCount(self):
+        """查询活动委托数量"""
+        return self.dataEngine.getWorkingOrderCount()
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrdersBySymbol(self, vtSymbol):
+        """查询某个合约的活动委托（返回列表）"""
+        return self.dataEngine.getWorkingOrdersBySymbol(vtSymbol)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrderCountBySymbol(self, vtSymbol):
+        """查询某个合约的活动委托数量"""
+        return self.dataEngine.getWorkingOrderCountBySymbol(vtSymbol)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrdersByGateway(self, gatewayName):
+        """查询某个接口的活动委托（返回列表）"""
+        return self.dataEngine.getWorkingOrdersByGateway(gatewayName)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrderCountByGateway(self, gatewayName):
+        """查询某个接口的活动委托数量"""
+        return self.dataEngine.getWorkingOrderCountByGateway(gatewayName)
+    
+    #----------------------------------------------------------------------
+    def getTradedVolume(self, vtSymbol):
+        """查询某个合约的累计成交数量"""
+        return self.dataEngine.getTradedVolume(vtSymbol)
+    
     #----------------------------------------------------------------------
     def getAllGatewayNames(self):
         """查询引擎中所有可用接口的名称"""
         return self.gatewayDict.keys()
+    
+    #----------------------------------------------------------------------
+    def getCtaProfile(self, name=''):
+        """查询CTA策略的耗时统计，name为空时返回所有策略"""
+        return self.ctaEngine.getProfileMetrics(name)
         
     
 
@@ -253,6 +382,9 @@ class MainEngine(object):
 class DataEngine(object):
     """数据引擎"""
     contractFileName = 'ContractData.vt'
+    
+    # 合约索引的字段
+    contractIndexFields = ['exchange', 'productClass', 'underlyingSymbol', 'gatewayName']
 
     #----------------------------------------------------------------------
     def __init__(self, eventEngine):
@@ -262,12 +394,32 @@ class DataEngine(object):
         # 保存合约详细信息的字典
         self.contractDict = {}
         
+        # 合约的二级索引字典，key为索引字段名，value为{字段值: {vtSymbol: 合约}}
+        self.contractIndexDict = {}
+        for field in self.contractIndexFields:
+            self.contractIndexDict[field] = {}
+        
+        # 合约数据的增量保存相关
+        self.contractFile = None            # 打开的shelve文件
+        self.dirtyContractSet = set()       # 尚未写入硬盘的合约vtSymbol集合
+        self.contractSaveTimer = 0          # 保存计时
+        self.contractSaveInterval, self.contractSaveRawData = loadContractSetting()
+        
         # 保存委托数据的字典
         self.orderDict = {}
         
         # 保存活动委托数据的字典（即可撤销）
         self.workingOrderDict = {}
         
+        # 活动委托的二级索引，key为vtSymbol或接口名，value为{vtOrderID: order}
+        # 字典的长度即为对应的活动委托数量
+        self.symbolWorkingOrderDict = {}
+        self.gatewayWorkingOrderDict = {}
+        
+        # 成交统计，key为vtSymbol，value为累计成交数量
+        self.tradedVolumeDict = {}
+        self.tradeSet = set()               # 成交号集合，用来过滤重复的成交推送
+        
         # 读取保存在硬盘的合约数据
         self.loadContracts()
         
@@ -278,9 +430,32 @@ class DataEngine(object):
     def updateContract(self, event):
         """更新合约数据"""
         contract = event.dict_['data']
+        self.addContract(contract)
+        
+        # 标记为待保存，由定时器批量写入硬盘
+        self.dirtyContractSet.add(contract.vtSymbol)
+        
+    #----------------------------------------------------------------------
+    def addContract(self, contract):
+        """添加合约到字典和索引中"""
+        # 若合约已存在，则先从旧的索引中移除
+        oldContract = self.contractDict.get(contract.vtSymbol, None)
+        if oldContract:
+            for field in self.contractIndexFields:
+                d = self.contractIndexDict[field].get(getattr(oldContract, field), None)
+                if d and d.get(contract.vtSymbol, None) is oldContract:
+                    del d[contract.vtSymbol]
+        
         self.contractDict[contract.vtSymbol] = contract
         self.contractDict[contract.symbol] = contract       # 使用常规代码（不包括交易所）可能导致重复
         
+        for field in self.contractIndexFields:
+            index = self.contractIndexDict[field]
+            value = getattr(contract, field)
+            if value not in index:
+                index[value] = {}
+            index[value][contract.vtSymbol] = contract
+        
     #----------------------------------------------------------------------
     def getContract(self, vtSymbol):
         """查询合约对象"""
@@ -294,22 +469,104 @@ class DataEngine(object):
         """查询所有合约对象（返回列表）"""
         return self.contractDict.values()
     
+    #----------------------------------------------------------------------
+    def getContractsByIndex(self, field, value):
+        """通过索引查询合约对象（返回列表）"""
+        d = self.contractIndexDict[field].get(value, None)
+        if d:
+            return d.values()
+        else:
+            return []
+    
+    #----------------------------------------------------------------------
+    def getContractsByExchange(self, exchange):
+        """查询某个交易所的所有合约（返回列表）"""
+        return self.getContractsByIndex('exchange', exchange)
+    
+    #----------------------------------------------------------------------
+    def getContractsByProductClass(self, productClass):
+        """查询某个产品类型的所有合约（返回列表）"""
+        return self.getContractsByIndex('productClass', productClass)
+    
+    #----------------------------------------------------------------------
+    def getContractsByUnderlying(self, underlyingSymbol):
+        """查询某个标的物的所有合约，如期权链（返回列表）"""
+        return self.getContractsByIndex('underlyingSymbol', underlyingSymbol)
+    
+    #----------------------------------------------------------------------
+    def getContractsByGateway(self, gatewayName):
+        """查询某个接口的所有合约（返回列表）"""
+        return self.getContractsByIndex('gatewayName', gatewayName)
+    
+    #----------------------------------------------------------------------
+    def openContractFile(self):
+        """打开合约数据文件"""
+        if not self.contractFile:
+            self.contractFile = shelve.open(self.contractFileName, protocol=2)
+        return self.contractFile
+    
+    #----------------------------------------------------------------------
+    def flushContracts(self):
+        """把有变化的合约写入硬盘"""
+        if not self.dirtyContractSet:
+            return
+        
+        f = self.openContractFile()
+        for vtSymbol in self.dirtyContractSet:
+            contract = self.contractDict.get(vtSymbol, None)
+            if not contract:
+                continue
+            
+            # 不保存原始数据时，写入去掉rawData的副本
+            if not self.contractSaveRawData and contract.rawData is not None:
+                contract = copy(contract)
+                contract.rawData = None
+            
+            f[self.getContractKey(vtSymbol)] = contract
+        
+        f.sync()
+        self.dirtyContractSet.clear()
+    
     #----------------------------------------------------------------------
     def saveContracts(self):
         """保存所有合约对象到硬盘"""
-        f = shelve.open(self.contractFileName)
-        f['data'] = self.contractDict
-        f.close()
+        self.flushContracts()
+        
+        if self.contractFile:
+            self.contractFile.close()
+            self.contractFile = None
     
     #----------------------------------------------------------------------
     def loadContracts(self):
         """从硬盘读取合约对象"""
-        f = shelve.open(self.contractFileName)
+        f = self.openContractFile()
+        
+        # 旧版本将所有合约以整个字典保存在data键下，读取后转为按合约保存
         if 'data' in f:
             d = f['data']
-            for key, value in d.items():
-                self.contractDict[key] = value
-        f.close()
+            del f['data']
+            for contract in d.values():
+                self.addContract(contract)
+                self.dirtyContractSet.add(contract.vtSymbol)
+        
+        for contract in f.values():
+            self.addContract(contract)
+    
+    #----------------------------------------------------------------------
+    def getContractKey(self, vtSymbol):
+        """获取合约在shelve文件中的键（必须为str）"""
+        if isinstance(vtSymbol, unicode):
+            return vtSymbol.encode('utf-8')
+        return vtSymbol
+    
+    #----------------------------------------------------------------------
+    def updateTimer(self, event):
+        """定时保存合约数据"""
+        self.contractSaveTimer += 1
+        
+        if self.contractSaveTimer >= self.contractSaveInterval:
+            self.contractSaveTimer = 0
+            self.flushContracts()
         
     #----------------------------------------------------------------------
     def updateOrder(self, event):
@@ -317,13 +574,43 @@ class DataEngine(object):
         order = event.dict_['data']        
         self.orderDict[order.vtOrderID] = order
         
-        # 如果订单的状态是全部成交或者撤销，则需要从workingOrderDict中移除
-        if order.status == STATUS_ALLTRADED or order.status == STATUS_CANCELLED:
+        # 如果订单的状态是全部成交、撤销或者拒单，则需要从workingOrderDict中移除
+        if order.status in (STATUS_ALLTRADED, STATUS_CANCELLED, STATUS_REJECTED):
             if order.vtOrderID in self.workingOrderDict:
                 del self.workingOrderDict[order.vtOrderID]
+                self.removeWorkingIndex(self.symbolWorkingOrderDict, order.vtSymbol, order.vtOrderID)
+                self.removeWorkingIndex(self.gatewayWorkingOrderDict, order.gatewayName, order.vtOrderID)
         # 否则则更新字典中的数据        
         else:
             self.workingOrderDict[order.vtOrderID] = order
+            self.addWorkingIndex(self.symbolWorkingOrderDict, order.vtSymbol, order)
+            self.addWorkingIndex(self.gatewayWorkingOrderDict, order.gatewayName, order)
+    
+    #----------------------------------------------------------------------
+    def addWorkingIndex(self, indexDict, key, order):
+        """添加活动委托到索引中"""
+        if key not in indexDict:
+            indexDict[key] = {}
+        indexDict[key][order.vtOrderID] = order
+    
+    #----------------------------------------------------------------------
+    def removeWorkingIndex(self, indexDict, key, vtOrderID):
+        """从索引中移除活动委托"""
+        d = indexDict.get(key, None)
+        if d and vtOrderID in d:
+            del d[vtOrderID]
+            
+    #----------------------------------------------------------------------
+    def updateTrade(self, event):
+        """更新成交数据"""
+        trade = event.dict_['data']
+        
+        # 过滤已经收到过的成交回报
+        if trade.vtTradeID in self.tradeSet:
+            return
+        self.tradeSet.add(trade.vtTradeID)
+        
+        self.tradedVolumeDict[trade.vtSymbol] = self.tradedVolumeDict.get(trade.vtSymbol, 0) + trade.volume
         
     #----------------------------------------------------------------------
     def getOrder(self, vtOrderID):
@@ -338,11 +625,51 @@ class DataEngine(object):
         """查询所有活动委托（返回列表）"""
         return self.workingOrderDict.values()
     
+    #----------------------------------------------------------------------
+    def getWorkingOrderCount(self):
+        """查询活动委托数量"""
+        return len(self.workingOrderDict)
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrdersBySymbol(self, vtSymbol):
+        """查询某个合约的活动委托（返回列表）"""
+        d = self.symbolWorkingOrderDict.get(vtSymbol, None)
+        if d:
+            return d.values()
+        else:
+            return []
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrderCountBySymbol(self, vtSymbol):
+        """查询某个合约的活动委托数量"""
+        return len(self.symbolWorkingOrderDict.get(vtSymbol, ()))
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrdersByGateway(self, gatewayName):
+        """查询某个接口的活动委托（返回列表）"""
+        d = self.gatewayWorkingOrderDict.get(gatewayName, None)
+        if d:
+            return d.values()
+        else:
+            return []
+    
+    #----------------------------------------------------------------------
+    def getWorkingOrderCountByGateway(self, gatewayName):
+        """查询某个接口的活动委托数量"""
+        return len(self.gatewayWorkingOrderDict.get(gatewayName, ()))
+    
+    #----------------------------------------------------------------------
+    def getTradedVolume(self, vtSymbol):
+        """查询某个合约的累计成交数量"""
+        return self.tradedVolumeDict.get(vtSymbol, 0)
+    
     #----------------------------------------------------------------------
     def registerEvent(self):
         """注册事件监听"""
         self.eventEngine.register(EVENT_CONTRACT, self.updateContract)
         self.eventEngine.register(EVENT_ORDER, self.updateOrder)
+        self.eventEngine.register(EVENT_TRADE, self.updateTrade)
+        self.eventEngine.register(EVENT_TIMER, self.updateTimer)
         
     
     
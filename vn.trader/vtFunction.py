@@ -48,6 +48,70 @@ def loadMongoSetting():
         
     return host, port, logging
 
+#----------------------------------------------------------------------
+def loadContractSetting():
+    """载入合约数据保存的配置"""
+    fileName = 'VT_setting.json'
+    path = os.path.abspath(os.path.dirname(__file__)) 
+    fileName = os.path.join(path, fileName)  
+    
+    try:
+        f = file(fileName)
+        setting = json.load(f)
+        saveInterval = setting['contractSaveInterval']
+        saveRawData = setting['contractSaveRawData']
+    except:
+        saveInterval = 10
+        saveRawData = True
+        
+    return saveInterval, saveRawData
+
+#----------------------------------------------------------------------
+def loadDataStoreSetting():
+    """载入行情数据存储的配置，返回存储类型（mongo或local）和本地存储目录"""
+    fileName = 'VT_setting.json'
+    path = os.path.abspath(os.path.dirname(__file__)) 
+    fileName = os.path.join(path, fileName)  
+    
+    try:
+        f = file(fileName)
+        setting = json.load(f)
+        storeType = setting['dataStoreType']
+        storePath = setting['dataStorePath']
+    except:
+        storeType = 'mongo'
+        storePath = ''
+    
+    # 默认保存在vn.trader目录下的dataStore文件夹
+    if not storePath:
+        storePath = os.path.join(path, 'dataStore')
+        
+    return storeType, storePath
+
+#----------------------------------------------------------------------
+def parseDatetime(date, time):
+    """将20151009和11:20:56.5格式的日期、时间字符串转换为datetime对象，比strptime快很多"""
+    hms, sep, fraction = time.partition('.')
+    hour, minute, second = hms.split(':')
+    
+    if fraction:
+        microsecond = int(fraction[:6].ljust(6, '0'))
+    else:
+        microsecond = 0
+    
+    return datetime(int(date[:4]), int(date[4:6]), int(date[6:8]),
+                    int(hour), int(minute), int(second), microsecond)
+
+#----------------------------------------------------------------------
+def getTickDatetime(tick):
+    """获取tick的datetime，解析后连同解析时的日期和时间缓存在tick对象上，之后各引擎直接使用，
+    部分接口（如火币、Lhang）更新日期和时间后重复推送同一个tick对象，此时重新解析"""
+    key = (tick.date, tick.time)
+    if tick.datetime is None or tick.datetimeKey != key:
+        tick.datetime = parseDatetime(tick.date, tick.time)
+        tick.datetimeKey = key
+    return tick.datetime
+
 #----------------------------------------------------------------------
 def todayDate():
     """获取当前本机电脑时间的日期"""
@@ -106,6 +106,20 @@ class VtGateway(object):
         event1.dict_['data'] = contract
         self.eventEngine.put(event1)        
     
+    #----------------------------------------------------------------------
+    def onL2Order(self, order):
+        """L2逐笔委托推送（数据量大，只推送通用事件）"""
+        event1 = Event(type_=EVENT_L2_ORDER)
+        event1.dict_['data'] = order
+        self.eventEngine.put(event1)
+        
+    #----------------------------------------------------------------------
+    def onL2Trade(self, trade):
+        """L2逐笔成交推送（数据量大，只推送通用事件）"""
+        event1 = Event(type_=EVENT_L2_TRADE)
+        event1.dict_['data'] = trade
+        self.eventEngine.put(event1)
+    
     #----------------------------------------------------------------------
     def connect(self):
         """连接"""
@@ -126,6 +140,17 @@ class VtGateway(object):
         """撤单"""
         pass
     
+    #----------------------------------------------------------------------
+    def sendOrders(self, orderReqList):
+        """批量发单，返回与请求一一对应的vtOrderID列表，支持批量接口的gateway可以重载"""
+        return [self.sendOrder(orderReq) for orderReq in orderReqList]
+    
+    #----------------------------------------------------------------------
+    def cancelOrders(self, cancelOrderReqList):
+        """批量撤单，支持批量接口的gateway可以重载"""
+        for cancelOrderReq in cancelOrderReqList:
+            self.cancelOrder(cancelOrderReq)
+    
     #----------------------------------------------------------------------
     def qryAccount(self):
         """查询账户资金"""
@@ -174,6 +199,8 @@ class VtTickData(VtBaseData):
         self.openInterest = EMPTY_INT           # 持仓量
         self.time = EMPTY_STRING                # 时间 11:20:56.5
         self.date = EMPTY_STRING                # 日期 20151009
+        self.datetime = None                    # python的datetime时间对象，由vtFunction.getTickDatetime解析后缓存
+        self.datetimeKey = None                 # 解析datetime时的(date, time)，变化时重新解析
         
         # 常规行情
         self.openPrice = EMPTY_FLOAT            # 今日开盘价
@@ -371,6 +398,51 @@ class VtContractData(VtBaseData):
         self.optionType = EMPTY_UNICODE         # 期权类型
 
 
+########################################################################
+class VtL2OrderData(VtBaseData):
+    """L2逐笔委托数据类"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        super(VtL2OrderData, self).__init__()
+        
+        self.symbol = EMPTY_STRING              # 代码
+        self.exchange = EMPTY_STRING            # 交易所代码
+        self.vtSymbol = EMPTY_STRING            # 合约在vt系统中的唯一代码，通常是 合约代码.交易所代码
+        
+        self.groupID = EMPTY_INT                # 委托组（频道）
+        self.orderIndex = EMPTY_INT             # 委托序号
+        self.direction = EMPTY_UNICODE          # 委托方向
+        self.orderKind = EMPTY_STRING           # 报单类型
+        self.price = EMPTY_FLOAT                # 委托价格
+        self.volume = EMPTY_INT                 # 委托数量
+        self.orderTime = EMPTY_STRING           # 委托时间
+
+
+########################################################################
+class VtL2TradeData(VtBaseData):
+    """L2逐笔成交数据类"""
+
+    #----------------------------------------------------------------------
+    def __init__(self):
+        """Constructor"""
+        super(VtL2TradeData, self).__init__()
+        
+        self.symbol = EMPTY_STRING              # 代码
+        self.exchange = EMPTY_STRING            # 交易所代码
+        self.vtSymbol = EMPTY_STRING            # 合约在vt系统中的唯一代码，通常是 合约代码.交易所代码
+        
+        self.groupID = EMPTY_INT                # 成交组（频道）
+        self.tradeIndex = EMPTY_INT             # 成交序号
+        self.buyIndex = EMPTY_INT               # 买方委托序号
+        self.sellIndex = EMPTY_INT              # 卖方委托序号
+        self.cancelled = False                  # 是否为撤单回报（深交所撤单通过成交推送）
+        self.price = EMPTY_FLOAT                # 成交价格
+        self.volume = EMPTY_INT                 # 成交数量
+        self.tradeTime = EMPTY_STRING           # 成交时间
+
+
 ########################################################################
 class VtSubscribeReq(object):
     """订阅行情时传入的对象类"""
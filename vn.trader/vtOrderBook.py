@@ -0,0 +1,227 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了基于有序数组的增量订单簿，供能够推送深度行情的接口使用。
+
+1. 买卖盘分别用一对有序数组保存价格和数量，买盘价格取负数保存，
+   从而两边的第0档都是最优价格，可以直接使用bisect查找
+2. 支持按价格增量插入、更新和删除档位，数量为0即代表删除，
+   也支持在档位上直接增减数量（用于逐笔委托重建订单簿）
+3. 只有前depth档发生变化时才标记盘口变化，接口可以据此决定是否推送tick
+'''
+
+from array import array
+from bisect import bisect_left
+
+from vtConstant import EMPTY_FLOAT, EMPTY_INT
+
+
+# 用于填充VtTickData的字段名，索引为档位
+BID_PRICE_FIELDS = ['bidPrice%s' %(i+1) for i in range(5)]
+BID_VOLUME_FIELDS = ['bidVolume%s' %(i+1) for i in range(5)]
+ASK_PRICE_FIELDS = ['askPrice%s' %(i+1) for i in range(5)]
+ASK_VOLUME_FIELDS = ['askVolume%s' %(i+1) for i in range(5)]
+
+
+########################################################################
+class VtOrderBook(object):
+    """增量订单簿"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, depth=5):
+        """Constructor"""
+        self.depth = depth                  # 盘口档位数量（即推送到tick中的档数）
+
+        self.bidPrices = array('d')         # 买盘价格（取负数，升序）
+        self.bidVolumes = array('d')        # 买盘数量
+        self.askPrices = array('d')         # 卖盘价格（升序）
+        self.askVolumes = array('d')        # 卖盘数量
+
+        self.topChanged = False             # 盘口是否发生了变化
+
+    #----------------------------------------------------------------------
+    def updateLevel(self, prices, volumes, key, volume):
+        """更新某一边的某个价格档位，volume为0时删除该档位"""
+        i = bisect_left(prices, key)
+
+        # 价格档位已存在
+        if i < len(prices) and prices[i] == key:
+            if volume:
+                if volumes[i] == volume:
+                    return
+                volumes[i] = volume
+            else:
+                del prices[i]
+                del volumes[i]
+        # 新的价格档位
+        elif volume:
+            prices.insert(i, key)
+            volumes.insert(i, volume)
+        else:
+            return
+
+        # 只有前depth档的变化会影响盘口
+        if i < self.depth:
+            self.topChanged = True
+
+    #----------------------------------------------------------------------
+    def addLevel(self, prices, volumes, key, delta):
+        """在某一边的某个价格档位上增减数量，数量减到0时删除该档位"""
+        i = bisect_left(prices, key)
+
+        if i < len(prices) and prices[i] == key:
+            volume = volumes[i] + delta
+            if volume > 0:
+                volumes[i] = volume
+            else:
+                del prices[i]
+                del volumes[i]
+        elif delta > 0:
+            prices.insert(i, key)
+            volumes.insert(i, delta)
+        else:
+            return
+
+        if i < self.depth:
+            self.topChanged = True
+
+    #----------------------------------------------------------------------
+    def addBid(self, price, delta):
+        """增减买盘档位数量"""
+        self.addLevel(self.bidPrices, self.bidVolumes, -price, delta)
+
+    #----------------------------------------------------------------------
+    def addAsk(self, price, delta):
+        """增减卖盘档位数量"""
+        self.addLevel(self.askPrices, self.askVolumes, price, delta)
+
+    #----------------------------------------------------------------------
+    def getBidVolume(self, price):
+        """查询买盘某个价格的数量"""
+        i = bisect_left(self.bidPrices, -price)
+        if i < len(self.bidPrices) and self.bidPrices[i] == -price:
+            return self.bidVolumes[i]
+        return 0
+
+    #----------------------------------------------------------------------
+    def getAskVolume(self, price):
+        """查询卖盘某个价格的数量"""
+        i = bisect_left(self.askPrices, price)
+        if i < len(self.askPrices) and self.askPrices[i] == price:
+            return self.askVolumes[i]
+        return 0
+
+    #----------------------------------------------------------------------
+    def updateBid(self, price, volume):
+        """更新买盘档位"""
+        self.updateLevel(self.bidPrices, self.bidVolumes, -price, volume)
+
+    #----------------------------------------------------------------------
+    def updateAsk(self, price, volume):
+        """更新卖盘档位"""
+        self.updateLevel(self.askPrices, self.askVolumes, price, volume)
+
+    #----------------------------------------------------------------------
+    def deleteBid(self, price):
+        """删除买盘档位"""
+        self.updateLevel(self.bidPrices, self.bidVolumes, -price, 0)
+
+    #----------------------------------------------------------------------
+    def deleteAsk(self, price):
+        """删除卖盘档位"""
+        self.updateLevel(self.askPrices, self.askVolumes, price, 0)
+
+    #----------------------------------------------------------------------
+    def getBid(self, level):
+        """获取某一档买盘的价格和数量，level从0开始"""
+        return -self.bidPrices[level], self.bidVolumes[level]
+
+    #----------------------------------------------------------------------
+    def getAsk(self, level):
+        """获取某一档卖盘的价格和数量，level从0开始"""
+        return self.askPrices[level], self.askVolumes[level]
+
+    #----------------------------------------------------------------------
+    def getBidCount(self):
+        """买盘档位数量"""
+        return len(self.bidPrices)
+
+    #----------------------------------------------------------------------
+    def getAskCount(self):
+        """卖盘档位数量"""
+        return len(self.askPrices)
+
+    #----------------------------------------------------------------------
+    def getTopBids(self, n=None):
+        """获取前n档买盘的(价格, 数量)列表"""
+        n = n or self.depth
+        return [(-p, v) for p, v in zip(self.bidPrices[:n], self.bidVolumes[:n])]
+
+    #----------------------------------------------------------------------
+    def getTopAsks(self, n=None):
+        """获取前n档卖盘的(价格, 数量)列表"""
+        n = n or self.depth
+        return zip(self.askPrices[:n], self.askVolumes[:n])
+
+    #----------------------------------------------------------------------
+    def clear(self):
+        """清空订单簿"""
+        if self.bidPrices or self.askPrices:
+            self.topChanged = True
+
+        self.bidPrices = array('d')
+        self.bidVolumes = array('d')
+        self.askPrices = array('d')
+        self.askVolumes = array('d')
+
+    #----------------------------------------------------------------------
+    def setSnapshot(self, bids, asks):
+        """用全量快照替换订单簿，bids和asks为(价格, 数量)的序列，顺序不限"""
+        bids = sorted((-float(p), float(v)) for p, v in bids if float(v))
+        asks = sorted((float(p), float(v)) for p, v in asks if float(v))
+
+        bidPrices = array('d', [p for p, v in bids])
+        bidVolumes = array('d', [v for p, v in bids])
+        askPrices = array('d', [p for p, v in asks])
+        askVolumes = array('d', [v for p, v in asks])
+
+        # 比较前depth档判断盘口是否变化
+        n = self.depth
+        if (bidPrices[:n] != self.bidPrices[:n] or bidVolumes[:n] != self.bidVolumes[:n] or
+            askPrices[:n] != self.askPrices[:n] or askVolumes[:n] != self.askVolumes[:n]):
+            self.topChanged = True
+
+        self.bidPrices = bidPrices
+        self.bidVolumes = bidVolumes
+        self.askPrices = askPrices
+        self.askVolumes = askVolumes
+
+    #----------------------------------------------------------------------
+    def checkTopChanged(self):
+        """检查自上次调用以来盘口是否变化，并重置标记"""
+        changed = self.topChanged
+        self.topChanged = False
+        return changed
+
+    #----------------------------------------------------------------------
+    def fillTick(self, tick):
+        """将前5档盘口写入VtTickData对象"""
+        d = tick.__dict__
+
+        bidCount = len(self.bidPrices)
+        for i in range(5):
+            if i < bidCount:
+                d[BID_PRICE_FIELDS[i]] = -self.bidPrices[i]
+                d[BID_VOLUME_FIELDS[i]] = self.bidVolumes[i]
+            else:
+                d[BID_PRICE_FIELDS[i]] = EMPTY_FLOAT
+                d[BID_VOLUME_FIELDS[i]] = EMPTY_INT
+
+        askCount = len(self.askPrices)
+        for i in range(5):
+            if i < askCount:
+                d[ASK_PRICE_FIELDS[i]] = self.askPrices[i]
+                d[ASK_VOLUME_FIELDS[i]] = self.askVolumes[i]
+            else:
+                d[ASK_PRICE_FIELDS[i]] = EMPTY_FLOAT
+                d[ASK_VOLUME_FIELDS[i]] = EMPTY_INT
@@ -31,19 +31,35 @@ class VtServer(RpcServer):
         self.register(self.engine.subscribe)
         self.register(self.engine.sendOrder)
         self.register(self.engine.cancelOrder)
+        self.register(self.engine.sendOrders)
+        self.register(self.engine.cancelOrders)
         self.register(self.engine.qryAccount)
         self.register(self.engine.qryPosition)
         self.register(self.engine.exit)
         self.register(self.engine.writeLog)
         self.register(self.engine.dbConnect)
         self.register(self.engine.dbInsert)
+        self.register(self.engine.dbInsertMany)
+        self.register(self.engine.dbBulkUpsert)
+        self.register(self.engine.dbCreateIndex)
         self.register(self.engine.dbQuery)
         self.register(self.engine.dbUpdate)
         self.register(self.engine.getContract)
         self.register(self.engine.getAllContracts)
+        self.register(self.engine.getContractsByExchange)
+        self.register(self.engine.getContractsByProductClass)
+        self.register(self.engine.getContractsByUnderlying)
+        self.register(self.engine.getContractsByGateway)
         self.register(self.engine.getOrder)
         self.register(self.engine.getAllWorkingOrders)
+        self.register(self.engine.getWorkingOrderCount)
+        self.register(self.engine.getWorkingOrdersBySymbol)
+        self.register(self.engine.getWorkingOrderCountBySymbol)
+        self.register(self.engine.getWorkingOrdersByGateway)
+        self.register(self.engine.getWorkingOrderCountByGateway)
+        self.register(self.engine.getTradedVolume)
         self.register(self.engine.getAllGatewayNames)
+        self.register(self.engine.getCtaProfile)
         
         # 注册事件引擎发送的事件处理监听
         self.engine.eventEngine.registerGeneralHandler(self.eventHandler)
@@ -0,0 +1,154 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了MongoDB中Tick数据的分桶存储格式，以及透明读取分桶数据的适配器。
+
+1. 每个合约每分钟一个文档，datetime为该分钟的开始时间，ticks数组保存该分钟内的Tick，
+   vtSymbol等字符串字段只在文档中保存一次，count和endDatetime用于快速统计数量
+2. 写入时按分钟生成upsert操作，通过$push追加Tick，多次批量写入同一分钟的数据会合并到同一个文档，
+   过滤条件要求count字段存在，避免匹配到时间恰好为整分钟的普通Tick文档
+3. 读取时将datetime的查询条件向前对齐到分钟，同一次查询可以同时取出分桶文档和普通的Tick文档，
+   分桶文档展开为Tick后再按原始条件过滤，因此同一个集合中两种格式的数据可以混合存在
+'''
+
+from collections import OrderedDict
+
+
+# 分桶文档中的字段
+BUCKET_TICKS = 'ticks'
+BUCKET_COUNT = 'count'
+BUCKET_END = 'endDatetime'
+
+# 在分桶文档层面保存的公共字段
+BUCKET_COMMON_FIELDS = ['vtSymbol', 'symbol', 'exchange']
+
+
+#----------------------------------------------------------------------
+def getBucketTime(dt):
+    """获取时间所在分桶（分钟）的开始时间"""
+    return dt.replace(second=0, microsecond=0)
+
+#----------------------------------------------------------------------
+def makeBucketUpdates(l):
+    """将按时间排序的Tick字典列表转换为分桶upsert操作，返回(过滤条件, 更新内容)的列表"""
+    bucketDict = OrderedDict()
+
+    for d in l:
+        bucketTime = getBucketTime(d['datetime'])
+        if bucketTime not in bucketDict:
+            bucketDict[bucketTime] = []
+
+        tick = {k: v for k, v in d.items() if k not in BUCKET_COMMON_FIELDS and k != '_id'}
+        bucketDict[bucketTime].append(tick)
+
+    common = {k: l[0].get(k, '') for k in BUCKET_COMMON_FIELDS} if l else {}
+
+    updates = []
+    for bucketTime, ticks in bucketDict.items():
+        flt = {'datetime': bucketTime, BUCKET_COUNT: {'$exists': True}}
+        update = {
+            '$push': {BUCKET_TICKS: {'$each': ticks}},
+            '$inc': {BUCKET_COUNT: len(ticks)},
+            '$max': {BUCKET_END: ticks[-1]['datetime']},
+            '$setOnInsert': common
+        }
+        updates.append((flt, update))
+
+    return updates
+
+#----------------------------------------------------------------------
+def toBucketFilter(flt):
+    """将Tick的查询条件转换为同时适用于分桶文档的条件（datetime下限向前对齐到分钟）"""
+    cond = flt.get('datetime', None)
+    if not isinstance(cond, dict):
+        return flt
+
+    newCond = dict(cond)
+    for op in ['$gte', '$gt']:
+        if op in newCond:
+            del newCond[op]
+            newCond['$gte'] = getBucketTime(cond[op])
+
+    newFlt = dict(flt)
+    newFlt['datetime'] = newCond
+    return newFlt
+
+#----------------------------------------------------------------------
+def matchDatetime(dt, cond):
+    """检查时间是否满足datetime的查询条件"""
+    if cond is None:
+        return True
+    if not isinstance(cond, dict):
+        return dt == cond
+
+    if '$gte' in cond and dt < cond['$gte']:
+        return False
+    if '$gt' in cond and dt <= cond['$gt']:
+        return False
+    if '$lte' in cond and dt > cond['$lte']:
+        return False
+    if '$lt' in cond and dt >= cond['$lt']:
+        return False
+    return True
+
+#----------------------------------------------------------------------
+def unpackBucket(doc):
+    """将分桶文档展开为Tick字典列表，普通Tick文档直接返回"""
+    if BUCKET_TICKS not in doc:
+        return [doc]
+
+    common = {k: doc.get(k, '') for k in BUCKET_COMMON_FIELDS}
+    l = []
+    for tick in doc[BUCKET_TICKS]:
+        tick.update(common)
+        l.append(tick)
+    return l
+
+#----------------------------------------------------------------------
+def iterTicks(docs, flt):
+    """遍历toBucketFilter条件查询出的文档，生成满足原始条件的Tick字典"""
+    cond = flt.get('datetime', None)
+    for doc in docs:
+        for tick in unpackBucket(doc):
+            if matchDatetime(tick['datetime'], cond):
+                yield tick
+
+
+########################################################################
+class TickBucketCursor(object):
+    """Tick查询指针，兼容分桶和普通两种格式，用法和MongoDB查询指针一致（遍历、count）"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, collection, flt):
+        """Constructor"""
+        self.collection = collection
+        self.flt = flt
+        self.bucketFlt = toBucketFilter(flt)
+
+    #----------------------------------------------------------------------
+    def __iter__(self):
+        """逐条生成Tick字典"""
+        return iterTicks(self.collection.find(self.bucketFlt), self.flt)
+
+    #----------------------------------------------------------------------
+    def count(self):
+        """数据数量，完全落在区间内的分桶直接使用count字段，只有区间首尾的分桶需要展开"""
+        cond = self.flt.get('datetime', None)
+        count = 0
+        partialList = []
+
+        for doc in self.collection.find(self.bucketFlt, {BUCKET_TICKS: 0}):
+            if BUCKET_COUNT not in doc:
+                if matchDatetime(doc['datetime'], cond):
+                    count += 1
+            elif matchDatetime(doc['datetime'], cond) and matchDatetime(doc[BUCKET_END], cond):
+                count += doc[BUCKET_COUNT]
+            else:
+                partialList.append(doc['_id'])
+
+        if partialList:
+            docs = self.collection.find({'_id': {'$in': partialList}})
+            for tick in iterTicks(docs, self.flt):
+                count += 1
+
+        return count
@@ -0,0 +1,269 @@
+# encoding: UTF-8
+
+'''
+本文件中实现了Tick数据的差分压缩编码，供本地存储保存Tick历史数据使用。
+
+1. 编码的对象是(时间微秒数, 字段值...)形式的记录，和本地存储的二进制记录格式一致，
+   价格字段转换为最小价格变动（priceTick）的整数倍，成交量等字段转换为最小数量变动（volumeTick）的整数倍，
+   期货的成交量和持仓量都是整数，volumeTick为1，数字货币等成交量带小数的合约使用更小的volumeTick
+2. 每条记录只保存相对上一条记录发生变化的字段，以及变化量（ZigZag变长整数编码），
+   相邻Tick之间大部分档位不会变化，因此单条记录通常只有几个字节
+3. 每隔keyframeInterval条记录保存一条完整的关键帧，每个文件的第一条记录也总是关键帧，
+   读取时遇到损坏的记录会跳到下一个关键帧继续解码
+4. 每条记录前保存记录长度，统计数量时不需要解码
+
+注意价格按priceTick、成交量按volumeTick取整，只适用于交易所推送的原始Tick数据。
+'''
+
+from math import isinf, isnan
+
+
+# 记录类型
+RECORD_KEYFRAME = 0
+RECORD_DELTA = 1
+
+# 需要按priceTick转换的价格字段
+PRICE_FIELDS = set(['lastPrice', 'upperLimit', 'lowerLimit',
+                    'bidPrice1', 'bidPrice2', 'bidPrice3', 'bidPrice4', 'bidPrice5',
+                    'askPrice1', 'askPrice2', 'askPrice3', 'askPrice4', 'askPrice5'])
+
+# 超过该值的价格视为无效（如CTP接口用DBL_MAX表示的空档位），保存为0
+MAX_VALID_PRICE = 1e12
+
+# 默认关键帧间隔
+DEFAULT_KEYFRAME_INTERVAL = 1000
+
+
+#----------------------------------------------------------------------
+def writeVarint(l, n):
+    """将非负整数以变长编码追加到字节列表l中"""
+    while n >= 0x80:
+        l.append(chr((n & 0x7F) | 0x80))
+        n >>= 7
+    l.append(chr(n))
+
+#----------------------------------------------------------------------
+def readVarint(buf, pos):
+    """从buf的pos位置读取变长编码的整数，返回(整数, 新位置)"""
+    n = 0
+    shift = 0
+    while True:
+        b = ord(buf[pos])
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return n, pos
+        shift += 7
+
+#----------------------------------------------------------------------
+def zigzag(n):
+    """有符号整数转换为无符号整数（0, -1, 1, -2...映射为0, 1, 2, 3...）"""
+    if n >= 0:
+        return n << 1
+    return ((-n) << 1) - 1
+
+#----------------------------------------------------------------------
+def unzigzag(n):
+    """zigzag的逆运算"""
+    if n & 1:
+        return -((n + 1) >> 1)
+    return n >> 1
+
+#----------------------------------------------------------------------
+def getPriceDigits(priceTick):
+    """获取priceTick（或volumeTick）的小数位数，用于解码后消除浮点误差"""
+    s = ('%.10f' %priceTick).rstrip('0')
+    return len(s.split('.')[1])
+
+
+########################################################################
+class TickEncoder(object):
+    """Tick差分编码器，一个合约的数据使用一个编码器按时间顺序编码"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, fields, priceTick, keyframeInterval=DEFAULT_KEYFRAME_INTERVAL, volumeTick=1):
+        """Constructor，fields为记录中时间之后的字段名列表"""
+        self.priceTick = priceTick
+        self.volumeTick = volumeTick
+        self.keyframeInterval = keyframeInterval
+
+        # 每个字段的转换系数，价格为1/priceTick，其他为1/volumeTick
+        self.scaleList = [1.0/priceTick if name in PRICE_FIELDS else 1.0/volumeTick for name in fields]
+
+        self.lastValues = None          # 上一条记录的整数值列表（第一个为时间）
+        self.count = 0                  # 距离上一个关键帧的记录数
+
+    #----------------------------------------------------------------------
+    def reset(self):
+        """重置状态，下一条记录将编码为关键帧"""
+        self.lastValues = None
+        self.count = 0
+
+    #----------------------------------------------------------------------
+    def toValues(self, record):
+        """将记录转换为整数值列表"""
+        values = [record[0]]
+        for v, scale in zip(record[1:], self.scaleList):
+            if isnan(v) or isinf(v) or abs(v) > MAX_VALID_PRICE:
+                v = 0
+            values.append(int(round(v * scale)))
+        return values
+
+    #----------------------------------------------------------------------
+    def encode(self, record):
+        """编码一条记录，返回包含长度前缀的字节串"""
+        values = self.toValues(record)
+        body = []
+
+        if self.lastValues is None or self.count >= self.keyframeInterval:
+            writeVarint(body, RECORD_KEYFRAME)
+            for v in values:
+                writeVarint(body, zigzag(v))
+            self.count = 0
+        else:
+            writeVarint(body, RECORD_DELTA)
+
+            lastValues = self.lastValues
+            writeVarint(body, zigzag(values[0] - lastValues[0]))
+
+            # 变化字段的位掩码，之后依次保存变化量
+            mask = 0
+            deltaList = []
+            for i in xrange(1, len(values)):
+                delta = values[i] - lastValues[i]
+                if delta:
+                    mask |= 1 << (i - 1)
+                    deltaList.append(delta)
+
+            writeVarint(body, mask)
+            for delta in deltaList:
+                writeVarint(body, zigzag(delta))
+
+        self.lastValues = values
+        self.count += 1
+
+        body = ''.join(body)
+        l = []
+        writeVarint(l, len(body))
+        l.append(body)
+        return ''.join(l)
+
+    #----------------------------------------------------------------------
+    def encodeMany(self, l):
+        """编码多条记录，返回字节串"""
+        return ''.join([self.encode(record) for record in l])
+
+
+########################################################################
+class TickDecoder(object):
+    """Tick差分解码器"""
+
+    #----------------------------------------------------------------------
+    def __init__(self, fields, priceTick, volumeTick=1):
+        """Constructor，fields为记录中时间之后的字段名列表"""
+        self.priceTick = priceTick
+        self.digits = getPriceDigits(priceTick)
+        self.volumeTick = volumeTick
+        self.volumeDigits = getPriceDigits(volumeTick)
+        self.priceList = [name in PRICE_FIELDS for name in fields]
+
+        self.lastValues = None          # 上一条记录的整数值列表，为None时等待关键帧
+
+    #----------------------------------------------------------------------
+    def decodeValues(self, body):
+        """解码一条记录的内容，返回整数值列表，等待关键帧时返回None"""
+        flag, pos = readVarint(body, 0)
+
+        if flag == RECORD_KEYFRAME:
+            values = []
+            for i in xrange(len(self.priceList) + 1):
+                n, pos = readVarint(body, pos)
+                values.append(unzigzag(n))
+        elif self.lastValues is None:
+            return None
+        else:
+            values = list(self.lastValues)
+
+            n, pos = readVarint(body, pos)
+            values[0] += unzigzag(n)
+
+            mask, pos = readVarint(body, pos)
+            i = 1
+            while mask:
+                if mask & 1:
+                    n, pos = readVarint(body, pos)
+                    values[i] += unzigzag(n)
+                mask >>= 1
+                i += 1
+
+        self.lastValues = values
+        return values
+
+    #----------------------------------------------------------------------
+    def toRecord(self, values):
+        """将整数值列表转换为(时间微秒数, 字段值...)的元组"""
+        record = [values[0]]
+        priceTick = self.priceTick
+        digits = self.digits
+        volumeTick = self.volumeTick
+        volumeDigits = self.volumeDigits
+        for v, isPrice in zip(values[1:], self.priceList):
+            if isPrice:
+                record.append(round(v * priceTick, digits))
+            else:
+                record.append(round(v * volumeTick, volumeDigits))
+        return tuple(record)
+
+    #----------------------------------------------------------------------
+    def iterRecords(self, buf):
+        """逐条解码字节串，生成(时间微秒数, 字段值...)的元组
+        末尾不完整的记录直接忽略，损坏的记录会跳到下一个关键帧"""
+        self.lastValues = None
+        pos = 0
+        size = len(buf)
+
+        while pos < size:
+            try:
+                length, start = readVarint(buf, pos)
+            except IndexError:
+                break
+
+            end = start + length
+            if end > size:
+                break
+            pos = end
+
+            try:
+                values = self.decodeValues(buf[start:end])
+            except IndexError:
+                self.lastValues = None
+                continue
+
+            if values:
+                yield self.toRecord(values)
+
+
+#----------------------------------------------------------------------
+def scanRecords(buf):
+    """扫描字节串中的完整记录，只读取长度前缀，返回(记录数量, 完整记录的总长度)"""
+    count = 0
+    pos = 0
+    size = len(buf)
+
+    while pos < size:
+        try:
+            length, end = readVarint(buf, pos)
+        except IndexError:
+            break
+        end += length
+        if end > size:
+            break
+        pos = end
+        count += 1
+
+    return count, pos
+
+#----------------------------------------------------------------------
+def countRecords(buf):
+    """统计字节串中完整记录的数量"""
+    return scanRecords(buf)[0]